@@ -3,7 +3,6 @@ import time
 import datetime
 import gevent
 import argparse
-import random
 import shlex
 import traceback
 from collections import defaultdict
@@ -16,8 +15,9 @@ except ImportError:
     from redis.lock import Lock as LuaLock
     
 from .processes import Process, ProcessPool
-from .utils import MovingETA, normalize_command
+from .utils import MovingETA, normalize_command, group_iter
 from .queue import Queue
+from .redishelpers import redis_key
 
 
 class Agent(Process):
@@ -40,7 +40,12 @@ class Agent(Process):
         self.redis_queuestats_lock_key = "%s:queuestatslock" % (self.config["redis_prefix"])
 
         # global HSET redis key used to store queue stats
-        self.redis_queuestats_key= "%s:queuestats" % (self.config["redis_prefix"])
+        self.redis_queuestats_key = redis_key("queuestats")
+
+        self.queue_etas = defaultdict(lambda: MovingETA(5))
+
+        # Fields of the queue stats hash, to remove the queues that disappeared
+        self.queuestats_fields = None
 
     def work(self):
 
@@ -56,9 +61,9 @@ class Agent(Process):
         self.greenlets["manage"] = gevent.spawn(self.greenlet_manage)
         self.greenlets["manage"].start()
 
-        # Disabled for now
-        # self.greenlets["queuestats"] = gevent.spawn(self.greenlet_queuestats)
-        # self.greenlets["queuestats"].start()
+        if self.config.get("queuestats_interval"):
+            self.greenlets["queuestats"] = gevent.spawn(self.greenlet_queuestats)
+            self.greenlets["queuestats"].start()
 
         try:
             self.pool.wait()
@@ -140,25 +145,35 @@ class Agent(Process):
 
     def greenlet_queuestats(self):
 
-        interval = min(self.config["orchestrate_interval"], 1 * 60)
+        interval = self.config["queuestats_interval"]
         lock_timeout = 5 * 60 + (interval * 2)
 
         while True:
             lock = LuaLock(connections.redis, self.redis_queuestats_lock_key,
                            timeout=lock_timeout, thread_local=False, blocking=False)
-            with lock:
-                lock_expires = time.time() + lock_timeout
-                self.queue_etas = defaultdict(lambda: MovingETA(5))
-
-                while True:
-                    self.queuestats()
-
-                    # Because queue stats can be expensive, we try to keep the lock on the same agent
-                    lock_extend = (time.time() + lock_timeout) - lock_expires
-                    lock_expires += lock_extend
-                    lock.extend(lock_extend)
-
-                    time.sleep(interval)
+            if lock.acquire():
+                try:
+                    # ETAs of another agent can't be trusted, we start over
+                    self.queue_etas.clear()
+                    self.queuestats_fields = None
+                    lock_extended = time.time()
+
+                    while True:
+                        self.queuestats()
+
+                        # Because queue stats can be expensive, we try to keep the lock on the same agent
+                        lock.extend(time.time() - lock_extended)
+                        lock_extended = time.time()
+
+                        time.sleep(interval)
+
+                except Exception as e:  # pylint: disable=broad-except
+                    log.error("Queue stats error! %s" % e)
+                    traceback.print_exc()
+                    try:
+                        lock.release()
+                    except Exception:  # pylint: disable=broad-except
+                        pass
 
             time.sleep(interval)
 
@@ -168,33 +183,39 @@ class Agent(Process):
         start_time = time.time()
         log.debug("Starting queue stats...")
 
-        # Fetch all known queues
-        queues = [Queue(q) for q in Queue.all_known()]
+        t = time.time()
 
-        new_queues = {queue.id for queue in queues}
-        old_queues = set(self.queue_etas.keys())
+        # All the counts are fetched with a few pipelines, whatever the number of queues
+        counts = Queue.collect_stats(Queue.all_known(), current_time=t)
 
-        for deleted_queue in old_queues.difference(new_queues):
+        for deleted_queue in set(self.queue_etas).difference(counts):
             self.queue_etas.pop(deleted_queue)
 
-        t = time.time()
         stats = {}
+        for queue_id, (size, cnt) in counts.items():
+            eta = self.queue_etas[queue_id].next(cnt, t=t)
 
-        for queue in queues:
-            cnt = queue.count_jobs_to_dequeue()
-            eta = self.queue_etas[queue.id].next(cnt, t=t)
+            # Number of jobs to dequeue, ETA, Time of stats, Size
+            stats[queue_id] = "%d %s %d %d" % (cnt, eta if eta is not None else "N", int(t), size)
 
-            # Number of jobs to dequeue, ETA, Time of stats
-            stats[queue.id] = "%d %s %d" % (cnt, eta if eta is not None else "N", int(t))
+        if self.queuestats_fields is None:
+            self.queuestats_fields = {
+                f.decode("utf-8") if isinstance(f, bytes) else f
+                for f in connections.redis.hkeys(self.redis_queuestats_key)
+            }
 
-        with connections.redis.pipeline(transaction=True) as pipe:
-            if random.randint(0, 100) == 0 or len(stats) == 0:
-                pipe.delete(self.redis_queuestats_key)
-            if len(stats) > 0:
-                pipe.hmset(self.redis_queuestats_key, stats)
+        deleted_fields = list(self.queuestats_fields.difference(stats))
+
+        with connections.redis.pipeline(transaction=False) as pipe:
+            for fields in group_iter(deleted_fields, n=1000):
+                pipe.hdel(self.redis_queuestats_key, *fields)
+            for fields in group_iter(list(stats), n=1000):
+                pipe.hmset(self.redis_queuestats_key, {f: stats[f] for f in fields})
             pipe.execute()
 
-        log.debug("... done queue stats in %0.4fs" % (time.time() - start_time))
+        self.queuestats_fields = set(stats)
+
+        log.debug("... done queue stats for %s queues in %0.4fs" % (len(stats), time.time() - start_time))
 
     def fetch_worker_group_definition(self):
         definition = connections.mongodb_jobs.mrq_workergroups.find_one({"_id": self.worker_group})
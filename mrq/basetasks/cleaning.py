@@ -1,9 +1,14 @@
 from future.builtins import str
-from mrq.queue import Queue
+from mrq.queue import Queue, QUEUE_REGISTRY_MIN_AGE
 from mrq.task import Task
 from mrq.job import Job
 from mrq.context import log, connections, run_task, get_current_config
+from mrq.redishelpers import redis_key, redis_zrem_if_older
+from mrq.utils import group_iter
+from mrq.blobstore import get_blob_store, is_blob_ref, BLOB_FIELDS, BLOB_REF_KEY
+from bson import ObjectId
 import datetime
+import itertools
 import time
 
 
@@ -83,3 +88,199 @@ class RequeueStartedJobs(Task):
                 stats["requeued"] += 1
 
         return stats
+
+
+class ReindexLostJobs(Task):
+
+    """ Restore job IDs that were popped from the Redis index of a regular queue but never
+        flagged as started in MongoDB, because the worker died in between. """
+
+    max_concurrency = 1
+
+    def run(self, params):
+
+        additional_timeout = params.get("timeout", 300)
+
+        stats = {
+            "checked": 0,
+            "reindexed": 0
+        }
+
+        redis_key_started = redis_key("started_jobs")
+        max_time = int(time.time()) - additional_timeout
+
+        # Only used to unserialize the job IDs stored in Redis
+        serializer = Queue("default")
+
+        redis_job_ids = connections.redis.zrangebyscore(redis_key_started, "-inf", max_time)
+
+        for redis_ids_group in group_iter(redis_job_ids, n=1000):
+
+            job_ids = [
+                ObjectId(x.decode("utf-8") if isinstance(x, bytes) else x)
+                for x in serializer.unserialize_job_ids(redis_ids_group)
+            ]
+
+            for job_data in connections.mongodb_jobs.mrq_jobs.find({
+                "_id": {"$in": job_ids},
+                "status": "queued"
+            }, projection={"_id": 1, "queue": 1}):
+                queue_obj = Queue(job_data["queue"])
+                queue_obj.index_job_ids([job_data["_id"]])
+                queue_obj.notify(1)
+                stats["reindexed"] += 1
+
+            connections.redis.zrem(redis_key_started, *redis_ids_group)
+            stats["checked"] += len(redis_ids_group)
+
+        return stats
+
+
+class CleanOrphanBlobs(Task):
+
+    """ Delete blobs of jobs that don't reference them anymore, usually because they were
+        removed from MongoDB when their dateexpires was reached. Each run checks at most
+        `limit` blobs, starting after the last blob checked by the previous run. """
+
+    max_concurrency = 1
+
+    def run(self, params):
+
+        # Blobs are written before their job is updated, so they must be a bit old to be orphans.
+        additional_timeout = params.get("timeout", 3600)
+        limit = params.get("limit", 100000)
+
+        stats = {
+            "checked": 0,
+            "deleted": 0
+        }
+
+        store = get_blob_store()
+        if store is None:
+            return stats
+
+        created_before = datetime.datetime.utcnow() - datetime.timedelta(seconds=additional_timeout)
+
+        cursor_key = redis_key("orphan_blobs_cursor")
+        after = connections.redis.get(cursor_key)
+        if isinstance(after, bytes):
+            after = after.decode("utf-8")
+
+        last_ref = None
+        for blobs in group_iter(itertools.islice(store.list_blobs(created_before, after=after), limit), n=1000):
+
+            referenced = set()
+            for job_data in connections.mongodb_jobs.mrq_jobs.find({
+                "_id": {"$in": list({job_id for _, job_id in blobs if job_id is not None})}
+            }, projection={field: 1 for field in BLOB_FIELDS}):
+                for field in BLOB_FIELDS:
+                    if is_blob_ref(job_data.get(field)):
+                        referenced.add(job_data[field][BLOB_REF_KEY])
+
+            for ref, _ in blobs:
+                if ref not in referenced:
+                    store.delete(ref)
+                    stats["deleted"] += 1
+
+            stats["checked"] += len(blobs)
+            last_ref = blobs[-1][0]
+
+        # Start again from the first blob once all of them were checked
+        if stats["checked"] < limit:
+            connections.redis.delete(cursor_key)
+        else:
+            connections.redis.set(cursor_key, last_ref)
+
+        return stats
+
+
+class CleanQueueRegistry(Task):
+
+    """ Remove the queues that had no jobs queued recently and are now empty from the registry of
+        known queues. max_age can't be lower than QUEUE_REGISTRY_MIN_AGE.
+        With rebuild=True, first add the queues of all queued jobs in MongoDB. """
+
+    max_concurrency = 1
+
+    def run(self, params):
+
+        max_age = max(params.get("max_age", 7 * 24 * 3600), QUEUE_REGISTRY_MIN_AGE)
+
+        stats = {
+            "added": 0,
+            "checked": 0,
+            "removed": 0
+        }
+
+        registry_key = redis_key("known_queues")
+        registry_lex_key = redis_key("known_queues_lex")
+
+        if params.get("rebuild"):
+            now = time.time()
+            queues = connections.mongodb_jobs.mrq_jobs.distinct("queue", {"status": "queued"})
+            for queues_group in group_iter(queues, n=1000):
+                stats["added"] += connections.redis.zadd(registry_key, **{q: now for q in queues_group})
+                connections.redis.zadd(registry_lex_key, **{q: 0 for q in queues_group})
+
+        max_time = time.time() - max_age
+
+        for queue in connections.redis.zrangebyscore(registry_key, "-inf", max_time):
+            queue = queue.decode("utf-8") if isinstance(queue, bytes) else queue
+            queue_obj = Queue(queue)
+
+            if queue_obj.is_raw:
+                empty = queue_obj.size() == 0
+            else:
+                empty = not connections.mongodb_jobs.mrq_jobs.find_one({
+                    "queue": queue,
+                    "status": {"$in": ["queued", "started"]}
+                }, projection={"_id": 1})
+
+            stats["checked"] += 1
+
+            # The queue may have been used again since we checked its score
+            if empty and redis_zrem_if_older()(keys=[registry_key, registry_lex_key], args=[queue, max_time]):
+                stats["removed"] += 1
+
+        return stats
+
+
+class ReconcileJobCounters(Task):
+
+    """ Rebuild the job counters by path & status and by path & exception from MongoDB. They are
+        updated incrementally but drift when jobs expire or are changed in bulk, e.g. by JobAction. """
+
+    max_concurrency = 1
+
+    def run(self, params):
+
+        collection = connections.mongodb_jobs.mrq_jobs
+
+        by_status = {
+            "%s %s" % (row["_id"]["path"], row["_id"]["status"]): row["jobs"]
+            for row in collection.aggregate([
+                {"$group": {"_id": {"path": "$path", "status": "$status"}, "jobs": {"$sum": 1}}}
+            ], allowDiskUse=True)
+        }
+
+        by_exception = {
+            "%s %s" % (row["_id"]["path"], row["_id"]["exceptiontype"]): row["jobs"]
+            for row in collection.aggregate([
+                {"$match": {"status": "failed"}},
+                {"$group": {"_id": {"path": "$path", "exceptiontype": "$exceptiontype"}, "jobs": {"$sum": 1}}}
+            ], allowDiskUse=True)
+        }
+
+        # Updates made while the aggregations were running are lost, until the next run.
+        with connections.redis.pipeline(transaction=True) as pipe:
+            for name, counters in (("job_counters_status", by_status), ("job_counters_exceptions", by_exception)):
+                pipe.delete(redis_key(name))
+                for fields in group_iter(list(counters), n=1000):
+                    pipe.hmset(redis_key(name), {f: counters[f] for f in fields})
+            pipe.set(redis_key("job_counters_reconciled"), int(time.time()))
+            pipe.execute()
+
+        return {
+            "status": len(by_status),
+            "exceptions": len(by_exception)
+        }
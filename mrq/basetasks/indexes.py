@@ -1,5 +1,6 @@
 from mrq.task import Task
 from mrq.context import connections
+from mrq.queue import Queue
 
 
 class EnsureIndexes(Task):
@@ -35,6 +36,13 @@ class EnsureIndexes(Task):
             [("queue", 1), ("status", 1), ("datequeued", 1), ("_id", 1)], background=True)
         connections.mongodb_jobs.mrq_jobs.ensure_index(
             [("status", 1), ("queue", 1), ("path", 1)], background=True)
+        connections.mongodb_jobs.mrq_jobs.ensure_index(
+            [("group", 1), ("_id", 1)], sparse=True, background=True)
+
+        # Only queues with priorities need this one
+        if any(queue_config.get("priority") for queue_config in Queue.get_queues_config().values()):
+            connections.mongodb_jobs.mrq_jobs.ensure_index(
+                [("queue", 1), ("status", 1), ("priority", -1), ("datequeued", 1), ("_id", 1)], background=True)
 
         connections.mongodb_jobs.mrq_scheduled_jobs.ensure_index(
             [("hash", 1)], unique=True, background=False)
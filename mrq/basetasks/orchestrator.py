@@ -2,6 +2,7 @@ from future.builtins import str
 from mrq.queue import Queue
 from mrq.task import Task
 from mrq.job import Job
+from mrq.redishelpers import redis_key
 from mrq.context import log, connections, run_task, get_current_config, subpool_map
 from collections import defaultdict
 import math
@@ -67,7 +68,7 @@ class Orchestrate(Task):
 
     def redis_queuestats_key(self):
         """ Returns the global HSET redis key used to store queue stats """
-        return "%s:queuestats" % (get_current_config()["redis_prefix"])
+        return redis_key("queuestats")
 
     def get_desired_workers_for_agent(self, group, agent):
         return group.get("commands", [])
@@ -5,7 +5,8 @@ from mrq.task import Task
 from mrq.queue import Queue
 from bson import ObjectId
 from mrq.context import connections, get_current_config, get_current_job
-from mrq.job import set_queues_size
+from mrq.job import set_queues_size, pipe_job_counters
+from mrq.unique import release_unique_jobs
 from collections import defaultdict
 from mrq.utils import group_iter
 import datetime
@@ -100,6 +101,20 @@ class JobAction(Task):
                 for job in self.collection.find(query, projection={"queue": 1}):
                     size_by_queues[job["queue"]] += 1
 
+            # Cancelled unique jobs can be queued again
+            unique_query = dict(query)
+            unique_query["unique"] = {"$exists": True}
+            release_unique_jobs(list(self.collection.find(unique_query, projection={"unique": 1})))
+
+            # Transitions for the job counters
+            counts = list(self.collection.aggregate([
+                {"$match": query},
+                {"$group": {
+                    "_id": {"path": "$path", "status": "$status", "exceptiontype": "$exceptiontype"},
+                    "count": {"$sum": 1}
+                }}
+            ]))
+
             ret = self.collection.update(query, {"$set": {
                 "status": "cancel",
                 "dateexpires": now + datetime.timedelta(seconds=result_ttl),
@@ -112,6 +127,14 @@ class JobAction(Task):
                     size_by_queues[query["queue"]] = ret["n"]
             set_queues_size(size_by_queues, action="decr")
 
+            with connections.redis.pipeline(transaction=False) as pipe:
+                for count in counts:
+                    pipe_job_counters(
+                        pipe, count["_id"].get("path"), count["_id"].get("status"), "cancel",
+                        count=count["count"], old_exceptiontype=count["_id"].get("exceptiontype")
+                    )
+                pipe.execute()
+
             # Special case when emptying just by queue name: empty it directly!
             # In this case we could also loose some jobs that were queued after
             # the MongoDB update. They will be "lost" and requeued later like the other case
@@ -127,13 +150,15 @@ class JobAction(Task):
             if not status_query:
                 query["status"] = {"$ne": "queued"}
 
-            cursor = self.collection.find(query, projection=["_id", "queue"])
+            cursor = self.collection.find(query, projection=["_id", "queue", "path", "status", "exceptiontype"])
 
             for jobs in group_iter(cursor, n=1000):
 
                 jobs_by_queue = defaultdict(list)
+                transitions = defaultdict(int)
                 for job in jobs:
                     jobs_by_queue[job["queue"]].append(job["_id"])
+                    transitions[(job.get("path"), job.get("status"), job.get("exceptiontype"))] += 1
                     stats["requeued"] += 1
 
                 for queue in jobs_by_queue:
@@ -153,6 +178,15 @@ class JobAction(Task):
                         "_id": {"$in": jobs_by_queue[queue]}
                     }, {"$set": updates}, multi=True)
 
+                    queue_obj = Queue(updates.get("queue", queue))
+                    queue_obj.index_job_ids(jobs_by_queue[queue])
+                    queue_obj.notify(len(jobs_by_queue[queue]))
+
                 set_queues_size({queue: len(jobs) for queue, jobs in jobs_by_queue.items()})
 
+                with connections.redis.pipeline(transaction=False) as pipe:
+                    for (path, status, exceptiontype), count in transitions.items():
+                        pipe_job_counters(pipe, path, status, "queued", count=count, old_exceptiontype=exceptiontype)
+                    pipe.execute()
+
         return stats
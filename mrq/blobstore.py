@@ -0,0 +1,212 @@
+from future.builtins import str, object
+from future.utils import with_metaclass
+import abc
+import os
+import re
+import datetime
+from bson import Binary, ObjectId
+from . import context
+from .encoding import encode, decode, is_encoded, BINARY_SUBTYPE
+from .utils import load_class_by_path
+
+# Key of the reference left in the job document instead of the offloaded value
+BLOB_REF_KEY = "mrq_blob"
+
+# Job fields that can be offloaded
+BLOB_FIELDS = ("params", "result", "traceback")
+
+# Names of the files written by FileBlobStore: "<job_id>-<blob_id>"
+FILE_BLOB_REF_RE = re.compile(r"^[0-9a-f]{24}-[0-9a-f]{24}$")
+
+_blob_stores = {}
+
+
+class BlobStore(with_metaclass(abc.ABCMeta, object)):
+
+    """ Stores large job fields out of the mrq_jobs collection.
+        Blobs are immutable bytes identified by a string reference. """
+
+    def __init__(self, url):
+        self.url = url
+
+    @abc.abstractmethod
+    def put(self, data, job_id):
+        """ Stores data for a job and returns its reference """
+
+    @abc.abstractmethod
+    def open(self, ref):
+        """ Returns a file-like object to read a blob """
+
+    @abc.abstractmethod
+    def delete(self, ref):
+        """ Deletes a blob. Missing blobs are ignored. """
+
+    @abc.abstractmethod
+    def list_blobs(self, created_before, after=None):
+        """ Yields (ref, job_id) for all blobs created before a UTC datetime, sorted by ref.
+            With after, only the blobs with a greater ref are listed. """
+
+    def get(self, ref):
+        f = self.open(ref)
+        try:
+            return f.read()
+        finally:
+            f.close()
+
+    def iter_chunks(self, ref, chunk_size=1024 * 1024):
+        """ Yields the bytes of a blob without reading it all in memory """
+        f = self.open(ref)
+        try:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+
+class GridFSBlobStore(BlobStore):
+
+    """ Stores blobs in GridFS, in the MongoDB database of jobs. Use "gridfs" or "gridfs://<collection>". """
+
+    def __init__(self, url):
+        BlobStore.__init__(self, url)
+        self.collection_name = url[len("gridfs://"):] if url.startswith("gridfs://") else "mrq_blobs"
+
+    @property
+    def fs(self):
+        import gridfs
+        return gridfs.GridFS(context.connections.mongodb_jobs, collection=self.collection_name)
+
+    def put(self, data, job_id):
+        return str(self.fs.put(data, job=job_id))
+
+    def open(self, ref):
+        return self.fs.get(ObjectId(ref))
+
+    def delete(self, ref):
+        self.fs.delete(ObjectId(ref))
+
+    def list_blobs(self, created_before, after=None):
+        files = context.connections.mongodb_jobs["%s.files" % self.collection_name]
+        query = {"uploadDate": {"$lt": created_before}}
+        if after:
+            query["_id"] = {"$gt": ObjectId(after)}
+        for f in files.find(query, projection={"_id": 1, "job": 1}).sort("_id", 1):
+            yield str(f["_id"]), f.get("job")
+
+
+class FileBlobStore(BlobStore):
+
+    """ Stores blobs as files in a local or shared directory. Use "file:///path/to/dir". """
+
+    def __init__(self, url):
+        BlobStore.__init__(self, url)
+        self.directory = url[len("file://"):]
+
+    def put(self, data, job_id):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        ref = "%s-%s" % (job_id, ObjectId())
+        path = os.path.join(self.directory, ref)
+
+        # Readers must never see a partial file
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.rename(path + ".tmp", path)
+
+        return ref
+
+    def open(self, ref):
+        return open(os.path.join(self.directory, os.path.basename(ref)), "rb")
+
+    def delete(self, ref):
+        try:
+            os.remove(os.path.join(self.directory, os.path.basename(ref)))
+        except OSError:
+            pass
+
+    def list_blobs(self, created_before, after=None):
+        if not os.path.isdir(self.directory):
+            return
+
+        max_mtime = (created_before - datetime.datetime(1970, 1, 1)).total_seconds()
+        for ref in sorted(os.listdir(self.directory)):
+            if after and ref <= after:
+                continue
+
+            # Skip partial writes and files that were not written by put()
+            if not FILE_BLOB_REF_RE.match(ref):
+                continue
+
+            if os.path.getmtime(os.path.join(self.directory, ref)) < max_mtime:
+                yield ref, ObjectId(ref.split("-")[0])
+
+
+def get_blob_store():
+    """ Returns the blob store of the current config, or None if disabled """
+
+    url = context.get_current_config().get("blob_store")
+    if not url:
+        return None
+
+    if url not in _blob_stores:
+        if url == "gridfs" or url.startswith("gridfs://"):
+            _blob_stores[url] = GridFSBlobStore(url)
+        elif url.startswith("file://"):
+            _blob_stores[url] = FileBlobStore(url)
+        else:
+            _blob_stores[url] = load_class_by_path(url)(url)
+
+    return _blob_stores[url]
+
+
+def is_blob_ref(value):
+    return isinstance(value, dict) and BLOB_REF_KEY in value
+
+
+def offload(value, field, job_id):
+    """ Returns value, or a reference to it if it was moved to the blob store because of its size """
+
+    store = get_blob_store()
+    if store is None or value is None:
+        return value
+
+    config = context.get_current_config()
+    if field not in [x.strip() for x in config.get("blob_fields", "").split(",")]:
+        return value
+
+    if is_encoded(value):
+        data = bytes(value)
+    else:
+        data = bytes(encode(value, "bson"))
+
+    if len(data) < config.get("blob_threshold"):
+        return value
+
+    return {
+        BLOB_REF_KEY: store.put(data, job_id),
+        "size": len(data)
+    }
+
+
+def load(value):
+    """ Reads back a value from its blob reference. Other values are returned unchanged. """
+
+    if not is_blob_ref(value):
+        return value
+
+    return decode(Binary(get_blob_store().get(value[BLOB_REF_KEY]), BINARY_SUBTYPE))
+
+
+def load_job_data(job_data, fields=BLOB_FIELDS):
+    """ Reads back the offloaded fields of a job dict from MongoDB, in place """
+
+    if job_data:
+        for field in fields:
+            if is_blob_ref(job_data.get(field)):
+                job_data[field] = load(job_data[field])
+
+    return job_data
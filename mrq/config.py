@@ -90,6 +90,14 @@ def add_parser_args(parser, config_type):
         default=1000,
         help='Redis max connection pool size')
 
+    parser.add_argument(
+        '--completion_notify_ttl',
+        action='store',
+        type=int,
+        default=60,
+        help='Seconds during which the completion of a job can be seen by Job.wait() & wait_many() through Redis, ' +
+             'without polling MongoDB. 0 to disable. Must be set on both the workers and the waiting processes.')
+
     parser.add_argument(
         '--redis_timeout',
         action='store',
@@ -222,6 +230,28 @@ def add_parser_args(parser, config_type):
         default=False,
         help='Do not use compacted job IDs in Redis. For compatibility with 0.1.x only')
 
+    parser.add_argument(
+        '--blob_store',
+        default="",
+        action='store',
+        type=str,
+        help='Where to store job fields larger than --blob_threshold: "gridfs", "gridfs://<collection>", ' +
+             '"file:///path/to/dir" or the path of a mrq.blobstore.BlobStore subclass. Empty to disable')
+
+    parser.add_argument(
+        '--blob_threshold',
+        default=1024 * 1024,
+        action='store',
+        type=int,
+        help='Size in bytes above which job fields are moved to the blob store')
+
+    parser.add_argument(
+        '--blob_fields',
+        default="result",
+        action='store',
+        type=str,
+        help='Comma-separated job fields that can be moved to the blob store, among params, result and traceback')
+
     # mrq-run-specific arguments
 
     if config_type == "run":
@@ -305,6 +335,14 @@ def add_parser_args(parser, config_type):
             type=float,
             help="How much seconds to wait between orchestration runs.")
 
+        parser.add_argument(
+            '--queuestats_interval',
+            default=60,
+            action="store",
+            type=float,
+            help="How much seconds to wait between 2 updates of the queue stats cache, by one of the agents. " +
+                 "0 to disable.")
+
         parser.add_argument(
             '--report_interval',
             default=10,
@@ -395,6 +433,20 @@ def add_parser_args(parser, config_type):
             type=str,
             help='Filepath of a json dump of the worker status. Disabled if none')
 
+        parser.add_argument(
+            '--report_compact',
+            default=False,
+            action='store_true',
+            help='Cheaper worker reports for workers with many greenlets: only send changed fields, ' +
+                 'the stacks of the oldest jobs and the RSS memory, and save job progress in one bulk write')
+
+        parser.add_argument(
+            '--report_stacks',
+            default=10,
+            action='store',
+            type=int,
+            help='With --report_compact, number of the oldest running jobs whose stacks are reported')
+
         parser.add_argument(
             '--agent_id',
             default="",
@@ -486,13 +538,95 @@ def add_parser_args(parser, config_type):
             help='Max seconds while worker may sleep waiting for a new job. ' +
                  'Can be < 1.')
 
+        parser.add_argument(
+            '--wakeup',
+            default=False,
+            action='store_true',
+            help='Publish a Redis message on each queue when new jobs are queued, so that waiting workers ' +
+                 'wake up immediately. Idle workers poll with an exponential backoff up to max_latency. ' +
+                 'Must be set for both workers and enqueuers')
+
         parser.add_argument(
             '--dequeue_strategy',
             default="sequential",
             type=str,
             action='store',
             help='Strategy for dequeuing multiple queues. Default is \'sequential\',' +
-                 'to dequeue them in command-line order.')
+                 'to dequeue them in command-line order. \'parallel\' dequeues them in turn, ' +
+                 '\'weighted\' shares the worker slots in proportion to --queue_weights, ' +
+                 '\'burst\' stops the worker when queues are empty.')
+
+        parser.add_argument(
+            '--queue_weights',
+            default="",
+            type=str,
+            action='store',
+            help='Weights of queues for the weighted dequeue strategy, e.g. "high:5,default:1". ' +
+                 'Unlisted queues have a weight of 1.')
+
+        parser.add_argument(
+            '--queue_weights_aging',
+            default=0,
+            type=float,
+            action='store',
+            help='With the weighted dequeue strategy, the weight of a non-empty queue grows by its ' +
+                 'own value every N seconds it is not dequeued, so that low-weight queues are not ' +
+                 'starved. 0 disables aging.')
+
+        parser.add_argument(
+            '--dequeue_batch',
+            default=False,
+            action='store_true',
+            help='Dequeue regular queues in batches with a bounded number of MongoDB round-trips, ' +
+                 'instead of one round-trip per free greenlet')
+
+        parser.add_argument(
+            '--status_batch_size',
+            default=0,
+            type=int,
+            help='Buffer up to N success/failed job status updates and write them in a single MongoDB ' +
+                 'bulk write. 0 disables the buffer')
+
+        parser.add_argument(
+            '--status_batch_interval',
+            default=0.1,
+            type=float,
+            help='Max seconds a buffered job status update may wait before being written')
+
+        parser.add_argument(
+            '--enqueue_buffer_interval',
+            default=0,
+            type=float,
+            help='Seconds between writes in MongoDB of the jobs queued with queue_jobs_buffered(). ' +
+                 'The worker also starts these jobs directly from Redis. 0 disables the enqueue buffer')
+
+        parser.add_argument(
+            '--metrics',
+            default=False,
+            action='store_true',
+            help='Aggregate job counters and latency histograms in the worker. They are available in the ' +
+                 'Prometheus format on /metrics of the admin port')
+
+        parser.add_argument(
+            '--metrics_statsd',
+            default="",
+            action='store',
+            type=str,
+            help='host:port of a statsd server where the metrics are pushed, with --metrics')
+
+        parser.add_argument(
+            '--metrics_statsd_interval',
+            default=10,
+            action='store',
+            type=float,
+            help='Seconds between pushes of the metrics to statsd')
+
+        parser.add_argument(
+            '--metrics_statsd_prefix',
+            default="mrq",
+            action='store',
+            type=str,
+            help='Prefix of the metric names in statsd')
 
 
 class ArgumentParserIgnoringDefaults(argparse.ArgumentParser):
@@ -160,11 +160,23 @@ def _connections_factory(attr):
                 decode_responses=False,
                 connection_class=connection_class
             )
-            return pyredis.StrictRedis(connection_pool=redis_pool)
+            redis_client = pyredis.StrictRedis(connection_pool=redis_pool)
 
         # Let's just assume we got a StrictRedis-like object!
         else:
-            return config_obj
+            redis_client = config_obj
+
+        # Detect the server version once, to use newer commands when available.
+        try:
+            redis_client.mrq_server_version = versiontuple(redis_client.info()["redis_version"])
+        except Exception as e:  # pylint: disable=broad-except
+            log.debug("%s: Couldn't detect the Redis server version: %s" % (attr, e))
+            try:
+                redis_client.mrq_server_version = (0, )
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        return redis_client
 
     elif attr.startswith("mongodb"):
 
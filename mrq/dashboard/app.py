@@ -5,7 +5,7 @@ from future.utils import iteritems
 from gevent import monkey
 monkey.patch_all()
 
-from flask import Flask, request, render_template
+from flask import Flask, Response, request, render_template, stream_with_context
 
 import time
 import os
@@ -14,6 +14,7 @@ import re
 from bson import ObjectId
 import json
 import argparse
+from collections import defaultdict
 from werkzeug.serving import run_simple
 from future.builtins import str
 
@@ -21,7 +22,9 @@ sys.path.insert(0, os.getcwd())
 
 from mrq.queue import Queue
 from mrq.context import connections, set_current_config, get_current_config
-from mrq.job import queue_job
+from mrq.job import queue_job, get_job_counters
+from mrq.encoding import decode_job_data
+from mrq.blobstore import load_job_data, get_blob_store, is_blob_ref, BLOB_REF_KEY
 from mrq.config import get_config
 
 from mrq.dashboard.utils import jsonify, requires_auth
@@ -41,6 +44,15 @@ app = Flask(
 
 WHITELISTED_MRQ_CONFIG_KEYS = ["dashboard_autolink_repositories"]
 
+# Queue stats cached by the agents are used if they are more recent than this, in seconds
+QUEUESTATS_MAX_AGE = 300
+
+# Datatables stop counting documents after this, unless an exact count is asked
+DATATABLES_MAX_COUNT = 10000
+
+# Heavy fields of jobs, fetched separately when needed
+JOBS_LIST_PROJECTION = {"result": 0, "traceback": 0, "traceback_history": 0}
+
 
 @app.route('/')
 @requires_auth
@@ -53,11 +65,16 @@ def root():
 @app.route('/api/datatables/taskexceptions')
 @requires_auth
 def api_task_exceptions():
-    stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
-        {"$match": {"status": "failed"}},
-        {"$group": {"_id": {"path": "$path", "exceptiontype": "$exceptiontype"},
-                    "jobs": {"$sum": 1}}},
-    ]))
+    counters = get_job_counters("exceptions")
+    if counters is not None:
+        stats = [{"_id": {"path": path, "exceptiontype": exceptiontype}, "jobs": jobs}
+                 for (path, exceptiontype), jobs in iteritems(counters)]
+    else:
+        stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
+            {"$match": {"status": "failed"}},
+            {"$group": {"_id": {"path": "$path", "exceptiontype": "$exceptiontype"},
+                        "jobs": {"$sum": 1}}},
+        ]))
 
     stats.sort(key=lambda x: -x["jobs"])
     start = int(request.args.get("iDisplayStart", 0))
@@ -76,11 +93,18 @@ def api_task_exceptions():
 @app.route('/api/datatables/status')
 @requires_auth
 def api_jobstatuses():
-    stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
-        # https://jira.mongodb.org/browse/SERVER-11447
-        {"$sort": {"status": 1}},
-        {"$group": {"_id": "$status", "jobs": {"$sum": 1}}}
-    ]))
+    counters = get_job_counters("status")
+    if counters is not None:
+        jobs_by_status = defaultdict(int)
+        for (_, status), jobs in iteritems(counters):
+            jobs_by_status[status] += jobs
+        stats = [{"_id": status, "jobs": jobs} for status, jobs in iteritems(jobs_by_status)]
+    else:
+        stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
+            # https://jira.mongodb.org/browse/SERVER-11447
+            {"$sort": {"status": 1}},
+            {"$group": {"_id": "$status", "jobs": {"$sum": 1}}}
+        ]))
 
     stats.sort(key=lambda x: x["_id"])
 
@@ -97,10 +121,17 @@ def api_jobstatuses():
 @app.route('/api/datatables/taskpaths')
 @requires_auth
 def api_taskpaths():
-    stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
-        {"$sort": {"path": 1}},  # https://jira.mongodb.org/browse/SERVER-11447
-        {"$group": {"_id": "$path", "jobs": {"$sum": 1}}}
-    ]))
+    counters = get_job_counters("status")
+    if counters is not None:
+        jobs_by_path = defaultdict(int)
+        for (path, _), jobs in iteritems(counters):
+            jobs_by_path[path] += jobs
+        stats = [{"_id": path, "jobs": jobs} for path, jobs in iteritems(jobs_by_path)]
+    else:
+        stats = list(connections.mongodb_jobs.mrq_jobs.aggregate([
+            {"$sort": {"path": 1}},  # https://jira.mongodb.org/browse/SERVER-11447
+            {"$group": {"_id": "$path", "jobs": {"$sum": 1}}}
+        ]))
 
     stats.sort(key=lambda x: -x["jobs"])
 
@@ -206,18 +237,33 @@ def api_datatables(unit):
 
     collection = None
     sort = None
+    query_with_cursor = None
     skip = int(request.args.get("iDisplayStart", 0))
     limit = int(request.args.get("iDisplayLength", 20))
 
     if unit == "queues":
 
         queues = []
-        for name in Queue.all_known():
+        all_known = Queue.all_known()
+
+        # Sizes cached by the agents, live counts are only fetched for the queues missing there
+        stats = Queue.get_stats(queue_ids=all_known, max_age=QUEUESTATS_MAX_AGE)
+        missing = {name for name in all_known if name not in stats}
+        missing_parents = tuple(name for name in missing if name.endswith("/"))
+        if missing_parents:
+            missing |= {name for name in all_known if name.startswith(missing_parents)}
+        for name, (size, jobs_to_dequeue) in Queue.collect_stats(missing).items():
+            if name not in stats:
+                stats[name] = {"size": size, "jobs_to_dequeue": jobs_to_dequeue, "eta": None}
+
+        for name in all_known:
             queue = Queue(name)
+            queue_stats = stats.get(name) or {"size": 0, "jobs_to_dequeue": 0, "eta": None}
 
             q = {
                 "name": name,
-                "size": queue.size(),  # Redis size
+                "size": queue_stats["size"],  # Redis size
+                "eta": queue_stats["eta"],
                 "is_sorted": queue.is_sorted,
                 "is_timed": queue.is_timed,
                 "is_raw": queue.is_raw,
@@ -239,7 +285,7 @@ def api_datatables(unit):
                     q["graph"] = queue.get_sorted_graph(**q["graph_config"])
 
             if queue.is_timed:
-                q["jobs_to_dequeue"] = queue.count_jobs_to_dequeue()
+                q["jobs_to_dequeue"] = queue_stats["jobs_to_dequeue"]
 
             queues.append(q)
 
@@ -283,9 +329,15 @@ def api_datatables(unit):
 
     elif unit == "jobs":
 
-        fields = None
+        fields = JOBS_LIST_PROJECTION
         query = build_api_datatables_query(request)
-        sort = None  # TODO [("_id", 1)]
+        sort = [("_id", 1)]
+
+        # Keyset pagination: the page starts after the last job of the previous one
+        if request.args.get("after_id"):
+            skip = None
+            after_query = {"_id": {"$gt": ObjectId(request.args["after_id"])}}
+            query_with_cursor = {"$and": [query, after_query]} if "_id" in query else dict(query, **after_query)
 
         # We can't search easily params because we store it as decoded JSON in mongo :(
         # Add a string index?
@@ -295,7 +347,7 @@ def api_datatables(unit):
 
     if collection is not None:
 
-        cursor = collection.find(query, projection=fields)
+        cursor = collection.find(query_with_cursor if query_with_cursor is not None else query, projection=fields)
 
         if sort:
             cursor.sort(sort)
@@ -307,10 +359,17 @@ def api_datatables(unit):
             cursor.limit(limit)
 
         data = {
-            "aaData": list(cursor),
-            "iTotalDisplayRecords": collection.find(query).count()
+            "aaData": [decode_job_data(row) for row in cursor] if unit == "jobs" else list(cursor),
         }
 
+        if request.args.get("exact_count"):
+            data["iTotalDisplayRecords"] = collection.count_documents(query)
+        elif not query:
+            data["iTotalDisplayRecords"] = collection.estimated_document_count()
+        else:
+            data["iTotalDisplayRecords"] = collection.count_documents(query, limit=DATATABLES_MAX_COUNT)
+            data["bCountCapped"] = data["iTotalDisplayRecords"] == DATATABLES_MAX_COUNT
+
     data["sEcho"] = request.args["sEcho"]
 
     return jsonify(data)
@@ -326,8 +385,23 @@ def api_job_result(job_id):
     if not job_data:
         return jsonify({})
 
+    # Offloaded results are streamed from the blob store as they are stored, instead of being
+    # read and decoded in memory.
+    if is_blob_ref(job_data.get("result")):
+        ref = job_data["result"][BLOB_REF_KEY]
+        if request.args.get("download"):
+            return Response(
+                stream_with_context(get_blob_store().iter_chunks(ref)),
+                mimetype="application/octet-stream",
+                headers={"Content-Disposition": "attachment; filename=%s-result" % job_id}
+            )
+        return jsonify({
+            "result": job_data["result"],
+            "download": "api/job/%s/result?download=1" % job_id
+        })
+
     return jsonify({
-        "result": job_data.get("result")
+        "result": decode_job_data(job_data).get("result")
     })
 
 
@@ -342,7 +416,7 @@ def api_job_traceback(job_id):
     if not job_data:
         return jsonify({"traceback": "No exception raised"})
 
-    return jsonify(job_data)
+    return jsonify(load_job_data(job_data))
 
 
 @app.route('/api/jobaction', methods=["POST"])
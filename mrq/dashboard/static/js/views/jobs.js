@@ -22,6 +22,10 @@ define(["jquery", "underscore", "views/generic/datatablepage", "models"],functio
         "params": this.options.params.params||"",
         "id": this.options.params.id||"",
       };
+
+      // Last job ID before each page start, to fetch pages without skip()
+      this.pageCursors = {};
+      this.pageCursorsKey = null;
     },
 
     setOptions:function(options) {
@@ -167,6 +171,10 @@ define(["jquery", "underscore", "views/generic/datatablepage", "models"],functio
           "type": "GET",
           "success": function(data) {
             self.$(".js-jobs-modal .js-jobs-modal-content").html(_.escape(JSON.stringify(data, null, 2)));
+            // Offloaded results are too large to be displayed
+            if (data.download) {
+              self.$(".js-jobs-modal .js-jobs-modal-content").append('<br/><a href="'+data.download+'">Download the result</a>');
+            }
             self.$(".js-jobs-modal h4").html("Job result");
             self.$(".js-jobs-modal").modal({});
           },
@@ -260,6 +268,33 @@ define(["jquery", "underscore", "views/generic/datatablepage", "models"],functio
 
       var datatableConfig = self.getCommonDatatableConfig("jobs");
 
+      var fnServerData = datatableConfig.fnServerData;
+      datatableConfig.fnServerData = function(sSource, aoData, fnCallback) {
+        var start = parseInt(_.findWhere(aoData, {"name": "iDisplayStart"}).value, 10);
+
+        // Cursors are only valid for the query they were fetched with
+        var queryKey = JSON.stringify([
+          self.filters,
+          _.findWhere(aoData, {"name": "iSortCol_0"}),
+          _.findWhere(aoData, {"name": "sSortDir_0"})
+        ]);
+        if (queryKey !== self.pageCursorsKey) {
+          self.pageCursors = {};
+          self.pageCursorsKey = queryKey;
+        }
+
+        if (self.pageCursors[start]) {
+          aoData.push({"name": "after_id", "value": self.pageCursors[start]});
+        }
+
+        fnServerData(sSource, aoData, function(json) {
+          if (json.aaData.length) {
+            self.pageCursors[start + json.aaData.length] = json.aaData[json.aaData.length - 1]["_id"];
+          }
+          fnCallback(json);
+        });
+      };
+
       _.extend(datatableConfig, {
         "aoColumns": [
 
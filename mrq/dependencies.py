@@ -0,0 +1,178 @@
+""" Jobs waiting for other jobs to succeed before they can be dequeued """
+from future.builtins import str
+import datetime
+from collections import defaultdict
+from bson import ObjectId
+from . import context
+from .redishelpers import redis_key, redis_dependency_done
+from .utils import group_iter
+
+# Seconds the dependencies of a job are kept in Redis after their last change. Waiting jobs
+# expire from MongoDB after the same delay, e.g. if a dependency was deleted or never existed.
+DEPENDENCY_TTL = 30 * 24 * 3600
+
+# After these statuses, a dependency won't succeed unless it is requeued: the jobs waiting for it are cancelled
+DEPENDENCY_FAILED_STATUSES = {"failed", "cancel", "abort", "maxretries", "timeout"}
+
+
+def register_dependencies(job_ids, depends_on):
+    """ Records that job_ids wait for the success of all the jobs in depends_on. Must be done before
+        the waiting jobs are inserted, then check_dependencies() after. """
+
+    depends_on = list({str(job_id) for job_id in depends_on})
+
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        for job_id in job_ids:
+            pipe.set(redis_key("job_dependencies", job_id), len(depends_on), ex=DEPENDENCY_TTL)
+        for dependency_id in depends_on:
+            key = redis_key("job_dependents", dependency_id)
+            for job_ids_group in group_iter([str(job_id) for job_id in job_ids], n=1000):
+                pipe.sadd(key, *job_ids_group)
+            pipe.expire(key, DEPENDENCY_TTL)
+        pipe.execute()
+
+
+def check_dependencies(job_ids, depends_on):
+    """ Resolves the dependencies that finished before register_dependencies(), and queues the waiting
+        jobs that were resolved before they were inserted """
+
+    for job_data in context.connections.mongodb_jobs.mrq_jobs.find({
+        "_id": {"$in": [ObjectId(job_id) for job_id in depends_on]},
+        "status": {"$in": ["success"] + list(DEPENDENCY_FAILED_STATUSES)}
+    }, projection={"_id": 1, "status": 1}):
+        if job_data["status"] == "success":
+            resolve_dependents(job_data["_id"])
+        else:
+            cancel_dependents(job_data["_id"])
+
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        for job_id in job_ids:
+            pipe.exists(redis_key("job_dependencies", job_id))
+        waiting = pipe.execute()
+
+    queue_waiting_jobs([job_id for job_id, is_waiting in zip(job_ids, waiting) if not is_waiting])
+
+
+def resolve_dependents(job_id):
+    """ A job succeeded: queues the jobs that were only waiting for it """
+
+    dependents_key = redis_key("job_dependents", job_id)
+    dependent_ids = context.connections.redis.smembers(dependents_key)
+    if not dependent_ids:
+        return
+
+    dependent_ids = [ObjectId(x.decode("utf-8") if isinstance(x, bytes) else x) for x in dependent_ids]
+
+    # Each (dependency, dependent) pair is only counted once, even if this runs concurrently
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        for dependent_id in dependent_ids:
+            redis_dependency_done()(keys=[
+                dependents_key,
+                redis_key("job_dependencies", dependent_id)
+            ], args=[str(dependent_id)], client=pipe)
+        ready = pipe.execute()
+
+    queue_waiting_jobs([dependent_id for dependent_id, is_ready in zip(dependent_ids, ready) if is_ready])
+
+
+def queue_waiting_jobs(job_ids):
+    """ Moves jobs from the waiting status to queued """
+
+    if len(job_ids) == 0:
+        return
+
+    from .queue import Queue
+    from .job import set_queues_size, pipe_job_counters
+
+    collection = context.connections.mongodb_jobs.mrq_jobs
+    now = datetime.datetime.utcnow()
+
+    ids_by_queue = defaultdict(list)
+    for job_id in job_ids:
+        job_data = collection.find_one_and_update({
+            "_id": ObjectId(job_id),
+            "status": "waiting"
+        }, {"$set": {
+            "status": "queued",
+            "datequeued": now,
+            "dateupdated": now
+        }, "$unset": {
+            "dateexpires": 1
+        }}, projection={"_id": 1, "queue": 1, "path": 1})
+
+        # Cancelled in the meantime, or already queued by a concurrent call
+        if job_data is None:
+            continue
+
+        ids_by_queue[(job_data["queue"], job_data["path"])].append(job_data["_id"])
+
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        for (queue, path), ids in ids_by_queue.items():
+            queue_obj = Queue(queue)
+            queue_obj.index_job_ids(ids, pipe=pipe)
+            queue_obj.notify(len(ids), pipe=pipe)
+            set_queues_size({queue: len(ids)}, pipe=pipe)
+            pipe_job_counters(pipe, path, "waiting", "queued", count=len(ids))
+        pipe.execute()
+
+
+def cancel_dependents(job_id):
+    """ A job reached one of DEPENDENCY_FAILED_STATUSES: cancels the jobs waiting for it, then the jobs
+        waiting for those """
+
+    from .job import pipe_job_counters
+    from .group import job_done as group_job_done
+    from .unique import release_unique_jobs
+
+    collection = context.connections.mongodb_jobs.mrq_jobs
+    config = context.get_current_config()
+    now = datetime.datetime.utcnow()
+    dateexpires = now + datetime.timedelta(seconds=config["default_job_cancel_ttl"])
+    notify_ttl = config.get("completion_notify_ttl")
+
+    job_ids = [job_id]
+    while len(job_ids) > 0:
+
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for dependency_id in job_ids:
+                pipe.smembers(redis_key("job_dependents", dependency_id))
+                pipe.delete(redis_key("job_dependents", dependency_id))
+            results = pipe.execute()
+
+        dependent_ids = {
+            ObjectId(x.decode("utf-8") if isinstance(x, bytes) else x)
+            for members in results[0::2] for x in members
+        }
+
+        cancelled = []
+        for dependent_id in dependent_ids:
+            job_data = collection.find_one_and_update({
+                "_id": dependent_id,
+                "status": "waiting"
+            }, {"$set": {
+                "status": "cancel",
+                "dateupdated": now,
+                "dateexpires": dateexpires
+            }}, projection={"_id": 1, "path": 1, "group": 1, "unique": 1})
+
+            # Already cancelled, or queued before the dependency was requeued
+            if job_data is not None:
+                cancelled.append(job_data)
+
+        release_unique_jobs(cancelled)
+
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for job_data in cancelled:
+                pipe.delete(redis_key("job_dependencies", job_data["_id"]))
+                pipe_job_counters(pipe, job_data["path"], "waiting", "cancel")
+                if notify_ttl:
+                    notify_key = redis_key("job_done", job_data["_id"])
+                    pipe.rpush(notify_key, "cancel")
+                    pipe.expire(notify_key, int(notify_ttl))
+            pipe.execute()
+
+        for job_data in cancelled:
+            if job_data.get("group"):
+                group_job_done(job_data["group"], job_data["_id"], "cancel")
+
+        job_ids = [job_data["_id"] for job_data in cancelled]
@@ -0,0 +1,90 @@
+import zlib
+from bson import BSON, Binary
+
+# BSON binary subtype of encoded values. Subtypes 128-255 are user-defined.
+BINARY_SUBTYPE = 128
+
+
+def _bson_dumps(value):
+    return BSON.encode({"v": value})
+
+
+def _bson_loads(data):
+    return BSON(data).decode()["v"]
+
+
+def _msgpack_dumps(value):
+    import msgpack
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data):
+    import msgpack
+    return msgpack.unpackb(data, raw=False)
+
+
+def _zstd_compress(data):
+    import zstandard
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _zstd_decompress(data):
+    import zstandard
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _identity(data):
+    return data
+
+
+# name => (serialize, compress, decompress, unserialize)
+# BSON keeps datetimes & ObjectIds, msgpack is more compact but only supports JSON-like values.
+ENCODINGS = {
+    "bson": (_bson_dumps, _identity, _identity, _bson_loads),
+    "zlib": (_bson_dumps, zlib.compress, zlib.decompress, _bson_loads),
+    "zstd": (_bson_dumps, _zstd_compress, _zstd_decompress, _bson_loads),
+    "msgpack": (_msgpack_dumps, _identity, _identity, _msgpack_loads),
+    "msgpack_zlib": (_msgpack_dumps, zlib.compress, zlib.decompress, _msgpack_loads),
+    "msgpack_zstd": (_msgpack_dumps, _zstd_compress, _zstd_decompress, _msgpack_loads)
+}
+
+
+def encode(value, encoding):
+    """ Encodes a job param or result as a compact BSON binary. Returns value unchanged if encoding is None. """
+
+    if not encoding or value is None:
+        return value
+
+    if encoding not in ENCODINGS:
+        raise Exception("Unknown encoding %s. Available: %s" % (encoding, ", ".join(sorted(ENCODINGS))))
+
+    serialize, compress, _, _ = ENCODINGS[encoding]
+
+    return Binary(encoding.encode("ascii") + b":" + compress(serialize(value)), BINARY_SUBTYPE)
+
+
+def is_encoded(value):
+    return isinstance(value, Binary) and value.subtype == BINARY_SUBTYPE
+
+
+def decode(value):
+    """ Decodes a value stored by encode(). Other values are returned unchanged. """
+
+    if not is_encoded(value):
+        return value
+
+    encoding, data = bytes(value).split(b":", 1)
+    _, _, decompress, unserialize = ENCODINGS[encoding.decode("ascii")]
+
+    return unserialize(decompress(data))
+
+
+def decode_job_data(job_data):
+    """ Decodes params and result of a job dict from MongoDB, in place """
+
+    if job_data:
+        for field in ("params", "result"):
+            if is_encoded(job_data.get(field)):
+                job_data[field] = decode(job_data[field])
+
+    return job_data
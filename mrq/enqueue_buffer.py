@@ -0,0 +1,192 @@
+""" Jobs queued in Redis first and written in MongoDB later by the workers """
+import datetime
+import time
+from collections import defaultdict
+from bson import BSON, ObjectId
+from pymongo.errors import BulkWriteError
+from . import context
+from .redishelpers import redis_key, redis_lpopsafe
+
+# Seconds after which jobs popped from the buffer but not written in MongoDB are written again,
+# in case the worker that popped them crashed.
+ENQUEUE_BUFFER_RECOVERY_DELAY = 300
+
+
+def queue_jobs_buffered(main_task_path, params_list, queue=None, priority=None):
+    """ Queues jobs with a single Redis round-trip and returns their IDs right away.
+        They are written in MongoDB by workers with --enqueue_buffer_interval, which may also start
+        them directly. """
+
+    if len(params_list) == 0:
+        return []
+
+    task_def = context.get_current_config().get("tasks", {}).get(main_task_path) or {}
+    if queue is None:
+        queue = task_def.get("queue", "default")
+
+    from .queue import Queue
+    from .job import set_queues_size
+    queue_obj = Queue(queue)
+
+    if queue_obj.is_raw:
+        raise Exception("Can't queue regular jobs on a raw queue")
+
+    if priority is None and queue_obj.use_priority():
+        priority = task_def.get("priority", 0)
+
+    jobs_data = [{
+        "_id": ObjectId(),
+        "path": main_task_path,
+        "params": params,
+        "queue": queue,
+        "datequeued": datetime.datetime.utcnow(),
+        "status": "queued"
+    } for params in params_list]
+
+    if priority is not None:
+        for job_data in jobs_data:
+            job_data["priority"] = priority
+
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        pipe.rpush(redis_key("enqueue_buffer", queue), *[BSON.encode(job_data) for job_data in jobs_data])
+        pipe.sadd(redis_key("enqueue_buffer_queues"), queue)
+        queue_obj.notify(len(jobs_data), pipe=pipe)
+        set_queues_size({queue: len(jobs_data)}, pipe=pipe)
+        pipe.execute()
+
+    context.metric("jobs.status.queued", len(jobs_data))
+
+    return [job_data["_id"] for job_data in jobs_data]
+
+
+def queue_job_buffered(main_task_path, params, **kwargs):
+    """ Queues one job through the buffer """
+
+    return queue_jobs_buffered(main_task_path, [params], **kwargs)[0]
+
+
+def pop_buffered_jobs(queue, max_jobs):
+    """ Pops jobs from the buffer of a queue. Their data stays in a zset until unlock_buffered_jobs() """
+
+    buffered = redis_lpopsafe()(
+        keys=[redis_key("enqueue_buffer", queue), redis_key("enqueue_buffer_started")],
+        args=[max_jobs, int(time.time()), "1"]
+    )
+
+    return buffered, [BSON(raw).decode() for raw in buffered]
+
+
+def unlock_buffered_jobs(buffered):
+    """ The jobs popped from the buffer are now in MongoDB """
+
+    if len(buffered) > 0:
+        context.connections.redis.zrem(redis_key("enqueue_buffer_started"), *buffered)
+
+
+def dequeue_buffered_jobs(queue, max_jobs, job_class=None, worker=None):
+    """ Starts jobs that are still in the buffer, without waiting for them to be written in MongoDB """
+
+    buffered, jobs_data = pop_buffered_jobs(queue, max_jobs)
+    if len(jobs_data) == 0:
+        return []
+
+    if job_class is None:
+        from .job import Job
+        job_class = Job
+
+    for job_data in jobs_data:
+        job_data["status"] = "started"
+        if worker:
+            job_data["worker"] = worker.id
+
+    jobs = job_class.insert(jobs_data, queue=queue, w=1)
+    unlock_buffered_jobs(buffered)
+
+    context.metric("queues.%s.dequeued" % queue, len(jobs))
+    context.metric("queues.all.dequeued", len(jobs))
+    context.metric("jobs.status.started", len(jobs))
+
+    return jobs
+
+
+def persist_buffered_jobs(buffered, jobs_data, recovered=False):
+    """ Writes jobs popped from the buffer in MongoDB and makes them available to all workers.
+        Recovered jobs may already be in MongoDB, e.g. started directly by a worker that crashed
+        before unlocking them: those are left as they are. """
+
+    from .job import Job
+    from .queue import Queue
+
+    buffered_by_id = {job_data["_id"]: raw for raw, job_data in zip(buffered, jobs_data)}
+    failed_ids = set()
+    error = None
+
+    if recovered and len(jobs_data) > 0:
+        existing_ids = {job_data["_id"] for job_data in context.connections.mongodb_jobs.mrq_jobs.find({
+            "_id": {"$in": [job_data["_id"] for job_data in jobs_data]}
+        }, projection={"_id": 1})}
+        jobs_data = [job_data for job_data in jobs_data if job_data["_id"] not in existing_ids]
+
+    if len(jobs_data) > 0:
+        try:
+            Job.insert(jobs_data, w=1, return_jobs=False, ordered=False)
+
+        # Unordered: all the other jobs were inserted
+        except BulkWriteError as e:
+            error = e
+            skipped_ids = set()
+            for write_error in e.details.get("writeErrors", []):
+                job_id = jobs_data[write_error["index"]]["_id"]
+                skipped_ids.add(job_id)
+                # Duplicates were inserted by another worker recovering the same jobs, which indexes them.
+                # Jobs that failed for another reason stay locked, to be recovered later.
+                if write_error.get("code") != 11000:
+                    failed_ids.add(job_id)
+            jobs_data = [job_data for job_data in jobs_data if job_data["_id"] not in skipped_ids]
+
+    ids_by_queue = defaultdict(list)
+    for job_data in jobs_data:
+        ids_by_queue[job_data["queue"]].append(job_data["_id"])
+
+    if len(ids_by_queue) > 0:
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for queue, job_ids in ids_by_queue.items():
+                queue_obj = Queue(queue)
+                queue_obj.index_job_ids(job_ids, pipe=pipe)
+                queue_obj.notify(len(job_ids), pipe=pipe)
+            pipe.execute()
+
+    unlock_buffered_jobs([raw for job_id, raw in buffered_by_id.items() if job_id not in failed_ids])
+
+    if failed_ids:
+        raise error
+
+    return len(jobs_data)
+
+
+def flush_enqueue_buffer(batch_size=1000):
+    """ Writes all the buffered jobs in MongoDB, and those that were popped by crashed workers.
+        Returns the number of jobs written. """
+
+    count = 0
+
+    for queue in context.connections.redis.smembers(redis_key("enqueue_buffer_queues")):
+        if isinstance(queue, bytes):
+            queue = queue.decode("utf-8")
+
+        while True:
+            buffered, jobs_data = pop_buffered_jobs(queue, batch_size)
+            count += persist_buffered_jobs(buffered, jobs_data)
+            if len(jobs_data) < batch_size:
+                break
+
+    while True:
+        buffered = context.connections.redis.zrangebyscore(
+            redis_key("enqueue_buffer_started"), "-inf", int(time.time()) - ENQUEUE_BUFFER_RECOVERY_DELAY,
+            start=0, num=batch_size
+        )
+        count += persist_buffered_jobs(buffered, [BSON(raw).decode() for raw in buffered], recovered=True)
+        if len(buffered) < batch_size:
+            break
+
+    return count
@@ -0,0 +1,127 @@
+""" Job groups: a callback task is queued when all the jobs of a group have finished """
+from future.builtins import str
+import json
+from bson import ObjectId
+from . import context
+from .redishelpers import redis_key, redis_group_job_done
+from .encoding import decode_job_data
+from .blobstore import load_job_data
+
+# Statuses after which a job won't run again by itself
+GROUP_DONE_STATUSES = {"success", "failed", "cancel", "abort", "maxretries", "timeout"}
+
+# Seconds a group stays in Redis after its last change
+GROUP_TTL = 7 * 24 * 3600
+
+# Member counted until close_group(), so that the group can't finish while jobs are still being queued
+OPEN_MEMBER = "open"
+
+
+def create_group(callback, callback_params=None, callback_queue=None, callback_results=False, group_id=None):
+    """ Creates a job group and returns its ID. Once the group is closed and all its jobs have finished,
+        the callback task is queued with callback_params plus "group" and "statuses", the count of jobs by
+        final status. With callback_results, "results" also has the results of all jobs, in queuing order. """
+
+    group_id = str(group_id or ObjectId())
+    key = redis_key("group", group_id)
+
+    with context.connections.redis.pipeline(transaction=True) as pipe:
+        pipe.hmset(key, {
+            "remaining": 1,
+            "callback": callback,
+            "callback_params": json.dumps(callback_params or {}),
+            "callback_queue": callback_queue or "",
+            "callback_results": 1 if callback_results else 0
+        })
+        pipe.expire(key, GROUP_TTL)
+        pipe.execute()
+
+    return group_id
+
+
+def add_to_group(group_id, count, pipe):
+    """ Counts new jobs in a group. Must be done before they are queued. """
+
+    key = redis_key("group", group_id)
+    pipe.hincrby(key, "remaining", count)
+    pipe.expire(key, GROUP_TTL)
+
+
+def close_group(group_id):
+    """ Tells that no more jobs will be added to the group. Its callback may be queued right away. """
+
+    job_done(group_id, OPEN_MEMBER, None)
+
+
+def job_done(group_id, job_id, status):
+    """ Counts a job of the group as finished, and queues the callback if it was the last one """
+
+    last = redis_group_job_done()(keys=[
+        redis_key("group", group_id),
+        redis_key("group_done", group_id)
+    ], args=[str(job_id), status or "", GROUP_TTL])
+
+    if last:
+        queue_callback(group_id)
+
+
+def get_group(group_id):
+    """ Returns the state of a group: remaining jobs, count of jobs by final status, and whether its callback
+        was queued. Returns None for unknown or expired groups. """
+
+    data = context.connections.redis.hgetall(redis_key("group", group_id))
+    if not data:
+        return None
+
+    data = {
+        (k.decode("utf-8") if isinstance(k, bytes) else k): (v.decode("utf-8") if isinstance(v, bytes) else v)
+        for k, v in data.items()
+    }
+
+    return {
+        "remaining": max(0, int(data["remaining"])),
+        "statuses": {k[len("status:"):]: int(v) for k, v in data.items() if k.startswith("status:")},
+        "callback": data["callback"],
+        "done": bool(data.get("fired"))
+    }
+
+
+def queue_callback(group_id):
+    from .job import queue_job
+
+    data = context.connections.redis.hgetall(redis_key("group", group_id))
+    data = {
+        (k.decode("utf-8") if isinstance(k, bytes) else k): (v.decode("utf-8") if isinstance(v, bytes) else v)
+        for k, v in data.items()
+    }
+
+    params = json.loads(data["callback_params"])
+    params["group"] = group_id
+    params["statuses"] = get_group(group_id)["statuses"]
+
+    if data.get("callback_results") == "1":
+        params["results"] = [
+            decode_job_data(load_job_data(job_data)).get("result")
+            for job_data in context.connections.mongodb_jobs.mrq_jobs.find(
+                {"group": group_id}, projection={"result": 1}, sort=[("_id", 1)])
+        ]
+
+    context.log.debug("Job group %s finished, queueing %s" % (group_id, data["callback"]))
+
+    return queue_job(data["callback"], params, queue=data.get("callback_queue") or None)
+
+
+def queue_group(main_task_path, params_list, callback, callback_params=None, callback_queue=None,
+                callback_results=False, **kwargs):
+    """ Queues jobs in a new group and returns its ID. See create_group() and queue_jobs(). """
+
+    from .job import queue_jobs
+
+    group_id = create_group(callback, callback_params=callback_params, callback_queue=callback_queue,
+                            callback_results=callback_results)
+    try:
+        queue_jobs(main_task_path, params_list, group=group_id, **kwargs)
+    finally:
+        close_group(group_id)
+
+    return group_id
@@ -1,5 +1,5 @@
 """ Helpers are util functions which use the context """
-from .context import connections, get_current_config
+from .context import connections, get_current_config, get_current_worker
 import time
 
 
@@ -29,6 +29,12 @@ def ratelimit(key, limit, per=1, redis=None):
 
 
 def metric(name, incr=1, **kwargs):
+
+    # Built-in aggregation, with --metrics
+    worker = get_current_worker()
+    if worker is not None and getattr(worker, "metrics", None) is not None:
+        worker.metrics.incr("mrq_events_total", incr, (("name", name), ))
+
     cfg = get_current_config()
     if cfg.get("metric_hook"):
         return cfg.get("metric_hook")(name, incr=incr, **kwargs)
@@ -3,8 +3,11 @@ standard_library.install_aliases()
 from future.builtins import str, object
 import datetime
 from bson import ObjectId
-from redis.exceptions import LockError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 import time
+import math
 from .exceptions import RetryInterrupt, MaxRetriesInterrupt, AbortInterrupt, MaxConcurrencyInterrupt
 from .utils import load_class_by_path, group_iter
 import gevent
@@ -21,11 +24,28 @@ import fnmatch
 import encodings
 import copyreg
 from . import context
+from .redishelpers import redis_semaphore, redis_key
+from .encoding import encode, decode_job_data
+from .blobstore import offload, load_job_data
+from .group import GROUP_DONE_STATUSES, add_to_group, job_done as group_job_done
+from .dependencies import (DEPENDENCY_TTL, DEPENDENCY_FAILED_STATUSES, register_dependencies,
+                           check_dependencies, resolve_dependents, cancel_dependents)
+from .unique import UNIQUE_RELEASE_STATUSES, reserve_unique_jobs, release_unique_jobs, pipe_release_unique
 
 
 FINAL_STATUSES = {"timeout", "abort", "failed", "success", "interrupt", "retry", "maxretries", "maxconcurrency"}
 TRANSIENT_STATUSES = {"cancel", "queued", "started"}
 
+# Job.wait() returns as soon as the job has any other status
+WAITING_STATUSES = ["started", "queued", "waiting"]
+
+# The token set by queues when they claim jobs is only needed until they read them back
+CLAIM_UNSET = {"dequeue_token": 1}
+
+# Default seconds between 2 MongoDB checks in Job.wait() when workers notify completions.
+# They are only needed if a notification was missed.
+WAIT_FALLBACK_INTERVAL = 10
+
 
 class Job(object):
 
@@ -45,6 +65,15 @@ class Job(object):
 
     _current_io = None
 
+    # Number of log lines of this job, for the max_job_lines option of MongoHandler
+    log_lines = 0
+
+    # Seconds spent in the code of the task, once performed
+    run_time = None
+
+    # Last time we renewed our max_concurrency lease
+    concurrency_lease_renewed = 0
+
     # Has this job been inserted in MongoDB yet?
     stored = None
 
@@ -83,8 +112,54 @@ class Job(object):
 
     @property
     def redis_max_concurrency_key(self):
-        """ Returns the global redis key used to control job concurrency """
-        return "%s:c:%s" % (context.get_current_config()["redis_prefix"], self.data["path"])
+        """ Returns the global redis key used to control job concurrency, by path
+            and by value of the task's max_concurrency_key parameter if any """
+        key = "%s:c:%s" % (context.get_current_config()["redis_prefix"], self.data["path"])
+        param = getattr(self.task, "max_concurrency_key", None)
+        if param:
+            key += ":%s" % (self.data["params"].get(param), )
+        return key
+
+    def acquire_concurrency_lease(self):
+        """ Takes a slot in the max_concurrency semaphore of the task. Returns False if they are all taken. """
+
+        key = self.redis_max_concurrency_key
+
+        acquired = redis_semaphore()(
+            keys=[key],
+            args=["acquire", str(self.id), self.task.max_concurrency, self.task.max_concurrency_lease]
+        )
+
+        if self.worker:
+            if acquired:
+                self.concurrency_lease_renewed = time.time()
+                self.worker.concurrency_leases[self.id] = self
+
+            # Let the worker skip this task while all its slots are taken
+            if not getattr(self.task, "max_concurrency_key", None):
+                self.worker.max_concurrency_paths[self.data["path"]] = (key, self.task.max_concurrency)
+
+        return bool(acquired)
+
+    def renew_concurrency_lease(self, pipe=None):
+        """ Extends our slot in the max_concurrency semaphore, before its lease expires """
+
+        self.concurrency_lease_renewed = time.time()
+        redis_semaphore()(
+            keys=[self.redis_max_concurrency_key],
+            args=["renew", str(self.id), self.task.max_concurrency, self.task.max_concurrency_lease],
+            client=pipe
+        )
+
+    def release_concurrency_lease(self):
+        """ Frees our slot in the max_concurrency semaphore """
+
+        if self.worker:
+            self.worker.concurrency_leases.pop(self.id, None)
+        redis_semaphore()(
+            keys=[self.redis_max_concurrency_key],
+            args=["release", str(self.id), self.task.max_concurrency, self.task.max_concurrency_lease]
+        )
 
     def exists(self):
         """ Returns True if a job with the current _id exists in MongoDB. """
@@ -150,7 +225,8 @@ class Job(object):
         ) or {}
 
     def set_data(self, data):
-        self.data = data
+        # Results are only read back from the blob store when asked for, see get_job_result()
+        self.data = decode_job_data(load_job_data(data, fields=("params", )))
         if self.data is None:
             return
 
@@ -166,6 +242,10 @@ class Job(object):
             self.max_retries = task_def.get("max_retries", cfg["default_job_max_retries"])
             self.retry_delay = task_def.get("retry_delay", cfg["default_job_retry_delay"])
 
+    def get_stored_params(self):
+        """ Returns the params of this job as they should be stored in MongoDB """
+        return offload(encode(self.data["params"], get_task_encoding(self.data["path"], "params")), "params", self.id)
+
     def set_progress(self, ratio, save=False):
         self.data["progress"] = ratio
         self.saved = False
@@ -185,8 +265,25 @@ class Job(object):
             self.saved = True
 
     @classmethod
-    def insert(cls, jobs_data, queue=None, statuses_no_storage=None, return_jobs=True, w=None, j=None):
-        """ Insert a job into MongoDB """
+    def save_many(cls, jobs):
+        """ Persists the progress of several jobs in a single bulk write """
+
+        jobs = [job for job in jobs if job and not job.saved and job.data and "progress" in job.data]
+        if len(jobs) == 0:
+            return
+
+        context.connections.mongodb_jobs.mrq_jobs.bulk_write([
+            UpdateOne({"_id": job.id}, {"$set": {"progress": job.data["progress"]}})
+            for job in jobs
+        ], ordered=False)
+
+        for job in jobs:
+            job.saved = True
+
+    @classmethod
+    def insert(cls, jobs_data, queue=None, statuses_no_storage=None, return_jobs=True, w=None, j=None,
+               ordered=True):
+        """ Insert a job into MongoDB. With ordered=False, MongoDB may insert them in any order. """
 
         now = datetime.datetime.utcnow()
         for data in jobs_data:
@@ -198,12 +295,35 @@ class Job(object):
             for data in jobs_data:
                 data["_id"] = ObjectId()  # Give the job a temporary ID
         else:
-            inserted = context.connections.mongodb_jobs.mrq_jobs.insert(
-                jobs_data,
-                manipulate=True,
-                w=w,
-                j=j
-            )
+            # Params are stored in the encoding of their task but stay decoded in the returned jobs
+            decoded_params = {}
+            for i, data in enumerate(jobs_data):
+                if data.get("params") is None:
+                    continue
+                if "_id" not in data:
+                    data["_id"] = ObjectId()
+                params = offload(encode(data["params"], get_task_encoding(data.get("path"), "params")),
+                                 "params", data["_id"])
+                if params is not data["params"]:
+                    decoded_params[i] = data["params"]
+                    data["params"] = params
+
+            try:
+                if ordered:
+                    inserted = context.connections.mongodb_jobs.mrq_jobs.insert(
+                        jobs_data,
+                        manipulate=True,
+                        w=w,
+                        j=j
+                    )
+                else:
+                    inserted = cls._insert_unordered(jobs_data, w=w, j=j)
+
+                incr_job_counters([(data.get("path"), None, data["status"]) for data in jobs_data])
+
+            finally:
+                for i, params in decoded_params.items():
+                    jobs_data[i]["params"] = params
 
         if return_jobs:
             jobs = []
@@ -220,6 +340,25 @@ class Job(object):
         else:
             return inserted
 
+    @classmethod
+    def _insert_unordered(cls, jobs_data, w=None, j=None):
+        """ Inserts jobs in any order. On a BulkWriteError, the jobs that were inserted are still counted. """
+
+        write_concern = {k: v for k, v in (("w", w), ("j", j)) if v is not None}
+        collection = context.connections.mongodb_jobs.mrq_jobs
+        if write_concern:
+            collection = collection.with_options(write_concern=WriteConcern(**write_concern))
+
+        try:
+            return collection.insert_many(jobs_data, ordered=False).inserted_ids
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            incr_job_counters([
+                (data.get("path"), None, data["status"])
+                for i, data in enumerate(jobs_data) if i not in failed
+            ])
+            raise
+
     def _attach_original_exception(self, exc):
         """ Often, a retry will be raised inside an "except" block.
             This Keep track of the first exception for debugging purposes """
@@ -287,31 +426,26 @@ class Job(object):
 
         self.task.is_main_task = True
 
-        if not self.task.max_concurrency:
+        run_start = time.time()
 
-            result = self.task.run_wrapped(self.data["params"])
+        try:
 
-        else:
+            if not self.task.max_concurrency:
 
-            if self.task.max_concurrency > 1:
-                raise NotImplementedError()
+                result = self.task.run_wrapped(self.data["params"])
 
-            lock = None
-            try:
+            else:
 
-                # TODO: implement a semaphore
-                lock = context.connections.redis.lock(self.redis_max_concurrency_key, timeout=self.timeout + 5)
-                if not lock.acquire(blocking=True, blocking_timeout=0):
+                if not self.acquire_concurrency_lease():
                     raise MaxConcurrencyInterrupt()
 
-                result = self.task.run_wrapped(self.data["params"])
-
-            finally:
                 try:
-                    if lock:
-                        lock.release()
-                except LockError:
-                    pass
+                    result = self.task.run_wrapped(self.data["params"])
+                finally:
+                    self.release_concurrency_lease()
+
+        finally:
+            self.run_time = time.time() - run_start
 
         self.save_success(result)
 
@@ -344,8 +478,15 @@ class Job(object):
 
         return result
 
-    def wait(self, poll_interval=1, timeout=None, full_data=False):
-        """ Wait for this job to finish. """
+    def wait(self, poll_interval=None, timeout=None, full_data=False):
+        """ Wait for this job to finish. With --completion_notify_ttl, workers notify us through Redis and
+            MongoDB is only checked every poll_interval seconds in case a notification was missed. """
+
+        notify_ttl = context.get_current_config().get("completion_notify_ttl")
+        if poll_interval is None:
+            poll_interval = WAIT_FALLBACK_INTERVAL if notify_ttl else 1
+
+        notify_key = redis_key("job_done", self.id)
 
         end_time = None
         if timeout:
@@ -355,7 +496,7 @@ class Job(object):
 
             job_data = self.collection.find_one({
                 "_id": ObjectId(self.id),
-                "status": {"$nin": ["started", "queued"]}
+                "status": {"$nin": WAITING_STATUSES}
             }, projection=({
                 "_id": 0,
                 "result": 1,
@@ -363,9 +504,24 @@ class Job(object):
             } if not full_data else None))
 
             if job_data:
-                return job_data
+                return decode_job_data(load_job_data(job_data))
+
+            if notify_ttl:
+                wait_time = poll_interval if end_time is None else min(poll_interval, end_time - time.time())
+
+                # BRPOPLPUSH on the same list leaves the notification for other waiters
+                notified = context.connections.redis.brpoplpush(
+                    notify_key, notify_key, timeout=max(1, int(math.ceil(wait_time))))
+
+                # The job was requeued since this notification
+                if notified is not None and not self.collection.find_one({
+                    "_id": ObjectId(self.id),
+                    "status": {"$nin": WAITING_STATUSES}
+                }, projection={"_id": 1}):
+                    context.connections.redis.delete(notify_key)
+            else:
+                time.sleep(poll_interval)
 
-            time.sleep(poll_interval)
         raise Exception("Waited for job result for %s seconds, timeout." % timeout)
 
     def kill(self, block=False, reason="unknown"):
@@ -389,6 +545,47 @@ class Job(object):
             }
             self._save_status("timeout", updates=updates, exception=False)
 
+    def defer(self):
+        """ Puts this started job back at the end of its queue, without counting a retry.
+            Used when it can't run right now, e.g. because of max_concurrency. """
+
+        from .queue import Queue
+
+        now = datetime.datetime.utcnow()
+        updates = {
+            "status": "queued",
+            "datequeued": now,
+            "dateupdated": now
+        }
+
+        # Jobs that were never stored weren't counted yet
+        counted_status = self.data.get("status") if self.stored is not False else None
+        self.data.update(updates)
+
+        # This job wasn't inserted because "started" is in statuses_no_storage
+        if self.stored is False:
+            updates["queue"] = self.data["queue"]
+            updates["_id"] = self.id
+            updates["params"] = self.get_stored_params()
+            updates["path"] = self.data["path"]
+            self.collection.insert(updates, manipulate=True)
+            self.stored = True
+        else:
+            self.collection.update({"_id": self.id}, {
+                "$set": updates,
+                "$unset": {"worker": 1, "datestarted": 1}
+            })
+
+        # The queue size doesn't change: regular jobs are counted until they end, and raw jobs never.
+        queue_obj = Queue(self.data["queue"])
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            queue_obj.index_job_ids([self.id], pipe=pipe)
+            queue_obj.notify(1, pipe=pipe)
+            pipe_job_counters(pipe, self.data["path"], counted_status, "queued")
+            pipe.execute()
+
+        context.metric("jobs.status.deferred")
+
     def save_retry(self, retry_exc):
 
         # If delay=0, requeue right away, don't go through the "retry" status
@@ -408,6 +605,12 @@ class Job(object):
 
     def _save_traceback_history(self, status, trace, job_exc):
         """ Create traceback history or add a new traceback to history. """
+        self.collection.update({
+            "_id": self.id
+        }, {"$push": {"traceback_history": self._get_traceback_history_entry(status, trace, job_exc)}})
+
+    def _get_traceback_history_entry(self, status, trace, job_exc):
+        """ Returns a new entry for the traceback history """
         failure_date = datetime.datetime.utcnow()
 
         new_history = {
@@ -423,9 +626,7 @@ class Job(object):
         if worker:
             new_history["worker"] = worker.id
         new_history["traceback"] = traces[0]
-        self.collection.update({
-            "_id": self.id
-        }, {"$push": {"traceback_history": new_history}})
+        return new_history
 
     def save_success(self, result=None):
 
@@ -434,7 +635,8 @@ class Job(object):
             "dateexpires": dateexpires
         }
         if result is not None:
-            updates["result"] = result
+            encoding = self.get_task_config().get("result_encoding") or getattr(self.task, "result_encoding", None)
+            updates["result"] = offload(encode(result, encoding), "result", self.id)
         if "progress" in self.data:
             updates["progress"] = 1
 
@@ -502,9 +704,13 @@ class Job(object):
             exc, value = sys.exc_info()[0:2]
             if hasattr(value, "subpool_traceback"):
                 trace = "Exception first caught in a subpool. Traceback:\n%s\n%s" % (value.subpool_traceback, trace)
-            db_updates["traceback"] = trace
+            db_updates["traceback"] = offload(trace, "traceback", self.id)
             db_updates["exceptiontype"] = exc.__name__
 
+        # Transition counted in the job counters. Jobs that were never stored weren't counted yet.
+        counted_status = self.data.get("status") if self.data and self.stored is not False else None
+        counted_exceptiontype = self.data.get("exceptiontype") if self.data else None
+
         if self.data:
             self.data.update(db_updates)
             # get all data before updating them
@@ -521,46 +727,116 @@ class Job(object):
             if j is None:
                 j = getattr(self.task, "status_success_update_j", None)
 
+        # Write-behind mode: the worker will write this update later with many others.
+        # Tasks asking for a specific write concern still get their own write.
+        # Jobs in a group must be written before the group callback reads them.
+        status_buffer = getattr(self.worker, "status_buffer", None)
+        if (status_buffer is not None and self.stored is not False and w is None and j is None and
+                status in status_buffer.statuses and not (self.data or {}).get("group")):
+
+            update = {"$set": db_updates, "$unset": CLAIM_UNSET}
+            if exception:
+                update["$push"] = {"traceback_history": self._get_traceback_history_entry(status, trace, exc)}
+
+            if self.data:
+                self._pipe_status_updates(
+                    status_buffer.pipe, status, db_updates,
+                    current_queue, old_queue, old_status, raw_queue, retry_count,
+                    counted_status=counted_status, counted_exceptiontype=counted_exceptiontype
+                )
+
+            status_buffer.add(self.id, update, succeeded=(status == "success"),
+                              failed=(status in DEPENDENCY_FAILED_STATUSES))
+            return
+
         # This job wasn't inserted because "started" is in statuses_no_storage
         # So we must insert it for the first time instead of updating it.
         if self.stored is False:
             db_updates["queue"] = self.data["queue"]
-            db_updates["params"] = self.data["params"]
+            # Keep the temporary ID, blobs of this job may already reference it
+            db_updates["_id"] = self.id
+            db_updates["params"] = self.get_stored_params()
             db_updates["path"] = self.data["path"]
             self.collection.insert(db_updates, w=w, j=j, manipulate=True)
-            self.id = db_updates["_id"]  # Persistent ID assigned by the server
             self.stored = True
 
         else:
             self.collection.update({
                 "_id": self.id
-            }, {"$set": db_updates}, w=w, j=j, manipulate=False)
+            }, {"$set": db_updates, "$unset": CLAIM_UNSET}, w=w, j=j, manipulate=False)
 
         if exception:
             self._save_traceback_history(status, trace, exc)
 
         if self.data:
             with context.connections.redis.pipeline(transaction=False) as pipe:
-                if status != "started":
-                    # Queue change
-                    if current_queue != old_queue:
-                        pipe.decr("queuesize:%s" % old_queue)
-                        if status == "queued":
-                            pipe.incr("queuesize:%s" % current_queue)
+                self._pipe_status_updates(
+                    pipe, status, db_updates,
+                    current_queue, old_queue, old_status, raw_queue, retry_count,
+                    counted_status=counted_status, counted_exceptiontype=counted_exceptiontype
+                )
+
+                # Does any job wait for this one?
+                is_final = status == "success" or status in DEPENDENCY_FAILED_STATUSES
+                if is_final:
+                    pipe.exists(redis_key("job_dependents", self.id))
+
+                results = pipe.execute()
+                has_dependents = is_final and results[-1]
+
+            if has_dependents:
+                if status == "success":
+                    resolve_dependents(self.id)
+                else:
+                    cancel_dependents(self.id)
+
+            if self.data.get("group") and status in GROUP_DONE_STATUSES:
+                group_job_done(self.data["group"], self.id, status)
+
+    def _pipe_status_updates(self, pipe, status, db_updates, current_queue, old_queue, old_status, raw_queue,
+                             retry_count, counted_status=None, counted_exceptiontype=None):
+        """ Adds the Redis updates following a status change to a pipeline """
+
+        pipe_job_counters(
+            pipe, self.data.get("path"), counted_status, status,
+            old_exceptiontype=counted_exceptiontype, new_exceptiontype=(db_updates or {}).get("exceptiontype")
+        )
 
-                    # Regular queues
-                    elif status == "queued" and old_status != "started":
-                        pipe.incr("queuesize:%s" % current_queue)
+        if status != "started":
+            # Queue change
+            if current_queue != old_queue:
+                pipe.decr("queuesize:%s" % old_queue)
+                if status == "queued":
+                    pipe.incr("queuesize:%s" % current_queue)
 
-                    elif status != "queued" and not raw_queue:
-                        pipe.decr("queuesize:%s" % current_queue)
+            # Regular queues
+            elif status == "queued" and old_status != "started":
+                pipe.incr("queuesize:%s" % current_queue)
 
-                    # Raw queues retries
-                    elif (db_updates or {}).get("retry_count", 0) > retry_count:
-                        pipe.incr("queuesize:%s" % current_queue)
+            elif status != "queued" and not raw_queue:
+                pipe.decr("queuesize:%s" % current_queue)
 
-                    pipe.expire("queuesize:%s" % current_queue, context.get_current_config().get("queue_ttl"))
-                pipe.execute()
+            # Raw queues retries
+            elif (db_updates or {}).get("retry_count", 0) > retry_count:
+                pipe.incr("queuesize:%s" % current_queue)
+
+            pipe.expire("queuesize:%s" % current_queue, context.get_current_config().get("queue_ttl"))
+
+        if status == "queued":
+            from .queue import Queue
+            queue_obj = Queue(current_queue)
+            queue_obj.index_job_ids([self.id], pipe=pipe)
+            queue_obj.notify(1, pipe=pipe)
+
+        if self.data.get("unique") and status in UNIQUE_RELEASE_STATUSES:
+            pipe_release_unique(pipe, self.data["unique"], self.id)
+
+        # Wake up Job.wait() & wait_many(). Only needs to outlive the gap between their MongoDB check and their wait.
+        notify_ttl = context.get_current_config().get("completion_notify_ttl")
+        if notify_ttl and status not in WAITING_STATUSES:
+            notify_key = redis_key("job_done", self.id)
+            pipe.rpush(notify_key, status)
+            pipe.expire(notify_key, int(notify_ttl))
 
     def set_current_io(self, io_data):
 
@@ -654,10 +930,196 @@ class Job(object):
         )
 
 
+# Bulk writes of buffered job status updates are tried that many times, waiting
+# FLUSH_RETRY_DELAY seconds after the first failure and twice as long after each next one.
+FLUSH_ATTEMPTS = 3
+FLUSH_RETRY_DELAY = 0.1
+
+
+class JobStatusBuffer(object):
+    """ Write-behind buffer for the most common job status updates.
+
+        Updates are flushed with a single MongoDB bulk_write and a single Redis pipeline
+        every max_size updates, or every interval seconds from the worker.
+    """
+
+    statuses = ("success", "failed")
+
+    def __init__(self, max_size, interval):
+        self.max_size = max_size
+        self.interval = interval
+        self.collection = context.connections.mongodb_jobs.mrq_jobs
+        self.operations = []
+        self.pipe = None
+        self.reset()
+
+    def reset(self):
+        self.operations = []
+        self.succeeded = []
+        self.failed = []
+        self.pipe = context.connections.redis.pipeline(transaction=False)
+
+    def add(self, job_id, update, succeeded=False, failed=False):
+        """ Adds a MongoDB update for this job. Redis updates should be added to self.pipe before.
+            Jobs that succeeded or failed have their dependents resolved or cancelled after the flush. """
+
+        self.operations.append(UpdateOne({"_id": job_id}, update))
+        if succeeded:
+            self.succeeded.append(job_id)
+        if failed:
+            self.failed.append(job_id)
+
+        if len(self.operations) >= self.max_size:
+            try:
+                self.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                # The updates stay in the buffer for the next flush
+                context.log.error("When flushing job status updates: %s" % e)
+
+    def restore(self, operations, succeeded, failed, pipe):
+        """ Puts back updates that couldn't be written, before those added in the meantime """
+
+        self.operations = operations + self.operations
+        self.succeeded = succeeded + self.succeeded
+        self.failed = failed + self.failed
+        pipe.command_stack.extend(self.pipe.command_stack)
+        pipe.scripts.update(self.pipe.scripts)
+        self.pipe = pipe
+
+    def flush(self):
+        """ Writes all the buffered updates. After FLUSH_ATTEMPTS failures, they are put back in the buffer
+            and the exception is raised. """
+
+        if len(self.operations) == 0:
+            return
+
+        # New updates may be added by other greenlets while we are flushing.
+        operations, succeeded, failed, pipe = self.operations, self.succeeded, self.failed, self.pipe
+        self.reset()
+
+        remaining = operations
+        written = False
+        try:
+            for attempt in range(FLUSH_ATTEMPTS):
+                try:
+                    self.collection.bulk_write(remaining, ordered=False)
+                    written = True
+                    break
+                except BulkWriteError as e:
+                    # Unordered: only the failed operations must be written again
+                    remaining = [remaining[error["index"]] for error in e.details.get("writeErrors", [])] or remaining
+                    error = e
+                except Exception as e:  # pylint: disable=broad-except
+                    error = e
+
+                context.log.error("When flushing %s job status updates (attempt %s): %s" % (
+                    len(remaining), attempt + 1, error))
+                if attempt + 1 < FLUSH_ATTEMPTS:
+                    time.sleep(FLUSH_RETRY_DELAY * 2 ** attempt)
+            else:
+                raise error
+
+        finally:
+            # Also when this greenlet is killed. Redis updates only follow the MongoDB ones,
+            # so none of them were sent yet.
+            if not written:
+                self.restore(remaining, succeeded, failed, pipe)
+
+        # Does any job wait for the ones that succeeded or failed?
+        finished = succeeded + failed
+        for job_id in finished:
+            pipe.exists(redis_key("job_dependents", job_id))
+
+        results = pipe.execute()
+
+        if len(finished) > 0:
+            for i, (job_id, has_dependents) in enumerate(zip(finished, results[-len(finished):])):
+                if not has_dependents:
+                    continue
+                if i < len(succeeded):
+                    resolve_dependents(job_id)
+                else:
+                    cancel_dependents(job_id)
+
+
+def get_task_encoding(path, field):
+    """ Returns the encoding of the params or result of a task in MongoDB, None to store them as regular BSON """
+    task_def = context.get_current_config().get("tasks", {}).get(path) or {}
+    return task_def.get("%s_encoding" % field)
+
+
+def wait_many(job_ids, poll_interval=None, timeout=None, full_data=False):
+    """ Waits for many jobs and yields (job_id, job_data) for each of them as soon as it finishes.
+        Uses the notifications of --completion_notify_ttl like Job.wait(). """
+
+    config = context.get_current_config()
+    notify_ttl = config.get("completion_notify_ttl")
+    if poll_interval is None:
+        poll_interval = WAIT_FALLBACK_INTERVAL if notify_ttl else 1
+
+    collection = context.connections.mongodb_jobs.mrq_jobs
+    projection = {"_id": 1, "result": 1, "status": 1} if not full_data else None
+
+    remaining = {ObjectId(job_id) for job_id in job_ids}
+
+    def find_finished(ids):
+        for ids_group in group_iter(list(ids), n=1000):
+            for job_data in collection.find({
+                "_id": {"$in": ids_group},
+                "status": {"$nin": WAITING_STATUSES}
+            }, projection=projection):
+                remaining.discard(job_data["_id"])
+                yield job_data["_id"], decode_job_data(load_job_data(job_data))
+
+    end_time = None
+    if timeout:
+        end_time = time.time() + timeout
+
+    while len(remaining) > 0:
+
+        for result in find_finished(remaining):
+            yield result
+
+        next_check = time.time() + poll_interval
+        if end_time is not None:
+            next_check = min(next_check, end_time)
+
+        while len(remaining) > 0 and time.time() < next_check:
+
+            if not notify_ttl:
+                time.sleep(next_check - time.time())
+                break
+
+            notified = context.connections.redis.blpop(
+                [redis_key("job_done", job_id) for job_id in remaining],
+                timeout=max(1, int(math.ceil(next_check - time.time()))))
+            if notified is None:
+                break
+
+            # Leave the notification for other waiters
+            notify_key, status = notified
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                pipe.rpush(notify_key, status)
+                pipe.expire(notify_key, int(notify_ttl))
+                pipe.execute()
+
+            notify_key = notify_key.decode("utf-8") if isinstance(notify_key, bytes) else notify_key
+            job_id = ObjectId(notify_key.rsplit(":", 1)[1])
+            for result in find_finished([job_id]):
+                yield result
+
+            # The job was requeued since this notification
+            if job_id in remaining:
+                context.connections.redis.delete(notify_key)
+
+        if end_time is not None and time.time() >= end_time and len(remaining) > 0:
+            raise Exception("Waited for %s job results for %s seconds, timeout." % (len(remaining), timeout))
+
+
 def get_job_result(job_id):
     job = Job(job_id)
     job.fetch(full_data={"result": 1, "status": 1, "_id": 0})
-    return job.data
+    return load_job_data(job.data)
 
 
 def queue_raw_jobs(queue, params_list, **kwargs):
@@ -673,21 +1135,94 @@ def queue_job(main_task_path, params, **kwargs):
 
     return queue_jobs(main_task_path, [params], **kwargs)[0]
 
-def set_queues_size(size_by_queues, action="incr"):
+def set_queues_size(size_by_queues, action="incr", pipe=None):
     if len(size_by_queues) > 0:
+        if pipe is None:
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                set_queues_size(size_by_queues, action=action, pipe=pipe)
+                pipe.execute()
+            return
+
+        action_func = getattr(pipe, action)
+        for queue in size_by_queues:
+            action_func("queuesize:%s" % queue, amount=size_by_queues[queue])
+            pipe.expire("queuesize:%s" % queue, context.get_current_config().get("queue_ttl"))
+
+def pipe_job_counters(pipe, path, old_status, new_status, count=1, old_exceptiontype=None, new_exceptiontype=None):
+    """ Adds the updates of the job counters by path & status, and by path & exception of failed jobs,
+        to a pipeline. These counters are only approximate between runs of ReconcileJobCounters. """
+
+    if old_status == new_status:
+        return
+
+    if old_status:
+        pipe.hincrby(redis_key("job_counters_status"), "%s %s" % (path, old_status), -count)
+        if old_status == "failed" and old_exceptiontype:
+            pipe.hincrby(redis_key("job_counters_exceptions"), "%s %s" % (path, old_exceptiontype), -count)
+
+    if new_status:
+        pipe.hincrby(redis_key("job_counters_status"), "%s %s" % (path, new_status), count)
+        if new_status == "failed" and new_exceptiontype:
+            pipe.hincrby(redis_key("job_counters_exceptions"), "%s %s" % (path, new_exceptiontype), count)
+
+
+def incr_job_counters(transitions):
+    """ Updates the job counters for a list of (path, old_status, new_status) transitions """
+
+    counts = defaultdict(int)
+    for transition in transitions:
+        counts[transition] += 1
+
+    if len(counts) > 0:
         with context.connections.redis.pipeline(transaction=False) as pipe:
-            action_func = getattr(pipe, action)
-            for queue in size_by_queues:
-                action_func("queuesize:%s" % queue, amount=size_by_queues[queue])
-                pipe.expire("queuesize:%s" % queue, context.get_current_config().get("queue_ttl"))
+            for (path, old_status, new_status), count in counts.items():
+                pipe_job_counters(pipe, path, old_status, new_status, count=count)
             pipe.execute()
 
-def queue_jobs(main_task_path, params_list, queue=None, batch_size=1000):
-    """ Queue multiple jobs on a regular queue """
+
+def get_job_counters(name):
+    """ Returns the "status" or "exceptions" job counters as {(path, status or exceptiontype): count},
+        or None if they were never reconciled with MongoDB. """
+
+    if not context.connections.redis.exists(redis_key("job_counters_reconciled")):
+        return None
+
+    counters = {}
+    for field, count in context.connections.redis.hgetall(redis_key("job_counters_%s" % name)).items():
+        field = field.decode("utf-8") if isinstance(field, bytes) else field
+        count = int(count)
+        if count > 0:
+            counters[tuple(field.rsplit(" ", 1))] = count
+
+    return counters
+
+
+def queue_jobs(main_task_path, params_list, queue=None, batch_size=1000, priority=None, group=None,
+               depends_on=None, unique=None):
+    """ Queue multiple jobs on a regular queue.
+        On queues with priorities, jobs with a higher priority are dequeued first.
+        Jobs can be added to a group created with mrq.group.create_group().
+        Jobs with depends_on stay in the "waiting" status until all these job IDs succeed.
+        Unique jobs aren't queued while a job with the same path & params is in flight: the ID of
+        that job is returned instead. """
     if len(params_list) == 0:
         return []
+
+    return list(queue_jobs_iter(
+        main_task_path, params_list, queue=queue, batch_size=batch_size, priority=priority,
+        group=group, depends_on=depends_on, unique=unique, concurrency=1
+    ))
+
+
+def queue_jobs_iter(main_task_path, params_iter, queue=None, batch_size=1000, priority=None, group=None,
+                    depends_on=None, unique=None, concurrency=4):
+    """ Streaming version of queue_jobs(): params can come from any iterator and job IDs are yielded
+        in the same order, so that any number of jobs can be queued with constant memory.
+        Up to `concurrency` batches are inserted at the same time. Each batch is indexed & notified
+        as soon as it is inserted, so that workers can start right away. """
+
+    task_def = context.get_current_config().get("tasks", {}).get(main_task_path) or {}
     if queue is None:
-        task_def = context.get_current_config().get("tasks", {}).get(main_task_path) or {}
         queue = task_def.get("queue", "default")
 
     from .queue import Queue
@@ -696,24 +1231,76 @@ def queue_jobs(main_task_path, params_list, queue=None, batch_size=1000):
     if queue_obj.is_raw:
         raise Exception("Can't queue regular jobs on a raw queue")
 
-    all_ids = []
+    if priority is None and queue_obj.use_priority():
+        priority = task_def.get("priority", 0)
 
-    for params_group in group_iter(params_list, n=batch_size):
+    if unique is None:
+        unique = task_def.get("unique", False)
 
-        context.metric("jobs.status.queued", len(params_group))
+    def queue_batch(params_group):
 
-        # Insert the job in MongoDB
-        job_ids = Job.insert([{
+        jobs_data = [{
             "path": main_task_path,
             "params": params,
             "queue": queue,
             "datequeued": datetime.datetime.utcnow(),
             "status": "queued"
-        } for params in params_group], w=1, return_jobs=False)
+        } for params in params_group]
+
+        batch_ids = None
+        if unique:
+            jobs_data, batch_ids = reserve_unique_jobs(jobs_data, ttl=task_def.get("unique_ttl"))
+            if len(jobs_data) == 0:
+                return batch_ids
+
+        context.metric("jobs.status.queued", len(jobs_data))
+
+        if depends_on:
+            # Jobs whose dependencies can't finish anymore, e.g. because they were deleted, eventually expire
+            dateexpires = datetime.datetime.utcnow() + datetime.timedelta(seconds=DEPENDENCY_TTL)
+            for job_data in jobs_data:
+                job_data.setdefault("_id", ObjectId())
+                job_data["status"] = "waiting"
+                job_data["depends_on"] = [ObjectId(x) for x in depends_on]
+                job_data["dateexpires"] = dateexpires
+            register_dependencies([job_data["_id"] for job_data in jobs_data], depends_on)
+
+        if priority is not None:
+            for job_data in jobs_data:
+                job_data["priority"] = priority
+
+        if group is not None:
+            for job_data in jobs_data:
+                job_data["group"] = group
+
+            # Jobs must be counted before they can finish
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                add_to_group(group, len(jobs_data), pipe)
+                pipe.execute()
+
+        # Insert the jobs in MongoDB. Their order doesn't matter, their IDs are already set.
+        try:
+            job_ids = Job.insert(jobs_data, w=1, return_jobs=False, ordered=False)
+        except Exception:
+            if unique:
+                release_unique_jobs(jobs_data)
+            raise
+
+        # Waiting jobs are indexed & counted in the queue once their dependencies succeed
+        if depends_on:
+            check_dependencies(job_ids, depends_on)
+        else:
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                queue_obj.index_job_ids(job_ids, pipe=pipe)
+                queue_obj.notify(len(job_ids), pipe=pipe)
+                set_queues_size({queue: len(job_ids)}, pipe=pipe)
+                pipe.execute()
+
+        return batch_ids if unique else job_ids
 
-        all_ids += job_ids
+    batches = group_iter(params_iter, n=batch_size)
 
-    queue_obj.notify(len(all_ids))
-    set_queues_size({queue: len(all_ids)})
+    if not concurrency or concurrency <= 1:
+        return (job_id for params_group in batches for job_id in queue_batch(params_group))
 
-    return all_ids
+    return context.subpool_imap(concurrency, queue_batch, batches, flatten=True, buffer_size=concurrency)
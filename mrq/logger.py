@@ -2,7 +2,7 @@ from __future__ import print_function
 from future.builtins import object
 from future.utils import iteritems
 
-from collections import defaultdict
+from collections import deque, OrderedDict
 import logging
 import datetime
 import sys
@@ -38,14 +38,40 @@ class MongoHandler(logging.Handler):
 
         We used the standard logging module before but it suffers from memory leaks
         when creating lots of logger objects.
+
+        Log lines are kept in a ring buffer of at most max_buffer_size bytes: when MongoDB
+        falls behind, the oldest lines are dropped. If overflow_sample_rate is set, only 1 line
+        out of overflow_sample_rate is kept while the buffer is more than half full.
+        Jobs can't log more than max_job_lines lines (0 for no limit).
+
+        The buffer is written with unordered insert_many() by flush(), which the worker calls
+        regularly, or by a background greenlet as soon as it holds flush_size bytes.
     """
 
-    def __init__(self, worker=None, mongodb_logs_size=16 * 1024 * 1024):
+    def __init__(self, worker=None, mongodb_logs_size=16 * 1024 * 1024, max_buffer_size=16 * 1024 * 1024,
+                 flush_size=1024 * 1024, max_job_lines=0, overflow_sample_rate=0):
         super(MongoHandler, self).__init__()
 
-        self.buffer = {}
+        self.buffer = deque()
+        self.buffer_size = 0
         self.collection = None
         self.mongodb_logs_size = mongodb_logs_size
+        self.max_buffer_size = max_buffer_size
+        self.flush_size = flush_size
+        self.max_job_lines = max_job_lines
+        self.overflow_sample_rate = overflow_sample_rate
+
+        # Lines that were not written to MongoDB, by reason
+        self.stats = {
+            "dropped": 0,
+            "sampled": 0,
+            "job_lines_cap": 0,
+            "insert_failed": 0
+        }
+        self._sample_counter = 0
+
+        self.flush_event = None
+        self.flush_greenlet = None
 
         self.reset()
         self.set_collection()
@@ -72,10 +98,8 @@ class MongoHandler(logging.Handler):
                     pass
 
     def reset(self):
-        self.buffer = {
-            "workers": defaultdict(list),
-            "jobs": defaultdict(list)
-        }
+        self.buffer = deque()
+        self.buffer_size = 0
 
     def emit(self, record):
         log_entry = self.format(record)
@@ -83,32 +107,82 @@ class MongoHandler(logging.Handler):
             return
         log_entry = _decode_if_str(log_entry)
 
-        if self.worker is not None:
-            self.buffer["workers"][self.worker].append(log_entry)
-
+        job_object = None
         if record.name == "mrq.current":
             job_object = self.get_current_job()
-            if job_object:
-                self.buffer["jobs"][job_object.id].append(log_entry)
+
+            if job_object and self.max_job_lines:
+                job_object.log_lines += 1
+                if job_object.log_lines > self.max_job_lines:
+                    self.stats["job_lines_cap"] += 1
+                    return
+                elif job_object.log_lines == self.max_job_lines:
+                    log_entry += "\n[Reached max_job_lines=%s, next log lines of this job are dropped]" % (
+                        self.max_job_lines)
+
+        if self.overflow_sample_rate and self.buffer_size * 2 > self.max_buffer_size:
+            self._sample_counter += 1
+            if self._sample_counter % self.overflow_sample_rate != 0:
+                self.stats["sampled"] += 1
+                return
+
+        if self.worker is not None:
+            self._append("worker", self.worker, log_entry)
+
+        if job_object:
+            self._append("job", job_object.id, log_entry)
+
+        if self.buffer_size >= self.flush_size:
+            self._flush_in_background()
+
+    def _append(self, key_type, key, log_entry):
+        self.buffer.append((key_type, key, log_entry))
+        self.buffer_size += len(log_entry)
+
+        # Ring buffer: drop the oldest lines
+        while self.buffer_size > self.max_buffer_size and len(self.buffer) > 1:
+            self.buffer_size -= len(self.buffer.popleft()[2])
+            self.stats["dropped"] += 1
+
+    def _flush_in_background(self):
+        """ Wakes up the greenlet writing the logs, without blocking the current one """
+
+        if self.flush_greenlet is None:
+            import gevent
+            import gevent.event
+            self.flush_event = gevent.event.Event()
+            self.flush_greenlet = gevent.spawn(self.greenlet_flush)
+
+        self.flush_event.set()
+
+    def greenlet_flush(self):
+        while True:
+            self.flush_event.wait()
+            self.flush_event.clear()
+            self.flush()
 
     def flush(self):
         # We may log some stuff before we are even connected to Mongo!
         if not self.collection:
             return
 
-        inserts = [{
-            "worker": k,
-            "logs": "\n".join(v) + "\n"
-        } for k, v in iteritems(self.buffer["workers"])] + [{
-            "job": k,
-            "logs": "\n".join(v) + "\n"
-        } for k, v in iteritems(self.buffer["jobs"])]
-
-        if len(inserts) == 0:
+        if len(self.buffer) == 0:
             return
+
+        buffer = self.buffer
         self.reset()
 
+        logs = OrderedDict()
+        for key_type, key, log_entry in buffer:
+            logs.setdefault((key_type, key), []).append(log_entry)
+
+        inserts = [{
+            key_type: key,
+            "logs": "\n".join(v) + "\n"
+        } for (key_type, key), v in iteritems(logs)]
+
         try:
-            self.collection.insert(inserts)
+            self.collection.insert_many(inserts, ordered=False)
         except Exception as e:  # pylint: disable=broad-except
-            self.emit("Log insert failed: %s" % e)
+            self.stats["insert_failed"] += len(buffer)
+            sys.stderr.write("Log insert failed: %s\n" % e)
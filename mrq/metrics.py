@@ -0,0 +1,177 @@
+""" In-process aggregation of worker metrics, exported in the Prometheus text format or pushed to statsd """
+from future.builtins import object
+from future.utils import iteritems
+from collections import defaultdict
+import math
+import socket
+
+# Histogram buckets grow by a factor of sqrt(2) from 1ms, up to about 27 hours.
+HISTOGRAM_MIN = 0.001
+HISTOGRAM_BUCKETS_PER_DOUBLING = 2
+HISTOGRAM_BUCKETS = 55
+HISTOGRAM_BOUNDS = [
+    HISTOGRAM_MIN * 2 ** (float(i) / HISTOGRAM_BUCKETS_PER_DOUBLING) for i in range(HISTOGRAM_BUCKETS)
+]
+
+# Max size of a statsd UDP packet, to avoid fragmentation
+STATSD_MAX_PACKET = 1400
+
+
+class Histogram(object):
+
+    """ Log-scale histogram of durations in seconds, with a constant recording cost.
+        The last bucket also holds all the values over HISTOGRAM_BOUNDS[-1]. """
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.sum = 0.
+
+    def observe(self, value):
+        if value <= HISTOGRAM_MIN:
+            i = 0
+        else:
+            i = min(
+                HISTOGRAM_BUCKETS - 1,
+                int(math.ceil(HISTOGRAM_BUCKETS_PER_DOUBLING * math.log(value / HISTOGRAM_MIN, 2) - 1e-9))
+            )
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q, counts=None):
+        """ Returns the upper bound of the bucket holding the q-quantile """
+        counts = counts or self.counts
+        target = q * sum(counts)
+        seen = 0
+        for i, c in enumerate(counts):
+            seen += c
+            if c and seen >= target:
+                return HISTOGRAM_BOUNDS[i]
+        return 0
+
+
+def _format_labels(labels, extra=None):
+    labels = list(labels) + list(extra or [])
+    if not labels:
+        return ""
+    return "{%s}" % ",".join([
+        '%s="%s"' % (k, str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"))
+        for k, v in labels
+    ])
+
+
+def _statsd_name(name, labels):
+    parts = [name] + [str(v) for _, v in labels]
+    return ".".join([p.replace(".", "_").replace(":", "_").replace("|", "_").replace("/", "_") for p in parts])
+
+
+class Metrics(object):
+
+    """ Counters and histograms, identified by a name and a tuple of (label, value) pairs. """
+
+    def __init__(self):
+        self.counters = defaultdict(float)
+        self.histograms = {}
+        self.help = {}
+
+        # Values at the last statsd push
+        self._pushed_counters = {}
+        self._pushed_histograms = {}
+
+    def describe(self, name, help_text):
+        self.help[name] = help_text
+
+    def incr(self, name, value=1, labels=()):
+        self.counters[(name, labels)] += value
+
+    def observe(self, name, value, labels=()):
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def to_prometheus(self):
+        """ Returns all the metrics in the Prometheus text exposition format """
+
+        lines = []
+
+        by_name = defaultdict(list)
+        for (name, labels), value in iteritems(self.counters):
+            by_name[name].append((labels, value))
+        for name in sorted(by_name):
+            if name in self.help:
+                lines.append("# HELP %s %s" % (name, self.help[name]))
+            lines.append("# TYPE %s counter" % name)
+            for labels, value in sorted(by_name[name]):
+                lines.append("%s%s %s" % (name, _format_labels(labels), repr(float(value))))
+
+        by_name = defaultdict(list)
+        for (name, labels), histogram in iteritems(self.histograms):
+            by_name[name].append((labels, histogram))
+        for name in sorted(by_name):
+            if name in self.help:
+                lines.append("# HELP %s %s" % (name, self.help[name]))
+            lines.append("# TYPE %s histogram" % name)
+            for labels, histogram in sorted(by_name[name], key=lambda x: x[0]):
+                cumulative = 0
+                for bound, count in zip(HISTOGRAM_BOUNDS[:-1], histogram.counts[:-1]):
+                    cumulative += count
+                    lines.append("%s_bucket%s %s" % (name, _format_labels(labels, [("le", "%.6g" % bound)]), cumulative))
+                lines.append("%s_bucket%s %s" % (name, _format_labels(labels, [("le", "+Inf")]), histogram.count))
+                lines.append("%s_sum%s %s" % (name, _format_labels(labels), repr(histogram.sum)))
+                lines.append("%s_count%s %s" % (name, _format_labels(labels), histogram.count))
+
+        return "\n".join(lines) + "\n"
+
+    def get_statsd_lines(self):
+        """ Returns statsd lines for the changes since the last call: counters as deltas, histograms
+            as their count, plus their median and 99th percentile as gauges. """
+
+        lines = []
+
+        for key, value in list(iteritems(self.counters)):
+            delta = value - self._pushed_counters.get(key, 0)
+            if delta:
+                lines.append("%s:%s|c" % (_statsd_name(*key), delta))
+                self._pushed_counters[key] = value
+
+        for key, histogram in list(iteritems(self.histograms)):
+            previous = self._pushed_histograms.get(key) or [0] * HISTOGRAM_BUCKETS
+            counts = [c - p for c, p in zip(histogram.counts, previous)]
+            count = sum(counts)
+            if count:
+                name = _statsd_name(*key)
+                lines.append("%s.count:%s|c" % (name, count))
+                lines.append("%s.p50:%s|g" % (name, histogram.quantile(0.5, counts=counts)))
+                lines.append("%s.p99:%s|g" % (name, histogram.quantile(0.99, counts=counts)))
+                self._pushed_histograms[key] = list(histogram.counts)
+
+        return lines
+
+    def push_statsd(self, address, prefix="mrq"):
+        """ Sends the changes since the last push to statsd over UDP, in as few packets as possible """
+
+        host, port = address.rsplit(":", 1)
+
+        lines = ["%s.%s" % (prefix, line) if prefix else line for line in self.get_statsd_lines()]
+        if not lines:
+            return
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            packet = []
+            size = 0
+            for line in lines:
+                if packet and size + len(line) + 1 > STATSD_MAX_PACKET:
+                    sock.sendto("\n".join(packet).encode("utf-8"), (host, int(port)))
+                    packet = []
+                    size = 0
+                packet.append(line)
+                size += len(line) + 1
+            sock.sendto("\n".join(packet).encode("utf-8"), (host, int(port)))
+        finally:
+            sock.close()
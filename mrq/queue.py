@@ -7,15 +7,25 @@ from bson import ObjectId
 from . import context
 from . import job as jobmodule
 import binascii
-from .redishelpers import redis_key
+from .redishelpers import redis_key, redis_multipop, redis_has_count, redis_token_bucket
+from .utils import group_iter
 
 import sys
 from future import standard_library
 from itertools import chain
+from collections import defaultdict
 
 PY3 = sys.version_info > (3,)
 standard_library.install_aliases()
 
+# Minimum delay between 2 updates of the same queue in the registry of known queues, by process
+QUEUE_REGISTRY_REFRESH = 60
+
+# Queues are kept in the registry at least that long after their last update. A process that
+# registered a queue less than QUEUE_REGISTRY_REFRESH seconds ago doesn't register it again, so the
+# queue must not be removed in the meantime, whatever the clock differences between servers.
+QUEUE_REGISTRY_MIN_AGE = 10 * QUEUE_REGISTRY_REFRESH
+
 
 class Queue(object):
     """ A Queue for Jobs. """
@@ -39,6 +49,9 @@ class Queue(object):
     # of Queue in the current process
     paused_queues = set()
 
+    # Last time each queue was added to the registry by this process
+    registered_at = {}
+
     def __new__(cls, queue_id, **kwargs):
         """ Creates a new instance of the right queue type """
 
@@ -96,6 +109,10 @@ class Queue(object):
         """ Returns the specific configuration for this queue """
         return Queue.get_queues_config().get(self.root_id) or {}
 
+    def index_job_ids(self, job_ids, pipe=None):
+        """ Adds some newly queued job IDs to the Redis index of this queue. Only regular queues have one. """
+        pass
+
     def serialize_job_ids(self, job_ids):
         """ Returns job_ids serialized for storage in Redis """
         if len(job_ids) == 0 or self.use_large_ids:
@@ -148,23 +165,240 @@ class Queue(object):
 
         return self.size()
 
+    def pipe_stats(self, pipe, current_time):
+        """ Adds the commands returning the size of the queue and its number of jobs to dequeue to a
+            pipeline. Returns the number of commands: the first one is the size, the last one the
+            number of jobs to dequeue. """
+
+        pipe.get("queuesize:%s" % self.id)
+        return 1
+
+    @classmethod
+    def collect_stats(cls, queue_ids, current_time=None, batch_size=1000):
+        """ Returns {queue_id: (size, jobs_to_dequeue)} with one Redis pipeline per batch of queues.
+            Counts of subqueues are also added to their parent "root/" queue. """
+
+        if current_time is None:
+            current_time = time.time()
+
+        # Parent queues are computed from their subqueues
+        queues = [Queue(q) for q in set(queue_ids) if not q.endswith("/")]
+
+        stats = {}
+        parents = defaultdict(lambda: [0, 0])
+
+        for queues_group in group_iter(queues, n=batch_size):
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                commands_count = [queue.pipe_stats(pipe, current_time) for queue in queues_group]
+                results = iter(pipe.execute())
+
+            for queue, count in zip(queues_group, commands_count):
+                values = [int(next(results) or 0) for _ in range(count)]
+                stats[queue.id] = (values[0], values[-1])
+
+                if queue.is_subqueue:
+                    parent = parents[queue.root_id + "/"]
+                    parent[0] += values[0]
+                    parent[1] += values[-1]
+
+        for parent_id, (size, jobs_to_dequeue) in parents.items():
+            stats[parent_id] = (size, jobs_to_dequeue)
+
+        return stats
+
+    @classmethod
+    def get_stats(cls, queue_ids=None, max_age=None):
+        """ Returns the queue stats cached by the agents, as {queue_id: {"size", "jobs_to_dequeue", "eta", "time"}}.
+            Stats older than max_age seconds are ignored. """
+
+        key = redis_key("queuestats")
+
+        if queue_ids is None:
+            raw_stats = context.connections.redis.hgetall(key)
+        else:
+            queue_ids = list(queue_ids)
+            raw_stats = dict(zip(queue_ids, context.connections.redis.hmget(key, queue_ids) if queue_ids else []))
+
+        min_time = time.time() - max_age if max_age is not None else 0
+
+        stats = {}
+        for queue_id, value in raw_stats.items():
+            if value is None:
+                continue
+            queue_id = queue_id.decode("utf-8") if isinstance(queue_id, bytes) else queue_id
+            value = value.decode("utf-8") if isinstance(value, bytes) else value
+
+            # Number of jobs to dequeue, ETA, time of stats, size
+            parts = value.split(" ")
+            if int(parts[2]) < min_time:
+                continue
+            stats[queue_id] = {
+                "jobs_to_dequeue": int(parts[0]),
+                "eta": float(parts[1]) if parts[1] != "N" else None,
+                "time": int(parts[2]),
+                "size": int(parts[3]) if len(parts) > 3 else int(parts[0])
+            }
+
+        return stats
+
+    def get_rate_limit(self):
+        """ Returns the (jobs per second, burst) rate limit of this queue, or None """
+
+        rate_limit = self.get_config().get("rate_limit")
+        if not rate_limit:
+            return None
+
+        try:
+            if isinstance(rate_limit, (list, tuple)):
+                rate, burst = (float(rate_limit[0]), int(rate_limit[1])) if len(rate_limit) == 2 else (0, 0)
+            else:
+                rate, burst = float(rate_limit), max(1, int(rate_limit))
+        except (TypeError, ValueError):
+            rate, burst = 0, 0
+
+        # The token bucket divides by the rate
+        if rate <= 0 or burst < 1:
+            raise Exception(
+                "Invalid rate_limit %r for queue %s: expected jobs per second > 0, or a (jobs per second > 0, "
+                "burst >= 1) tuple" % (rate_limit, self.id)
+            )
+
+        return rate, burst
+
+    def take_rate_limit_tokens(self, max_jobs):
+        """ Returns how many of max_jobs we are allowed to dequeue right now """
+
+        rate_limit = self.get_rate_limit()
+        if rate_limit is None:
+            return max_jobs
+
+        return redis_token_bucket()(keys=[redis_key("rate_limit", self)], args=[rate_limit[0], rate_limit[1], max_jobs])
+
+    def refund_rate_limit_tokens(self, count):
+        """ Gives back tokens taken for jobs we couldn't dequeue """
+
+        rate_limit = self.get_rate_limit()
+        if rate_limit is None or count <= 0:
+            return
+
+        redis_token_bucket()(keys=[redis_key("rate_limit", self)], args=[rate_limit[0], rate_limit[1], -count])
+
+    def get_multi_dequeue_params(self, current_time):
+        """ Returns the keys & arguments of this queue for redishelpers.redis_multipop(),
+            or None if it can't be dequeued that way. """
+
+        return None
+
+    @classmethod
+    def dequeue_jobs_multi(cls, queues, max_jobs=1, parallel=False, queues_left=None, job_class=None, worker=None):
+        """ Dequeues up to max_jobs from several queues with a single Redis call, following the
+            sequential or parallel dequeue strategies. All queues must support get_multi_dequeue_params().
+
+            queues_left is the number of queues left in the current worker pass, to share max_jobs
+            like if these queues were dequeued one by one.
+
+            Returns the number of queues that were looked at and the list of dequeued jobs.
+        """
+
+        current_time = time.time()
+
+        keys = []
+        args = [
+            max_jobs,
+            "parallel" if parallel else "sequential",
+            queues_left or len(queues),
+            current_time,
+            "1" if redis_has_count("lpop") else "0"
+        ]
+        for queue in queues:
+            queue_keys, queue_args = queue.get_multi_dequeue_params(current_time)
+            keys += queue_keys
+            args += queue_args
+
+        results = redis_multipop()(keys=keys, args=args)
+
+        jobs = []
+        indexed_queues = []
+        indexed_ids = []
+
+        for queue, items in zip(queues, results):
+            if len(items) == 0:
+                continue
+            if queue.is_raw:
+                jobs += list(queue.jobs_from_raw_params(items, job_class=job_class, worker=worker))
+            else:
+                indexed_queues.append(queue)
+                indexed_ids += items
+
+        # Jobs from all the queues with a Redis index are started with a single MongoDB update
+        if len(indexed_queues) > 0:
+            jobs_data = indexed_queues[0].claim_index_ids(
+                indexed_ids, [("datequeued", 1), ("_id", 1)], worker, queues=indexed_queues
+            )
+
+            jobs_data_by_queue = defaultdict(list)
+            for job_data in jobs_data:
+                jobs_data_by_queue[job_data["queue"]].append(job_data)
+
+            for queue in indexed_queues:
+                queue_jobs_data = jobs_data_by_queue[queue.id]
+                if queue.is_reverse:
+                    queue_jobs_data.reverse()
+                jobs += list(queue.jobs_from_data(queue_jobs_data, job_class=job_class, worker=worker))
+
+        return len(results), jobs
+
+    @classmethod
+    def get_registry(cls, prefixes=None):
+        """ Returns the queues in the registry of known queues, optionally filtered by prefixes """
+
+        key = redis_key("known_queues_lex")
+
+        if not prefixes:
+            results = [context.connections.redis.zrange(key, 0, -1)]
+        else:
+            # All the members of this sorted set have the same score, so they are sorted by name.
+            # 0xFF is never found in UTF-8 and is greater than any byte after the prefix.
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                for prefix in prefixes:
+                    prefix = prefix.encode("utf-8")
+                    pipe.zrangebylex(key, b"[" + prefix, b"(" + prefix + b"\xff")
+                results = pipe.execute()
+
+        return set(q.decode("utf-8") if isinstance(q, bytes) else q for members in results for q in members)
+
+    def register(self, pipe):
+        """ Adds this queue to the registry of known queues, at most every QUEUE_REGISTRY_REFRESH
+            seconds by process """
+
+        now = time.time()
+        if now - Queue.registered_at.get(self.id, 0) < QUEUE_REGISTRY_REFRESH:
+            return
+
+        Queue.registered_at[self.id] = now
+        pipe.zadd(redis_key("known_queues"), **{self.id: now})
+        pipe.zadd(redis_key("known_queues_lex"), **{self.id: 0})
+
     @classmethod
     def all_active(cls):
-        """ List active queues, based on their lengths in Redis. Warning, uses the unscalable KEYS redis command """
+        """ List raw queues that currently have jobs in Redis """
 
-        prefix = context.get_current_config()["redis_prefix"]
-        queues = []
-        for key in context.connections.redis.keys():
-            if key.startswith(prefix):
-                queues.append(Queue(key[len(prefix) + 3:]))
+        queues = [Queue(q) for q in Queue.get_registry()]
+        queues = [queue for queue in queues if queue.is_raw]
 
-        return queues
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for queue in queues:
+                pipe.exists(queue.redis_key)
+            exists = pipe.execute()
+
+        return [queue for queue, queue_exists in zip(queues, exists) if queue_exists]
 
     @classmethod
     def all_known(cls, sources=None, prefixes=None):
-        """ List all currently known queues """
+        """ List all currently known queues. The "jobs" source is a slow distinct() on MongoDB,
+            the registry should be preferred. """
 
-        sources = sources or ("config", "jobs", "raw_subqueues")
+        sources = sources or ("config", "registry", "raw_subqueues")
 
         queues = set()
 
@@ -188,6 +422,9 @@ class Queue(object):
 
             queues |= set(queues_from_config)
 
+        if "registry" in sources:
+            queues |= Queue.get_registry(prefixes=prefixes)
+
         if "jobs" in sources:
 
             # This will get all queues from mongodb, including those where we have only non-queued jobs
@@ -227,19 +464,33 @@ class Queue(object):
         """ Does this queue use notifications? """
         return bool(self.get_config().get("notify"))
 
-    def notify(self, new_jobs_count):
-        """ We just queued new_jobs_count jobs on this queue, wake up the workers if needed """
+    def notify(self, new_jobs_count, pipe=None):
+        """ We just queued new_jobs_count jobs on this queue: keep it in the registry of known
+            queues and wake up the workers if needed """
 
-        if not self.use_notify():
+        if pipe is None:
+            with context.connections.redis.pipeline(transaction=False) as pipe:
+                self.notify(new_jobs_count, pipe=pipe)
+                pipe.execute()
             return
 
-        # Not really useful to send more than 100 notifs (to be configured)
-        count = min(new_jobs_count, 100)
+        self.register(pipe)
+
+        use_wakeup = context.get_current_config().get("wakeup")
+
+        if self.use_notify():
+
+            # Not really useful to send more than 100 notifs (to be configured)
+            count = min(new_jobs_count, 100)
+
+            notify_key = redis_key("notify", self)
 
-        notify_key = redis_key("notify", self)
+            pipe.lpush(notify_key, *([1] * count))
+            pipe.expire(notify_key, max(1, int(context.get_current_config()["max_latency"] * 2)))
 
-        context.connections.redis.lpush(notify_key, *([1] * count))
-        context.connections.redis.expire(notify_key, max(1, int(context.get_current_config()["max_latency"] * 2)))
+        # One message is enough to wake up all the workers listening to this queue
+        if use_wakeup:
+            pipe.publish(redis_key("wakeup", self), new_jobs_count)
 
 
 #
@@ -2,7 +2,8 @@ from datetime import datetime
 import time
 from .queue import Queue
 from . import context
-from .redishelpers import redis_zaddbyscore, redis_zpopbyscore, redis_key, redis_group_command
+from .redishelpers import (redis_raw_lpop, redis_raw_spop, redis_raw_zpop, redis_raw_zpopbyscore,
+                           redis_remove_empty_subqueue, redis_key, redis_has_count)
 from past.utils import old_div
 from future.builtins import range
 
@@ -71,25 +72,33 @@ class QueueRaw(Queue):
         if len(params_list) == 0:
             return
 
-        if self.is_subqueue:
-            context.connections.redis.sadd(self.redis_key_known_subqueues, self.id)
+        with context.connections.redis.pipeline(transaction=False) as pipe:
 
-        # ZSET
-        if self.is_sorted:
+            # ZSET
+            if self.is_sorted:
 
-            if not isinstance(params_list, dict) and self.is_timed:
-                now = time.time()
-                params_list = {x: now for x in params_list}
+                if not isinstance(params_list, dict) and self.is_timed:
+                    now = time.time()
+                    params_list = {x: now for x in params_list}
 
-            context.connections.redis.zadd(self.redis_key, **params_list)
+                pipe.zadd(self.redis_key, **params_list)
 
-        # SET
-        elif self.is_set:
-            context.connections.redis.sadd(self.redis_key, *params_list)
+            # SET
+            elif self.is_set:
+                pipe.sadd(self.redis_key, *params_list)
 
-        # LIST
-        else:
-            context.connections.redis.rpush(self.redis_key, *params_list)
+            # LIST
+            else:
+                pipe.rpush(self.redis_key, *params_list)
+
+            # Register the subqueue after pushing, so that a worker can't remove it
+            # as empty between the two commands.
+            if self.is_subqueue:
+                pipe.sadd(self.redis_key_known_subqueues, self.id)
+
+            self.notify(len(params_list), pipe=pipe)
+
+            pipe.execute()
 
         context.metric("queues.%s.enqueued" % self.id, len(params_list))
         context.metric("queues.all.enqueued", len(params_list))
@@ -158,70 +167,127 @@ class QueueRaw(Queue):
         else:
             return self.size()
 
-    def dequeue_jobs(self, max_jobs=1, job_class=None, worker=None):
+    def pipe_stats(self, pipe, current_time):
+        """ Adds the commands returning the size of the queue and its number of jobs to dequeue to a
+            pipeline. Returns the number of commands. """
 
-        queue_config = self.get_config()
+        # ZSET
+        if self.is_sorted:
+            pipe.zcard(self.redis_key)
+            if self.is_timed:
+                pipe.zcount(self.redis_key, "-inf", current_time)
+                return 2
+        # SET
+        elif self.is_set:
+            pipe.scard(self.redis_key)
+        # LIST
+        else:
+            pipe.llen(self.redis_key)
 
-        statuses_no_storage = queue_config.get("statuses_no_storage")
-        job_factory = queue_config.get("job_factory")
-        if not job_factory:
+        return 1
+
+    def get_pushback_time(self, current_time):
+        """ When we have a pushback_seconds argument, we never pop items from
+            timed queues, instead we push them back by an amount of time so
+            that they don't get dequeued again until the task finishes.
+            Returns 0 when items should be popped. """
+
+        pushback_seconds = float(self.get_config().get("pushback_seconds") or 0)
+        if pushback_seconds > 0:
+            return current_time + pushback_seconds
+        return 0
+
+    def get_multi_dequeue_params(self, current_time):
+        """ Returns the keys & arguments of this queue for redishelpers.redis_multipop() """
+
+        # Rate-limited queues must take tokens first
+        if not self.get_config().get("job_factory") or self.get_rate_limit():
+            return None
+
+        keys = [self.redis_key, self.redis_key_known_subqueues]
+        subqueue = self.id if self.is_subqueue else ""
+
+        if self.is_timed:
+            return keys, ["timed", subqueue, self.get_pushback_time(current_time)]
+        elif self.is_sorted:
+            return keys, ["sorted", subqueue, 0]
+        elif self.is_set:
+            # SPOP in a script must be a single command, see pop()
+            if not redis_has_count("spop"):
+                return None
+            return keys, ["set", subqueue, 0]
+        else:
+            return keys, ["list", subqueue, 0]
+
+    def dequeue_jobs(self, max_jobs=1, job_class=None, worker=None):
+
+        if not self.get_config().get("job_factory"):
             raise Exception("No job_factory configured for raw queue %s" % self.id)
 
-        retry_queue = self.get_retry_queue()
+        max_jobs = self.take_rate_limit_tokens(max_jobs)
+        if max_jobs == 0:
+            return []
 
-        params = []
+        # Empty subqueues are removed from the known subqueues in the same call
+        keys = [self.redis_key, self.redis_key_known_subqueues]
+        subqueue = self.id if self.is_subqueue else ""
 
         # ZSET with times
         if self.is_timed:
 
             current_time = time.time()
 
-            # When we have a pushback_seconds argument, we never pop items from
-            # the queue, instead we push them back by an amount of time so
-            # that they don't get dequeued again until
-            # the task finishes.
-
-            pushback_time = current_time + float(queue_config.get("pushback_seconds") or 0)
-            if pushback_time > current_time:
-                params = redis_zaddbyscore()(
-                    keys=[self.redis_key],
-                    args=[
-                        "-inf", current_time, 0, max_jobs, pushback_time
-                    ])
-
-            else:
-                params = redis_zpopbyscore()(
-                    keys=[self.redis_key],
-                    args=[
-                        "-inf", current_time, 0, max_jobs
-                    ])
+            params = redis_raw_zpopbyscore()(
+                keys=keys,
+                args=[current_time, max_jobs, self.get_pushback_time(current_time), subqueue])
 
         # ZSET
         elif self.is_sorted:
+            params = redis_raw_zpop()(keys=keys, args=[max_jobs, subqueue])
 
-            # TODO Lua?
-            with context.connections.redis.pipeline(transaction=True) as pipe:
-                pipe.zrange(self.redis_key, 0, max_jobs - 1)
-                pipe.zremrangebyrank(self.redis_key, 0, max_jobs - 1)
-                params = pipe.execute()[0]
+        # SET & LIST
+        else:
+            params = self.pop(max_jobs)
 
-        # SET
-        elif self.is_set:
-            params = redis_group_command("spop", max_jobs, self.redis_key)
+        self.refund_rate_limit_tokens(max_jobs - len(params))
 
-        # LIST
-        else:
-            params = redis_group_command("lpop", max_jobs, self.redis_key)
+        return self.jobs_from_raw_params(params, job_class=job_class, worker=worker)
 
-        if len(params) == 0:
+    def pop(self, max_jobs):
+        """ Pops up to max_jobs raw params from a SET or LIST queue """
+
+        command = "spop" if self.is_set else "lpop"
+        keys = [self.redis_key, self.redis_key_known_subqueues]
+        subqueue = self.id if self.is_subqueue else ""
+
+        if redis_has_count(command):
+            script = redis_raw_spop() if self.is_set else redis_raw_lpop()
+            return script(keys=keys, args=[max_jobs, subqueue])
 
-            # We didn't dequeue anything. Does this mean the queue is empty?
-            # TODO LUA this with the above
-            if self.is_subqueue and self.size() == 0:
-                context.connections.redis.srem(self.redis_key_known_subqueues, self.id)
+        # Older Redis servers: one command per item in a pipeline. Before Redis 3.2, scripts can't
+        # write after a SPOP, so the empty subqueue is removed by another script in the same pipeline.
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for _ in range(max_jobs):
+                getattr(pipe, command)(self.redis_key)
+            if subqueue:
+                redis_remove_empty_subqueue()(keys=keys, args=[subqueue], client=pipe)
+            results = pipe.execute()
 
+        return [x for x in results[:max_jobs] if x is not None]
+
+    def jobs_from_raw_params(self, params, job_class=None, worker=None):
+        """ Creates started jobs from raw parameters popped from this queue """
+
+        if len(params) == 0:
             return
 
+        queue_config = self.get_config()
+
+        statuses_no_storage = queue_config.get("statuses_no_storage")
+        job_factory = queue_config.get("job_factory")
+
+        retry_queue = self.get_retry_queue()
+
         if worker:
             worker.status = "spawn"
 
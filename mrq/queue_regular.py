@@ -1,10 +1,30 @@
 from .queue import Queue
 from . import context
+from .redishelpers import redis_key, redis_lpopsafe
 import datetime
+import time
 import copy
+import itertools
+from bson import ObjectId
 from pymongo.collection import ReturnDocument
 
 
+DEQUEUE_PROJECTION = {
+    "_id": 1,
+    "path": 1,
+    "params": 1,
+    "status": 1,
+    "retry_count": 1,
+    "queue": 1,
+    "datequeued": 1,
+    "group": 1,
+    "unique": 1
+}
+
+# Maximum number of find/claim rounds when jobs are stolen by other workers in batch mode
+DEQUEUE_BATCH_ATTEMPTS = 3
+
+
 class QueueRegular(Queue):
 
     def __init__(self, *args, **kwargs):
@@ -23,14 +43,46 @@ class QueueRegular(Queue):
         elif blacklist:
             self.base_dequeue_query["path"] = {"$nin": [x.strip() for x in blacklist.split(",")]}
 
+        # redis key used to store the IDs of queued jobs, when the queue has a Redis index.
+        self.redis_key_index = redis_key("queue_index", self)
+
+        # global redis key used to store job ids popped from an index but not yet started
+        self.redis_key_started = redis_key("started_jobs")
+
     @property
     def collection(self):
         return context.connections.mongodb_jobs.mrq_jobs
 
     def empty(self):
         """ Remove all jobs """
+        if self.use_redis_index():
+            context.connections.redis.delete(self.redis_key_index)
         return self.collection.delete_many({"queue": self.id})
 
+    def use_redis_index(self):
+        """ Are the IDs of queued jobs also stored in a Redis list for faster dequeues?
+            The index is FIFO so it can't be used with priorities. """
+        return bool(self.get_config().get("redis_index")) and not self.use_priority()
+
+    def use_priority(self):
+        """ Are jobs dequeued by descending priority before their queue date? """
+        return bool(self.get_config().get("priority"))
+
+    def use_enqueue_buffer(self, worker=None):
+        """ Can this worker start jobs from the enqueue buffer of this queue? The buffer doesn't know about
+            task whitelists & blacklists, nor about the tasks at their max concurrency. """
+        if not context.get_current_config().get("enqueue_buffer_interval"):
+            return False
+        return "path" not in self.base_dequeue_query and not getattr(worker, "paths_at_capacity", None)
+
+    def index_job_ids(self, job_ids, pipe=None):
+        """ Adds some newly queued job IDs to the Redis index of this queue, if it has one """
+
+        if len(job_ids) == 0 or not self.use_redis_index():
+            return
+
+        (pipe or context.connections.redis).rpush(self.redis_key_index, *self.serialize_job_ids(job_ids))
+
     def get_retry_queue(self):
         """ Return the name of the queue where retried jobs will be queued """
         return self.id
@@ -38,13 +90,11 @@ class QueueRegular(Queue):
     def get_known_subqueues(self):
         """ Returns all known subqueues """
 
-        all_queues_from_mongodb = Queue.all_known(sources=("jobs", ))
-
         idprefix = self.id
         if not idprefix.endswith("/"):
             idprefix += "/"
 
-        return {q for q in all_queues_from_mongodb if q.startswith(idprefix)}
+        return Queue.get_registry(prefixes=[idprefix])
 
     def size(self):
         """ Returns the total number of queued jobs on the queue """
@@ -73,41 +123,104 @@ class QueueRegular(Queue):
     def dequeue_jobs(self, max_jobs=1, job_class=None, worker=None):
         """ Fetch a maximum of max_jobs from this queue """
 
+        max_jobs = self.take_rate_limit_tokens(max_jobs)
+        if max_jobs == 0:
+            return []
+
+        # Jobs that weren't written in MongoDB yet are started first
+        buffered_jobs = []
+        if self.use_enqueue_buffer(worker):
+            from .enqueue_buffer import dequeue_buffered_jobs
+            buffered_jobs = dequeue_buffered_jobs(self.id, max_jobs, job_class=job_class, worker=worker)
+            if len(buffered_jobs) == max_jobs:
+                return buffered_jobs
+
+        # TODO: remove _id sort after full migration to datequeued
+        sort_order = [("datequeued", -1 if self.is_reverse else 1), ("_id", -1 if self.is_reverse else 1)]
+
+        if self.use_priority():
+            sort_order.insert(0, ("priority", -1))
+
+        max_jobs -= len(buffered_jobs)
+
+        # The Redis index doesn't know about task whitelists & blacklists
+        if self.use_redis_index() and "path" not in self.base_dequeue_query:
+            jobs_data = self._dequeue_jobs_index(max_jobs, sort_order, worker)
+        elif max_jobs > 1 and context.get_current_config().get("dequeue_batch"):
+            jobs_data = self._dequeue_jobs_batch(self.get_dequeue_query(worker), max_jobs, sort_order, worker)
+        else:
+            jobs_data = self._dequeue_jobs_one_by_one(self.get_dequeue_query(worker), max_jobs, sort_order, worker)
+
+        jobs = self.jobs_from_data(jobs_data, job_class=job_class, worker=worker, rate_limit_tokens=max_jobs)
+        if buffered_jobs:
+            return itertools.chain(buffered_jobs, jobs)
+        return jobs
+
+    def jobs_from_data(self, jobs_data, job_class=None, worker=None, rate_limit_tokens=0):
+        """ Creates Job objects from the data of jobs started by this worker.
+            Unused rate limit tokens are given back at the end. """
+
         if job_class is None:
             from .job import Job
             job_class = Job
 
         count = 0
+        started_paths = []
 
+        for job_data in jobs_data:
 
+            if worker:
+                worker.status = "spawn"
 
-        # TODO: remove _id sort after full migration to datequeued
-        sort_order = [("datequeued", -1 if self.is_reverse else 1), ("_id", -1 if self.is_reverse else 1)]
+            count += 1
+            started_paths.append(job_data.get("path"))
+            context.metric("queues.%s.dequeued" % job_data["queue"], 1)
+
+            job = job_class(job_data["_id"], queue=self.id, start=False)
+            job.set_data(job_data)
+            job.datestarted = datetime.datetime.utcnow()
+
+            context.metric("jobs.status.started")
+
+            yield job
+
+        context.metric("queues.all.dequeued", count)
+
+        from .job import incr_job_counters
+        incr_job_counters([(path, "queued", "started") for path in started_paths])
+
+        self.refund_rate_limit_tokens(rate_limit_tokens - count)
+
+    def get_multi_dequeue_params(self, current_time):
+        """ Returns the keys & arguments of this queue for redishelpers.redis_multipop(),
+            or None if it doesn't have a Redis index. """
+
+        # The Redis index doesn't know about task whitelists & blacklists.
+        # Rate-limited queues must take tokens first.
+        if not self.use_redis_index() or "path" in self.base_dequeue_query or self.get_rate_limit():
+            return None
 
-        # MongoDB optimization: with many jobs it's faster to fetch the IDs first and do the atomic update second
-        # Some jobs may have been stolen by another worker in the meantime but it's a balance (should we over-fetch?)
-        # job_ids = None
-        # if max_jobs > 5:
-        #     job_ids = [x["_id"] for x in self.collection.find(
-        #         self.base_dequeue_query,
-        #         limit=max_jobs,
-        #         sort=sort_order,
-        #         projection={"_id": 1}
-        #     )]
-
-        #     if len(job_ids) == 0:
-        #         return
-
-        for i in range(max_jobs):  # if job_ids is None else len(job_ids)):
-
-            # if job_ids is not None:
-            #     query = {
-            #         "status": "queued",
-            #         "_id": job_ids[i]
-            #     }
-            #     sort_order = None
-            # else:
-            query = self.base_dequeue_query
+        return [self.redis_key_index, self.redis_key_started], ["index", "0" if self.is_reverse else "1", 0]
+
+    def get_dequeue_query(self, worker=None):
+        """ Returns the MongoDB query for jobs to dequeue, skipping the tasks
+            that have all their max_concurrency slots taken. """
+
+        paths_at_capacity = getattr(worker, "paths_at_capacity", None)
+        if not paths_at_capacity:
+            return self.base_dequeue_query
+
+        query = dict(self.base_dequeue_query)
+        path_query = dict(query.get("path") or {})
+        path_query["$nin"] = list(path_query.get("$nin") or []) + sorted(paths_at_capacity)
+        query["path"] = path_query
+
+        return query
+
+    def _dequeue_jobs_one_by_one(self, query, max_jobs, sort_order, worker):
+        """ Atomically dequeues jobs with one MongoDB round-trip each """
+
+        for _ in range(max_jobs):
 
             job_data = self.collection.find_one_and_update(
                 query,
@@ -120,32 +233,106 @@ class QueueRegular(Queue):
                 }},
                 sort=sort_order,
                 return_document=ReturnDocument.AFTER,
-                projection={
-                    "_id": 1,
-                    "path": 1,
-                    "params": 1,
-                    "status": 1,
-                    "retry_count": 1,
-                    "queue": 1,
-                    "datequeued": 1
-                }
+                projection=DEQUEUE_PROJECTION
             )
 
             if not job_data:
                 break
 
-            if worker:
-                worker.status = "spawn"
+            yield job_data
 
-            count += 1
-            context.metric("queues.%s.dequeued" % job_data["queue"], 1)
+    def _dequeue_jobs_batch(self, query, max_jobs, sort_order, worker):
+        """ Dequeues up to max_jobs with a bounded number of MongoDB round-trips.
 
-            job = job_class(job_data["_id"], queue=self.id, start=False)
-            job.set_data(job_data)
-            job.datestarted = datetime.datetime.utcnow()
+            With many jobs it's faster to fetch the IDs first and do the atomic update second.
+            Some jobs may have been stolen by another worker in the meantime: we only keep
+            the ones flagged with our claim token and try again a few times for the rest.
+        """
 
-            context.metric("jobs.status.started")
+        jobs_data = []
 
-            yield job
+        for _ in range(DEQUEUE_BATCH_ATTEMPTS):
 
-        context.metric("queues.all.dequeued", count)
+            remaining = max_jobs - len(jobs_data)
+
+            job_ids = [x["_id"] for x in self.collection.find(
+                query,
+                limit=remaining,
+                sort=sort_order,
+                projection={"_id": 1}
+            )]
+
+            if len(job_ids) == 0:
+                break
+
+            claimed = self._claim_jobs(job_ids, sort_order, worker, query=query)
+            jobs_data += claimed
+
+            # We got everything we asked for, or the queue is now empty.
+            if len(claimed) == len(job_ids):
+                break
+
+        return jobs_data
+
+    def _dequeue_jobs_index(self, max_jobs, sort_order, worker):
+        """ Pops job IDs from the Redis index and only does an _id-keyed update in MongoDB.
+
+            Popped IDs are kept in the "started" zset until they are flagged as started in MongoDB,
+            so that they can be restored by mrq.basetasks.cleaning.ReindexLostJobs if we crash.
+            IDs of jobs that are not queued anymore (cancelled, already dequeued...) are dropped.
+        """
+
+        redis_job_ids = redis_lpopsafe()(
+            keys=[self.redis_key_index, self.redis_key_started],
+            args=[max_jobs, int(time.time()), "0" if self.is_reverse else "1"]
+        )
+
+        return self.claim_index_ids(redis_job_ids, sort_order, worker)
+
+    def claim_index_ids(self, redis_job_ids, sort_order, worker, queues=None):
+        """ Starts the jobs with these IDs popped from the Redis index of this queue,
+            or of all the given queues. """
+
+        if len(redis_job_ids) == 0:
+            return []
+
+        job_ids = [
+            ObjectId(x.decode("utf-8") if isinstance(x, bytes) else x)
+            for x in self.unserialize_job_ids(redis_job_ids)
+        ]
+
+        query = dict(self.base_dequeue_query)
+        if queues is not None:
+            query["queue"] = {"$in": [queue.id for queue in queues]}
+
+        jobs_data = self._claim_jobs(job_ids, sort_order, worker, query=query)
+
+        context.connections.redis.zrem(self.redis_key_started, *redis_job_ids)
+
+        return jobs_data
+
+    def _claim_jobs(self, job_ids, sort_order, worker, query=None):
+        """ Flags the given queued jobs as started with a unique claim token,
+            then reads back those we actually got. """
+
+        claim_token = ObjectId()
+
+        query = dict(query or self.base_dequeue_query)
+        query["_id"] = {"$in": job_ids}
+
+        ret = self.collection.update_many(query, {"$set": {
+            "status": "started",
+            "datestarted": datetime.datetime.utcnow(),
+            "worker": worker.id if worker else None,
+            "dequeue_token": claim_token
+        }, "$unset": {
+            "dateexpires": 1  # we don't want started jobs to expire unexpectedly
+        }})
+
+        if ret.modified_count == 0:
+            return []
+
+        return list(self.collection.find({
+            "_id": {"$in": job_ids},
+            "dequeue_token": claim_token
+        }, sort=sort_order, projection=DEQUEUE_PROJECTION))
@@ -9,86 +9,455 @@ def redis_key(name, *args):
     return "%s:ksq:%s" % (prefix, args[0].root_id)
   elif name == "queue":
      return "%s:q:%s" % (prefix, args[0].id)
+  elif name == "queue_index":
+     return "%s:qi:%s" % (prefix, args[0].id)
   elif name == "started_jobs":
     return "%s:s:started" % prefix
   elif name == "paused_queues":
     return "%s:s:paused" % prefix
   elif name == "notify":
      return "%s:notify:%s" % (prefix, args[0].root_id)
+  elif name == "wakeup":
+     return "%s:wakeup:%s" % (prefix, args[0].root_id)
+  elif name == "rate_limit":
+     return "%s:rl:%s" % (prefix, args[0].root_id)
+  elif name == "known_queues":
+    return "%s:s:queues" % prefix
+  elif name == "known_queues_lex":
+    return "%s:s:queues:lex" % prefix
+  elif name == "queuestats":
+    return "%s:queuestats" % prefix
+  elif name == "job_counters_status":
+    return "%s:s:counters:status" % prefix
+  elif name == "job_counters_exceptions":
+    return "%s:s:counters:exceptions" % prefix
+  elif name == "job_counters_reconciled":
+    return "%s:s:counters:reconciled" % prefix
+  elif name == "job_done":
+    return "%s:jd:%s" % (prefix, args[0])
+  elif name == "group":
+    return "%s:g:%s" % (prefix, args[0])
+  elif name == "group_done":
+    return "%s:gd:%s" % (prefix, args[0])
+  elif name == "job_dependents":
+    return "%s:jdp:%s" % (prefix, args[0])
+  elif name == "job_dependencies":
+    return "%s:jdc:%s" % (prefix, args[0])
+  elif name == "unique_job":
+    return "%s:u:%s" % (prefix, args[0])
+  elif name == "enqueue_buffer":
+    return "%s:eb:%s" % (prefix, args[0])
+  elif name == "enqueue_buffer_queues":
+    return "%s:s:eb:queues" % prefix
+  elif name == "enqueue_buffer_started":
+    return "%s:s:eb:started" % prefix
+  elif name == "orphan_blobs_cursor":
+    return "%s:s:orphanblobs:cursor" % prefix
 
 
-@memoize
-def redis_zaddbyscore():
-    """ Increments multiple keys in a sorted set & returns them """
+# Minimum Redis server versions supporting a count argument for these commands
+REDIS_COUNT_VERSIONS = {
+    "lpop": (6, 2),
+    "spop": (3, 2)
+}
 
-    return context.connections.redis.register_script("""
-local zset = KEYS[1]
-local min = ARGV[1]
-local max = ARGV[2]
-local offset = ARGV[3]
-local count = ARGV[4]
-local score = ARGV[5]
 
-local data = redis.call('zrangebyscore', zset, min, max, 'LIMIT', offset, count)
-for i, member in pairs(data) do
-  redis.call('zadd', zset, score, member)
+def redis_has_count(command):
+    """ Returns True if the Redis server supports a count argument for this command """
+    version = getattr(context.connections.redis, "mrq_server_version", None) or (0, )
+    return version >= REDIS_COUNT_VERSIONS[command]
+
+
+# Lua functions shared by the dequeue scripts.
+LUA_POP_FUNCTIONS = """
+-- SPOP is non-deterministic: replicate the effects of the script so that we can keep writing after it.
+-- This is the default since Redis 5 and a no-op when unavailable.
+pcall(redis.replicate_commands)
+
+local function pop_list(queue, count, native)
+  if native then
+    return redis.call('lpop', queue, count) or {}
+  end
+  local data = {}
+  for i=1, count do
+    local current = redis.call('lpop', queue)
+    if current == false then
+      break
+    end
+    data[i] = current
+  end
+  return data
+end
+
+-- Only with SPOP count: before Redis 3.2, no write is allowed after a SPOP in a script.
+local function pop_set(queue, count)
+  return redis.call('spop', queue, count)
+end
+
+local function pop_zset(queue, count)
+  local data = redis.call('zrange', queue, 0, count - 1)
+  if #data > 0 then
+    redis.call('zremrangebyrank', queue, 0, #data - 1)
+  end
+  return data
+end
+
+-- If pushback is > 0, items are not removed but their score is set to pushback instead.
+local function pop_zset_by_score(queue, max, count, pushback)
+  local data = redis.call('zrangebyscore', queue, '-inf', max, 'LIMIT', 0, count)
+  if #data > 0 then
+    if pushback > 0 then
+      for i, member in ipairs(data) do
+        redis.call('zadd', queue, pushback, member)
+      end
+    else
+      redis.call('zremrangebyrank', queue, 0, #data - 1)
+    end
+  end
+  return data
+end
+
+-- Pops job IDs from a queue index and adds them in the "started" zset.
+local function pop_index(queue, zset_started, count, now, left)
+  local data = {}
+  local current = nil
+  for i=1, count do
+    if left then
+      current = redis.call('lpop', queue)
+    else
+      current = redis.call('rpop', queue)
+    end
+    if current == false then
+      break
+    end
+    data[i] = current
+    redis.call('zadd', zset_started, now, current)
+  end
+  return data
+end
+
+-- Once a subqueue is empty, remove it from the known subqueues in the same atomic call.
+local function remove_empty_subqueue(queue, known_subqueues, subqueue)
+  if subqueue ~= '' and redis.call('exists', queue) == 0 then
+    redis.call('srem', known_subqueues, subqueue)
+  end
 end
+"""
+
+
+@memoize
+def redis_raw_lpop():
+    """ Pops multiple items from a list with LPOP count """
+
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+local queue = KEYS[1]
+local known_subqueues = KEYS[2]
+local count = tonumber(ARGV[1])
+local subqueue = ARGV[2]
+
+local data = pop_list(queue, count, true)
+remove_empty_subqueue(queue, known_subqueues, subqueue)
 
 return data
-  """)
+""")
 
 
 @memoize
-def redis_zpopbyscore():
-    """ Pops multiple keys by score """
+def redis_raw_spop():
+    """ Pops multiple items from a set with SPOP count """
 
-    return context.connections.redis.register_script("""
-local zset = KEYS[1]
-local min = ARGV[1]
-local max = ARGV[2]
-local offset = ARGV[3]
-local count = ARGV[4]
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+local queue = KEYS[1]
+local known_subqueues = KEYS[2]
+local count = tonumber(ARGV[1])
+local subqueue = ARGV[2]
 
-local data = redis.call('zrangebyscore', zset, min, max, 'LIMIT', offset, count)
-if #data > 0 then
-  redis.call('zremrangebyrank', zset, 0, #data - 1)
-end
+local data = pop_set(queue, count)
+remove_empty_subqueue(queue, known_subqueues, subqueue)
 
 return data
-  """)
+""")
+
+
+@memoize
+def redis_remove_empty_subqueue():
+    """ Removes a subqueue from the known subqueues if it is empty """
+
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+remove_empty_subqueue(KEYS[1], KEYS[2], ARGV[1])
+return 0
+""")
+
+
+@memoize
+def redis_raw_zpop():
+    """ Pops multiple items with the lowest scores from a sorted set """
+
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+local queue = KEYS[1]
+local known_subqueues = KEYS[2]
+local count = tonumber(ARGV[1])
+local subqueue = ARGV[2]
+
+local data = pop_zset(queue, count)
+remove_empty_subqueue(queue, known_subqueues, subqueue)
+
+return data
+""")
+
+
+@memoize
+def redis_raw_zpopbyscore():
+    """ Pops multiple items with a score lower than max from a sorted set.
+        If pushback is > 0, items are not removed but their score is set to pushback instead. """
+
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+local queue = KEYS[1]
+local known_subqueues = KEYS[2]
+local max = ARGV[1]
+local count = tonumber(ARGV[2])
+local pushback = tonumber(ARGV[3])
+local subqueue = ARGV[4]
+
+local data = pop_zset_by_score(queue, max, count, pushback)
+remove_empty_subqueue(queue, known_subqueues, subqueue)
+
+return data
+""")
+
+
+@memoize
+def redis_multipop():
+    """ Pops up to N items spread across several queues, following the worker's dequeue_strategy.
+
+        Each queue has 2 keys (the queue and its known subqueues set, or the queue index and the
+        "started" zset) and 3 arguments (its type, subqueue id or index direction, pushback time).
+        Returns a list of popped items for each queue that was looked at.
+        Sets are only supported with SPOP count.
+    """
+
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
+local remaining = tonumber(ARGV[1])
+local parallel = ARGV[2] == 'parallel'
+local queues_left = tonumber(ARGV[3])
+local now = ARGV[4]
+local native_lpop = ARGV[5] == '1'
+local results = {}
+
+for i=1, #KEYS / 2 do
+
+  if remaining <= 0 then
+    break
+  end
+
+  local count = remaining
+  if parallel then
+    count = math.max(1, math.floor(remaining / (queues_left - i + 1)))
+  end
+
+  local queue = KEYS[2 * i - 1]
+  local other_key = KEYS[2 * i]
+  local queue_type = ARGV[3 * i + 3]
+  local queue_arg = ARGV[3 * i + 4]
+  local pushback = tonumber(ARGV[3 * i + 5])
+  local data = {}
+
+  if queue_type == 'index' then
+    data = pop_index(queue, other_key, count, now, queue_arg == '1')
+  else
+    if queue_type == 'timed' then
+      data = pop_zset_by_score(queue, now, count, pushback)
+    elseif queue_type == 'sorted' then
+      data = pop_zset(queue, count)
+    elseif queue_type == 'set' then
+      data = pop_set(queue, count)
+    else
+      data = pop_list(queue, count, native_lpop)
+    end
+    remove_empty_subqueue(queue, other_key, queue_arg)
+  end
+
+  remaining = remaining - #data
+  results[i] = data
+end
+
+return results
+""")
 
 
 @memoize
 def redis_lpopsafe():
     """ Safe version of LPOP that also adds the key in a "started" zset """
 
-    return context.connections.redis.register_script("""
+    return context.connections.redis.register_script(LUA_POP_FUNCTIONS + """
 local key = KEYS[1]
 local zset_started = KEYS[2]
-local count = ARGV[1]
+local count = tonumber(ARGV[1])
 local now = ARGV[2]
-local left = ARGV[3]
-local data = {}
-local current = nil
+local left = ARGV[3] == '1'
 
-for i=1, count do
-  if left == '1' then
-    current = redis.call('lpop', key)
-  else
-    current = redis.call('rpop', key)
-  end
-  if current == false then
-    return data
+return pop_index(key, zset_started, count, now, left)
+""")
+
+
+@memoize
+def redis_token_bucket():
+    """ Takes up to N tokens from a token bucket & returns how many we got.
+        A negative N puts tokens back in the bucket. """
+
+    return context.connections.redis.register_script("""
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+-- Use the server time so that all workers share the same clock.
+pcall(redis.replicate_commands)
+local time = redis.call('time')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('hmget', key, 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+
+local granted = 0
+if requested >= 0 then
+  granted = math.min(requested, math.floor(tokens))
+  tokens = tokens - granted
+else
+  tokens = math.min(burst, tokens - requested)
+end
+
+redis.call('hmset', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+
+-- A full bucket doesn't need to be stored
+redis.call('expire', key, math.ceil(burst / rate) + 1)
+
+return granted
+""")
+
+
+@memoize
+def redis_semaphore():
+    """ Counting semaphore in a sorted set. Members are holders & scores the expiry dates of their leases.
+        Actions: "acquire" returns 1 if we got a slot, "renew" extends a lease, "release" frees a slot. """
+
+    return context.connections.redis.register_script("""
+local key = KEYS[1]
+local action = ARGV[1]
+local member = ARGV[2]
+local limit = tonumber(ARGV[3])
+local lease = tonumber(ARGV[4])
+
+if action == 'release' then
+  return redis.call('zrem', key, member)
+end
+
+-- Use the server time so that all workers share the same clock.
+pcall(redis.replicate_commands)
+local time = redis.call('time')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+-- Expired leases were held by dead workers
+redis.call('zremrangebyscore', key, '-inf', now)
+
+local holder = redis.call('zscore', key, member)
+
+if action == 'renew' and not holder then
+  return 0
+end
+
+if action == 'acquire' and not holder and redis.call('zcard', key) >= limit then
+  return 0
+end
+
+redis.call('zadd', key, now + lease, member)
+redis.call('expire', key, math.ceil(lease) + 1)
+
+return 1
+""")
+
+
+@memoize
+def redis_zrem_if_older():
+    """ Removes a member from a sorted set only if its score is still lower than a max value.
+        It is also removed from the other sorted sets in KEYS. """
+
+    return context.connections.redis.register_script("""
+local score = redis.call('zscore', KEYS[1], ARGV[1])
+if score and tonumber(score) <= tonumber(ARGV[2]) then
+  for i = 2, #KEYS do
+    redis.call('zrem', KEYS[i], ARGV[1])
   end
-  data[i] = current
-  redis.call('zadd', zset_started, now, current)
+  return redis.call('zrem', KEYS[1], ARGV[1])
 end
+return 0
+""")
 
-return data
+
+@memoize
+def redis_group_job_done():
+    """ Counts a member of a job group as done, only once. Returns 1 when it was the last one. """
+
+    return context.connections.redis.register_script("""
+if redis.call('exists', KEYS[1]) == 0 then
+  return 0
+end
+
+-- A job may reach a final status twice if it was requeued
+if redis.call('sadd', KEYS[2], ARGV[1]) == 0 then
+  return 0
+end
+redis.call('expire', KEYS[2], ARGV[3])
+
+if ARGV[2] ~= '' then
+  redis.call('hincrby', KEYS[1], 'status:' .. ARGV[2], 1)
+end
+
+local remaining = redis.call('hincrby', KEYS[1], 'remaining', -1)
+if remaining <= 0 and redis.call('hsetnx', KEYS[1], 'fired', 1) == 1 then
+  return 1
+end
+return 0
+""")
+
+
+@memoize
+def redis_dependency_done():
+    """ Counts a dependency of a waiting job as done, only once. Returns 1 when it was the last one. """
+
+    return context.connections.redis.register_script("""
+if redis.call('srem', KEYS[1], ARGV[1]) == 0 then
+  return 0
+end
+
+local remaining = redis.call('decr', KEYS[2])
+if remaining <= 0 then
+  redis.call('del', KEYS[2])
+  return 1
+end
+return 0
+""")
+
+
+@memoize
+def redis_delete_if_equal():
+    """ Deletes a key only if it still has the given value """
+
+    return context.connections.redis.register_script("""
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('del', KEYS[1])
+end
+return 0
 """)
 
 
 def redis_group_command(command, cnt, redis_key):
+    if cnt > 1 and command in REDIS_COUNT_VERSIONS and redis_has_count(command):
+        return context.connections.redis.execute_command(command.upper(), redis_key, cnt) or []
+
     with context.connections.redis.pipeline(transaction=False) as pipe:
         for _ in range(cnt):
             getattr(pipe, command)(redis_key)
@@ -107,6 +107,8 @@ def subpool_imap(pool_size, func, iterable, flatten=False, unordered=False, buff
 
   if unordered:
     iterator = pool.imap_unordered(inner_func, inner_iterable(), maxsize=buffer_size or pool_size)
+  elif buffer_size:
+    iterator = pool.imap(inner_func, inner_iterable(), maxsize=buffer_size)
   else:
     iterator = pool.imap(inner_func, inner_iterable())
 
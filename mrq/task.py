@@ -5,8 +5,18 @@ class Task(object):
 
     # Are we the first task that a Job called?
     is_main_task = False
+    # Max number of jobs of this task running at the same time across all workers. 0 means no limit.
     max_concurrency = 0
 
+    # Name of a parameter to enforce max_concurrency separately for each of its values
+    max_concurrency_key = None
+
+    # Seconds after which a slot is freed if its worker died. Renewed by the worker while the job runs.
+    max_concurrency_lease = 60
+
+    # Compact encoding of the result in MongoDB, e.g. "zlib". See mrq.encoding. Overridden by the task config.
+    result_encoding = None
+
     # Default write concern values when setting status=success
     # http://docs.mongodb.org/manual/reference/write-concern/
     status_success_update_w = None
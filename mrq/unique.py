@@ -0,0 +1,66 @@
+""" Deduplication of jobs with the same task & params while one of them is in flight """
+from future.builtins import str
+import hashlib
+import ujson as json
+from bson import ObjectId
+from . import context
+from .redishelpers import redis_key, redis_delete_if_equal
+from .utils import group_iter
+
+# Default seconds a job keeps its params reserved, in case it never reaches a final status
+UNIQUE_TTL = 24 * 3600
+
+# After these statuses, the same job can be queued again
+UNIQUE_RELEASE_STATUSES = {"success", "failed", "cancel", "abort", "maxretries", "timeout"}
+
+
+def get_unique_hash(path, params):
+    """ Returns a stable hash of a task path & its params, whatever the order of their keys """
+
+    encoded = json.dumps([path, params], sort_keys=True)  # pylint: disable=no-member
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def reserve_unique_jobs(jobs_data, ttl=None):
+    """ Reserves the hash of each job in a single Redis round-trip. Returns the jobs that must be
+        inserted, and the job ID for each item of jobs_data: the ID of the job already in flight
+        for duplicates. """
+
+    with context.connections.redis.pipeline(transaction=False) as pipe:
+        for job_data in jobs_data:
+            job_data["_id"] = ObjectId()
+            job_data["unique"] = get_unique_hash(job_data["path"], job_data["params"])
+            key = redis_key("unique_job", job_data["unique"])
+            pipe.set(key, str(job_data["_id"]), nx=True, ex=int(ttl or UNIQUE_TTL))
+            pipe.get(key)
+        results = pipe.execute()
+
+    new_jobs_data = []
+    job_ids = []
+    for job_data, reserved, owner_id in zip(jobs_data, results[0::2], results[1::2]):
+        if reserved:
+            new_jobs_data.append(job_data)
+            job_ids.append(job_data["_id"])
+        else:
+            if isinstance(owner_id, bytes):
+                owner_id = owner_id.decode("utf-8")
+            job_ids.append(ObjectId(owner_id) if owner_id else None)
+
+    return new_jobs_data, job_ids
+
+
+def pipe_release_unique(pipe, unique_hash, job_id):
+    """ Frees the hash of a job, unless another job holds it already """
+
+    redis_delete_if_equal()(keys=[redis_key("unique_job", unique_hash)], args=[str(job_id)], client=pipe)
+
+
+def release_unique_jobs(jobs_data):
+    """ Frees the hashes of many jobs, with their "_id" and "unique" fields """
+
+    for jobs_group in group_iter(jobs_data, n=1000):
+        with context.connections.redis.pipeline(transaction=False) as pipe:
+            for job_data in jobs_group:
+                if job_data.get("unique"):
+                    pipe_release_unique(pipe, job_data["unique"], job_data["_id"])
+            pipe.execute()
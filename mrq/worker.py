@@ -4,7 +4,9 @@ from future.builtins import str, bytes
 from future.utils import iteritems
 import gevent
 import gevent.pool
+import gevent.event
 import os
+import math
 import signal
 import datetime
 import time
@@ -25,7 +27,7 @@ except ImportError:
 from collections import defaultdict
 from mrq.utils import load_class_by_path
 
-from .job import Job
+from .job import Job, JobStatusBuffer
 from .exceptions import (TimeoutInterrupt, StopRequested, JobInterrupt, AbortInterrupt,
                          RetryInterrupt, MaxRetriesInterrupt, MaxConcurrencyInterrupt)
 from .context import (set_current_worker, set_current_job, get_current_job, get_current_config,
@@ -34,6 +36,10 @@ from .queue import Queue
 from .utils import MongoJSONEncoder, MovingAverage
 from .processes import Process
 from .redishelpers import redis_key
+from .metrics import Metrics
+
+# With --report_compact, send a full report instead of the changed fields every N reports
+REPORT_FULL_EVERY = 60
 
 
 class Worker(Process):
@@ -49,6 +55,25 @@ class Worker(Process):
     mongodb_logs = None
     redis = None
 
+    # Write-behind buffer for job status updates, if enabled
+    status_buffer = None
+
+    # Set when new jobs are queued on our queues, with --wakeup
+    wakeup_event = None
+
+    # Min seconds between 2 polls of idle queues, with --wakeup
+    wakeup_min_backoff = 0.01
+
+    # Min seconds between 2 dequeues when all the jobs we performed were deferred
+    defer_min_backoff = 0.05
+
+    # In-process metrics, with --metrics
+    metrics = None
+
+    # Last report sent to MongoDB, with --report_compact
+    last_report = None
+    reports_count = 0
+
     def __init__(self):
 
         set_current_worker(self)
@@ -64,6 +89,26 @@ class Worker(Process):
 
         self.paused_queues = set()
 
+        # For the weighted dequeue strategy
+        self.queue_weights = {}
+        for queue_weight in (self.config["queue_weights"] or "").split(","):
+            if queue_weight.strip():
+                queue, weight = queue_weight.strip().rsplit(":", 1)
+                self.queue_weights[queue] = float(weight)
+        self.queue_credits = defaultdict(float)
+        self.queue_last_served = {}
+
+        # Running jobs holding a max_concurrency slot, by ID
+        self.concurrency_leases = {}
+
+        # Jobs deferred because all the max_concurrency slots of their task were taken
+        self.deferred_jobs = 0
+        self.defer_backoff = 0
+
+        # Task paths with a max_concurrency, and those with all their slots taken
+        self.max_concurrency_paths = {}
+        self.paths_at_capacity = set()
+
         self.connected = False  # MongoDB + Redis
 
         self.process = psutil.Process(os.getpid())
@@ -84,6 +129,14 @@ class Worker(Process):
             self.name = "%s.%s" % (socket.gethostname().split(".")[0], os.getpid())
 
         self.pool_size = self.config["greenlets"]
+
+        if self.config["metrics"]:
+            self.metrics = Metrics()
+            self.metrics.describe("mrq_events_total", "Events sent to metric(), by name")
+            self.metrics.describe("mrq_jobs_total", "Jobs performed, by task path, queue and final status")
+            self.metrics.describe("mrq_job_queued_seconds", "Time between datequeued and datestarted")
+            self.metrics.describe("mrq_job_run_seconds", "Time spent in the code of the task")
+            self.metrics.describe("mrq_job_save_seconds", "Time spent around the task, mostly saving its status")
         self.pool_usage_average = MovingAverage((60 / self.config["report_interval"] or 1))
 
         self.set_logger()
@@ -171,6 +224,100 @@ class Worker(Process):
             finally:
                 time.sleep(self.config["report_interval"])
 
+    def greenlet_status_buffer(self):
+        """ This greenlet flushes buffered job status updates every N seconds """
+
+        while True:
+            time.sleep(self.status_buffer.interval)
+            try:
+                self.status_buffer.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                self.log.error("When flushing job status updates: %s" % e)
+
+    def greenlet_enqueue_buffer(self):
+        """ This greenlet writes the jobs of the enqueue buffer in MongoDB every N seconds """
+
+        from .enqueue_buffer import flush_enqueue_buffer
+
+        while True:
+            time.sleep(self.config["enqueue_buffer_interval"])
+            try:
+                flush_enqueue_buffer()
+            except Exception as e:  # pylint: disable=broad-except
+                self.log.error("When flushing the enqueue buffer: %s" % e)
+
+    def greenlet_metrics(self):
+        """ This greenlet pushes the metrics to statsd every N seconds """
+
+        while True:
+            time.sleep(self.config["metrics_statsd_interval"])
+            try:
+                self.metrics.push_statsd(self.config["metrics_statsd"], prefix=self.config["metrics_statsd_prefix"])
+            except Exception as e:  # pylint: disable=broad-except
+                self.log.debug("Metrics push failed: %s" % e)
+
+    def greenlet_wakeup(self):
+        """ This greenlet listens to the wakeup messages of our queues, so that
+            work_wait() returns as soon as new jobs are queued. """
+
+        channels = list({redis_key("wakeup", queue) for queue in self.queues})
+
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(*channels)
+                for _ in pubsub.listen():
+                    self.wakeup_event.set()
+            except Exception as e:  # pylint: disable=broad-except
+                self.log.error("When listening to wakeup messages: %s" % e)
+                # Poll the queues while we are disconnected
+                self.wakeup_event.set()
+                time.sleep(1)
+            finally:
+                pubsub.close()
+
+    def greenlet_concurrency_leases(self):
+        """ This greenlet renews the max_concurrency leases of running jobs before they expire """
+
+        while True:
+            time.sleep(1)
+
+            now = time.time()
+            jobs = [
+                job for job in list(self.concurrency_leases.values())
+                if now - job.concurrency_lease_renewed >= job.task.max_concurrency_lease / 3.
+            ]
+            if len(jobs) == 0:
+                continue
+
+            try:
+                with self.redis.pipeline(transaction=False) as pipe:
+                    for job in jobs:
+                        job.renew_concurrency_lease(pipe=pipe)
+                    pipe.execute()
+            except Exception as e:  # pylint: disable=broad-except
+                self.log.error("When renewing max_concurrency leases: %s" % e)
+
+    def refresh_paths_at_capacity(self):
+        """ Updates the set of task paths that have all their max_concurrency slots taken,
+            so that we don't dequeue jobs that couldn't run. """
+
+        if len(self.max_concurrency_paths) == 0:
+            return
+
+        paths = list(self.max_concurrency_paths)
+        now = time.time()
+
+        with self.redis.pipeline(transaction=False) as pipe:
+            for path in paths:
+                pipe.zcount(self.max_concurrency_paths[path][0], now, "+inf")
+            counts = pipe.execute()
+
+        self.paths_at_capacity = {
+            path for path, count in zip(paths, counts)
+            if count >= self.max_concurrency_paths[path][1]
+        }
+
     def greenlet_logs(self):
         """ This greenlet always runs in background to update current
             logs in MongoDB every 10 seconds.
@@ -227,7 +374,13 @@ class Worker(Process):
           self.paused_queues = self.get_paused_queues()
           time.sleep(self.config["paused_queues_refresh_interval"])
 
-    def get_memory(self):
+    def get_memory(self, full=True):
+        """ Returns the memory used by the worker process. Unless full is set, only the RSS is read
+            from memory_info(), which is much cheaper than parsing all the memory maps. """
+
+        if not full:
+            rss = self.process.memory_info().rss
+            return {"total": rss, "rss": rss, "swap": 0}
 
         try:
 
@@ -244,24 +397,42 @@ class Worker(Process):
         except Exception as e:
             return {"total": 0, "rss": 0, "swap": 0}
 
-    def get_worker_report(self, with_memory=False):
+    def get_greenlet_stack(self, greenlet):
+        """ Returns the stack of a greenlet, up to the gevent hub """
+
+        short_stack = []
+        stack = traceback.format_stack(greenlet.gr_frame)
+        for s in stack[1:]:
+            if "/gevent/hub.py" in s:
+                break
+            short_stack.append(s)
+        return short_stack
+
+    def get_worker_report(self, with_memory=False, compact=False):
         """ Returns a dict containing all the data we can about the current status of the worker and
-            its jobs. """
+            its jobs.
+
+            In compact mode, only the stacks of the --report_stacks oldest jobs are included, the memory
+            is only the RSS, and the progress of jobs is not saved (see report_worker). """
+
+        pool_jobs = [(greenlet, get_current_job(id(greenlet))) for greenlet in list(self.gevent_pool)]
+
+        stack_greenlets = None
+        if compact:
+            oldest = sorted(
+                [(job.datestarted, id(greenlet)) for greenlet, job in pool_jobs if job and job.datestarted]
+            )[:self.config["report_stacks"]]
+            stack_greenlets = {greenlet_id for _, greenlet_id in oldest}
 
         greenlets = []
-        for greenlet in list(self.gevent_pool):
+        for greenlet, job in pool_jobs:
             g = {}
-            short_stack = []
-            stack = traceback.format_stack(greenlet.gr_frame)
-            for s in stack[1:]:
-                if "/gevent/hub.py" in s:
-                    break
-                short_stack.append(s)
-            g["stack"] = short_stack
+            if stack_greenlets is None or id(greenlet) in stack_greenlets:
+                g["stack"] = self.get_greenlet_stack(greenlet)
 
-            job = get_current_job(id(greenlet))
             if job:
-                job.save()
+                if not compact:
+                    job.save()
                 if job.data:
                     g["path"] = job.data["path"]
                 g["datestarted"] = job.datestarted
@@ -291,7 +462,7 @@ class Worker(Process):
                 "system": cpu_times.system,
                 "percent": self.process.cpu_percent(0)
             }
-            mem = self.get_memory()
+            mem = self.get_memory(full=not compact)
 
         # Avoid sharing passwords or sensitive config!
         whitelisted_config = [
@@ -321,6 +492,12 @@ class Worker(Process):
         used_pool_slots = len(self.gevent_pool)
         used_avg = self.pool_usage_average.next(used_pool_slots)
 
+        # Log lines that the log handlers couldn't write
+        logs = {}
+        for handler in self.log.handlers:
+            for k, v in iteritems(getattr(handler, "stats", None) or {}):
+                logs[k] = logs.get(k, 0) + v
+
         return {
             "status": self.status,
             "config": {k: v for k, v in iteritems(self.config) if k in whitelisted_config},
@@ -330,6 +507,7 @@ class Worker(Process):
             "datereported": datetime.datetime.utcnow(),
             "name": self.name,
             "io": io,
+            "logs": logs,
             "_id": str(self.id),
             "process": {
                 "pid": self.process.pid,
@@ -348,7 +526,16 @@ class Worker(Process):
 
     def report_worker(self, w=0):
 
-        report = self.get_worker_report(with_memory=True)
+        # Don't report done jobs that aren't written yet
+        if self.status_buffer is not None:
+            self.status_buffer.flush()
+
+        compact = self.config["report_compact"]
+
+        if compact:
+            Job.save_many([get_current_job(id(greenlet)) for greenlet in list(self.gevent_pool)])
+
+        report = self.get_worker_report(with_memory=True, compact=compact)
 
         if self.config["max_memory"] > 0:
             if report["process"]["mem"]["total"] > (self.config["max_memory"] * 1024 * 1024):
@@ -361,12 +548,21 @@ class Worker(Process):
         if "_id" in report:
             del report["_id"]
 
+        # Only send the fields that changed since the last report, with a full one from time to time
+        updates = report
+        if compact:
+            if self.last_report is not None and self.reports_count % REPORT_FULL_EVERY != 0:
+                updates = {k: v for k, v in iteritems(report) if self.last_report.get(k) != v}
+            self.reports_count += 1
+
         try:
 
             self.mongodb_jobs.mrq_workers.update({
                 "_id": ObjectId(self.id)
-            }, {"$set": report}, upsert=True, w=w)
+            }, {"$set": updates}, upsert=True, w=w)
+            self.last_report = report
         except Exception as e:  # pylint: disable=broad-except
+            self.last_report = None
             self.log.debug("Worker report failed: %s" % e)
 
     def greenlet_timeouts(self):
@@ -406,8 +602,15 @@ class Worker(Process):
             status = "200 OK"
             res = ""
             if path in ["/", "/report", "/report_mem"]:
-                report = self.get_worker_report(with_memory=(path == "/report_mem"))
+                report = self.get_worker_report(with_memory=(path == "/report_mem"), compact=self.config["report_compact"])
+                res = bytes(json_stdlib.dumps(report, cls=MongoJSONEncoder), 'utf-8')
+            elif path == "/report_full":
+                # All the stacks and memory maps, even in compact mode
+                report = self.get_worker_report(with_memory=True)
                 res = bytes(json_stdlib.dumps(report, cls=MongoJSONEncoder), 'utf-8')
+            elif path == "/metrics" and self.metrics is not None:
+                start_response(status, [('Content-Type', 'text/plain; version=0.0.4')])
+                return [bytes(self.metrics.to_prometheus(), 'utf-8')]
             elif path == "/wait_for_idle":
                 self.wait_for_idle()
                 res = bytes("idle", "utf-8")
@@ -452,6 +655,8 @@ class Worker(Process):
                 outcome, dequeue_jobs = self.work_once(free_pool_slots=1, max_jobs=None)
 
                 if outcome == "wait" and dequeue_jobs == 0:
+                    if self.status_buffer is not None:
+                        self.status_buffer.flush()
                     break
 
     def work(self):
@@ -486,6 +691,25 @@ class Worker(Process):
             self.greenlets["admin"] = gevent.spawn(self.greenlet_admin)
 
         self.greenlets["timeouts"] = gevent.spawn(self.greenlet_timeouts)
+        self.greenlets["concurrency_leases"] = gevent.spawn(self.greenlet_concurrency_leases)
+
+        if self.config["wakeup"]:
+            self.wakeup_event = gevent.event.Event()
+            self.wakeup_backoff = self.wakeup_min_backoff
+            self.greenlets["wakeup"] = gevent.spawn(self.greenlet_wakeup)
+
+        if self.metrics is not None and self.config["metrics_statsd"]:
+            self.greenlets["metrics"] = gevent.spawn(self.greenlet_metrics)
+
+        if self.config["status_batch_size"] > 0:
+            self.status_buffer = JobStatusBuffer(
+                self.config["status_batch_size"],
+                self.config["status_batch_interval"]
+            )
+            self.greenlets["status_buffer"] = gevent.spawn(self.greenlet_status_buffer)
+
+        if self.config["enqueue_buffer_interval"] > 0:
+            self.greenlets["enqueue_buffer"] = gevent.spawn(self.greenlet_enqueue_buffer)
 
         if self.config["scheduler"] and self.config["scheduler_interval"] > 0:
 
@@ -507,6 +731,7 @@ class Worker(Process):
         try:
 
             max_time_reached = False
+            previous_done_jobs, previous_deferred_jobs = self.done_jobs, self.deferred_jobs
 
             while True:
 
@@ -543,6 +768,9 @@ class Worker(Process):
                 if max_time_reached:
                     break
 
+                self.backoff_deferred_jobs(previous_done_jobs, previous_deferred_jobs)
+                previous_done_jobs, previous_deferred_jobs = self.done_jobs, self.deferred_jobs
+
                 self.status = "spawn"
                 with self.work_lock:
                     outcome, dequeue_jobs = self.work_once(free_pool_slots=free_pool_slots, max_jobs=max_jobs)
@@ -553,6 +781,8 @@ class Worker(Process):
 
                 if outcome == "wait":
                     self.work_wait()
+                elif self.wakeup_event is not None:
+                    self.wakeup_backoff = self.wakeup_min_backoff
 
         except StopRequested:
             pass
@@ -577,42 +807,38 @@ class Worker(Process):
             lifetime.total_seconds(), self.done_jobs, job_rate
         ))
 
+    def backoff_deferred_jobs(self, previous_done_jobs, previous_deferred_jobs):
+        """ Sleeps when all the jobs done since the last dequeue were deferred because of max_concurrency.
+            They are queued again right away, so we would dequeue them again in a busy loop. The sleep
+            doubles up to max_latency until we perform another job. """
+
+        deferred = self.deferred_jobs - previous_deferred_jobs
+
+        if deferred > 0 and deferred == self.done_jobs - previous_done_jobs:
+            self.defer_backoff = min(max(self.defer_backoff * 2, self.defer_min_backoff), self.config["max_latency"])
+            self.status = "wait"
+            gevent.sleep(self.defer_backoff)
+
+        elif self.done_jobs > previous_done_jobs:
+            self.defer_backoff = 0
+
     def work_once(self, free_pool_slots=1, max_jobs=None):
         """ Does one lookup for new jobs, inside the inner work loop """
 
         dequeued_jobs = 0
 
+        self.refresh_paths_at_capacity()
+
         available_queues = [
             queue for queue in self.queues
             if queue.root_id not in self.paused_queues and
             queue.id not in self.paused_queues
         ]
 
-        for queue_i in range(len(available_queues)):
-
-            queue = available_queues[(queue_i + self.queue_offset) % len(available_queues)]
-
-            max_jobs_per_queue = free_pool_slots - dequeued_jobs
-
-            if max_jobs_per_queue <= 0:
-                queue_i -= 1
-                break
-
-            if self.config["dequeue_strategy"] == "parallel":
-                max_jobs_per_queue = max(1, int(max_jobs_per_queue / (len(available_queues) - queue_i)))
-
-            for job in queue.dequeue_jobs(
-                max_jobs=max_jobs_per_queue,
-                job_class=self.job_class,
-                worker=self
-            ):
-                dequeued_jobs += 1
-
-                self.gevent_pool.spawn(self.perform_job, job)
-
-        # At the next pass, start at the next queue to avoid always dequeuing the same one
-        if self.config["dequeue_strategy"] == "parallel":
-            self.queue_offset = (self.queue_offset + queue_i + 1) % len(self.queues)
+        if self.config["dequeue_strategy"] == "weighted":
+            dequeued_jobs = self.work_once_weighted(available_queues, free_pool_slots)
+        else:
+            dequeued_jobs = self.work_once_ordered(available_queues, free_pool_slots)
 
         # TODO consider this when dequeuing jobs to have strict limits
         if max_jobs and self.done_jobs >= max_jobs:
@@ -631,10 +857,165 @@ class Worker(Process):
 
         return None, dequeued_jobs
 
+    def work_once_ordered(self, available_queues, free_pool_slots):
+        """ Dequeues queues in order, for the sequential, parallel and burst strategies """
+
+        dequeued_jobs = 0
+
+        # Number of queues we looked at
+        queue_i = 0
+
+        while queue_i < len(available_queues):
+
+            max_jobs_per_queue = free_pool_slots - dequeued_jobs
+
+            if max_jobs_per_queue <= 0:
+                break
+
+            # Consecutive queues that can all be dequeued from Redis are done in a single call
+            multi_queues = self.get_multi_dequeue_queues(available_queues, queue_i)
+
+            if len(multi_queues) > 1:
+
+                looked_at, jobs = Queue.dequeue_jobs_multi(
+                    multi_queues,
+                    max_jobs=max_jobs_per_queue,
+                    parallel=(self.config["dequeue_strategy"] == "parallel"),
+                    queues_left=len(available_queues) - queue_i,
+                    job_class=self.job_class,
+                    worker=self
+                )
+                queue_i += looked_at
+
+            else:
+
+                queue = available_queues[(queue_i + self.queue_offset) % len(available_queues)]
+
+                if self.config["dequeue_strategy"] == "parallel":
+                    max_jobs_per_queue = max(1, int(max_jobs_per_queue / (len(available_queues) - queue_i)))
+
+                jobs = queue.dequeue_jobs(
+                    max_jobs=max_jobs_per_queue,
+                    job_class=self.job_class,
+                    worker=self
+                )
+                queue_i += 1
+
+            dequeued_jobs += self.spawn_jobs(jobs)
+
+        # At the next pass, start at the next queue to avoid always dequeuing the same one
+        if self.config["dequeue_strategy"] == "parallel":
+            self.queue_offset = (self.queue_offset + queue_i) % len(self.queues)
+
+        return dequeued_jobs
+
+    def get_queue_weight(self, queue):
+        """ Returns the weight of a queue for the weighted dequeue strategy, with aging if enabled """
+
+        weight = self.queue_weights.get(queue.id, self.queue_weights.get(queue.root_id, 1.))
+
+        # Queues that were not dequeued for a while get a growing share of the slots
+        aging = self.config["queue_weights_aging"]
+        if aging > 0 and queue.id in self.queue_last_served:
+            weight *= 1 + (time.time() - self.queue_last_served[queue.id]) / aging
+
+        return weight
+
+    def work_once_weighted(self, available_queues, free_pool_slots):
+        """ Shares the free pool slots between queues in proportion to their weights.
+
+            Each queue accumulates credits in proportion to its weight and spends one credit
+            per dequeued job, so that the shares are respected over time even with a single
+            free slot. Empty queues don't accumulate credits. Slots left unused by empty queues
+            are then given to the others.
+        """
+
+        if len(available_queues) == 0 or free_pool_slots <= 0:
+            return 0
+
+        weights = {queue.id: self.get_queue_weight(queue) for queue in available_queues}
+        total_weight = sum(weights.values()) or 1.
+
+        now = time.time()
+        for queue in available_queues:
+            self.queue_credits[queue.id] += free_pool_slots * weights[queue.id] / total_weight
+            self.queue_last_served.setdefault(queue.id, now)
+
+        dequeued_jobs = 0
+        non_empty_queues = []
+
+        for queue in sorted(available_queues, key=lambda q: -self.queue_credits[q.id]):
+
+            remaining = free_pool_slots - dequeued_jobs
+            if remaining <= 0:
+                break
+
+            max_jobs = min(remaining, max(1, int(math.ceil(self.queue_credits[queue.id]))))
+            count = self.spawn_jobs(queue.dequeue_jobs(max_jobs=max_jobs, job_class=self.job_class, worker=self))
+            dequeued_jobs += count
+
+            self.queue_last_served[queue.id] = now
+            self.queue_credits[queue.id] -= count
+            if count < max_jobs:
+                self.queue_credits[queue.id] = 0
+            else:
+                non_empty_queues.append(queue)
+
+        # Don't leave slots unused while some queues still have jobs
+        for queue in non_empty_queues:
+
+            remaining = free_pool_slots - dequeued_jobs
+            if remaining <= 0:
+                break
+
+            count = self.spawn_jobs(queue.dequeue_jobs(max_jobs=remaining, job_class=self.job_class, worker=self))
+            dequeued_jobs += count
+            self.queue_credits[queue.id] -= count
+
+        return dequeued_jobs
+
+    def spawn_jobs(self, jobs):
+        """ Starts jobs in the greenlet pool. Returns how many were started. """
+
+        count = 0
+        for job in jobs:
+            count += 1
+            self.gevent_pool.spawn(self.perform_job, job)
+        return count
+
+    def get_multi_dequeue_queues(self, available_queues, queue_i):
+        """ Returns the consecutive queues starting at queue_i that can be dequeued together
+            with Queue.dequeue_jobs_multi() """
+
+        multi_queues = []
+        current_time = time.time()
+
+        for i in range(queue_i, len(available_queues)):
+            queue = available_queues[(i + self.queue_offset) % len(available_queues)]
+            if queue.get_multi_dequeue_params(current_time) is None:
+                break
+            multi_queues.append(queue)
+
+        return multi_queues
+
     def work_wait(self):
         """ Wait for new jobs to arrive """
 
-        if len(self.queues_with_notify) > 0:
+        if self.wakeup_event is not None:
+
+            # Jobs may have been queued while we were dequeuing: in that case the event is
+            # already set and we don't wait at all.
+            woken_up = self.wakeup_event.wait(timeout=self.wakeup_backoff)
+            self.wakeup_event.clear()
+
+            # Without any message, poll less and less often. Some jobs may become ready
+            # without being queued (timed raw queues) or be queued without --wakeup.
+            if woken_up:
+                self.wakeup_backoff = self.wakeup_min_backoff
+            else:
+                self.wakeup_backoff = min(self.wakeup_backoff * 2, self.config["max_latency"])
+
+        elif len(self.queues_with_notify) > 0:
             # https://github.com/antirez/redis/issues/874
             connections.redis.blpop(*(self.queues_with_notify + [max(1, int(self.config["max_latency"]))]))
         else:
@@ -676,12 +1057,15 @@ class Worker(Process):
 
         set_current_job(job)
 
+        perform_start = time.time()
+
         try:
             job.perform()
 
         except MaxConcurrencyInterrupt:
-            self.log.error("Max concurrency reached")
-            job._save_status("maxconcurrency", exception=True)
+            self.log.debug("Max concurrency reached, deferring job %s" % job.id)
+            job.defer()
+            self.deferred_jobs += 1
 
         except RetryInterrupt:
             self.log.error("Caught retry")
@@ -713,9 +1097,30 @@ class Worker(Process):
 
             self.done_jobs += 1
 
+            if self.metrics is not None:
+                self.observe_job_metrics(job, time.time() - perform_start)
+
             if self.config["trace_memory"]:
                 job.trace_memory_stop()
 
+    def observe_job_metrics(self, job, total_time):
+        """ Records the metrics of a job that was just performed """
+
+        if not job.data:
+            return
+
+        labels = (("path", job.data.get("path")), ("queue", job.data.get("queue")))
+
+        self.metrics.incr("mrq_jobs_total", 1, labels + (("status", job.data.get("status")), ))
+
+        if job.datestarted and job.data.get("datequeued"):
+            self.metrics.observe(
+                "mrq_job_queued_seconds", (job.datestarted - job.data["datequeued"]).total_seconds(), labels)
+
+        if job.run_time is not None:
+            self.metrics.observe("mrq_job_run_seconds", job.run_time, labels)
+            self.metrics.observe("mrq_job_save_seconds", max(0, total_time - job.run_time), labels)
+
     def shutdown_graceful(self):
         """ Graceful shutdown: waits for all the jobs to finish. """
 
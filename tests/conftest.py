@@ -290,6 +290,9 @@ class RedisFixture(ProcessFixture):
     def flush(self):
         connections.redis.flushall()
 
+        # The registry of known queues was flushed too
+        Queue.registered_at.clear()
+
 
 class MongoFixture(ProcessFixture):
 
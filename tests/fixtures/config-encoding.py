@@ -0,0 +1,6 @@
+TASKS = {
+    "tests.tasks.general.ReturnParams": {
+        "params_encoding": "zlib",
+        "result_encoding": "zlib"
+    }
+}
@@ -0,0 +1,7 @@
+
+LOG_HANDLERS = {
+  "mrq.logger.MongoHandler": {
+    "max_job_lines": 100,
+    "flush_size": 1000
+  }
+}
@@ -0,0 +1,5 @@
+QUEUES_CONFIG = {
+    "prio": {
+        "priority": True
+    }
+}
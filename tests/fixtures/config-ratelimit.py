@@ -0,0 +1,15 @@
+QUEUES_CONFIG = {
+    "limited": {
+        "rate_limit": (10, 5)
+    },
+    "limited_raw": {
+        "rate_limit": (10, 5),
+        "job_factory": lambda rawparam: {
+            "path": "tests.tasks.general.Add",
+            "params": {
+                "a": int(rawparam),
+                "b": 0
+            }
+        }
+    }
+}
@@ -0,0 +1,8 @@
+QUEUES_CONFIG = {
+    "indexed": {
+        "redis_index": True
+    },
+    "indexed2": {
+        "redis_index": True
+    }
+}
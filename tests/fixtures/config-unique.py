@@ -0,0 +1,5 @@
+TASKS = {
+    "tests.tasks.general.Add": {
+        "unique": True
+    }
+}
@@ -16,3 +16,26 @@ class LockedAdd(Add):
             time.sleep(params.get("sleep", 0))
 
         return res
+
+
+class LimitedAddByKey(LockedAdd):
+
+    max_concurrency = 1
+    max_concurrency_key = "a"
+
+
+class ConcurrencyCounter(LockedAdd):
+    """ Returns the max number of jobs of this task we have seen running at the same time """
+
+    max_concurrency = 2
+
+    def run(self, params):
+        from mrq.context import connections
+        key = "tests:concurrency_counter"
+        current = connections.redis.incr(key)
+        connections.redis.zadd("tests:concurrency_max", **{str(current): current})
+        try:
+            time.sleep(params.get("sleep", 0))
+        finally:
+            connections.redis.decr(key)
+        return current
@@ -25,3 +25,13 @@ class Simple(Task):
             log.info("Mat\xc3\xa9riels d'entra\xc3\xaenement")
 
         return True
+
+
+class Lines(Task):
+
+    def run(self, params):
+
+        for i in range(params["count"]):
+            log.info("Line %s %s" % (i, "x" * params.get("size", 10)))
+
+        return True
@@ -1,6 +1,7 @@
 import pytest
 from mrq.agent import Agent
 from mrq.context import connections
+from mrq.redishelpers import redis_key
 import time
 from mrq.job import Job, get_job_result
 import psutil
@@ -308,3 +309,45 @@ def test_agent_multiple_processes(worker):
     pids_after = psutil.pids()
     # make sure there are 4 workers running
     assert len(pids_before) + 4 == len(pids_after)
+
+
+def test_agent_queuestats(worker):
+
+    from mrq.queue import Queue
+    from mrq.job import queue_raw_jobs, queue_jobs
+
+    worker.start(queues="default")
+
+    queue_jobs("tests.tasks.general.Add", [{"a": 41, "b": 1}] * 3, queue="stats1")
+    queue_raw_jobs("test_timed_set", {"a": time.time() - 10, "b": time.time() + 3600})
+    queue_raw_jobs("test_raw/sub1", ["a", "b"])
+    queue_raw_jobs("test_raw/sub2", ["c"])
+
+    counts = Queue.collect_stats(["stats1", "test_timed_set", "test_raw/sub1", "test_raw/sub2", "test_raw/"])
+    assert counts["stats1"] == (3, 3)
+    assert counts["test_timed_set"] == (2, 1)
+    assert counts["test_raw/sub1"] == (2, 2)
+    assert counts["test_raw/"] == (3, 3)
+
+    agent = Agent(worker_group="xx")
+    agent.queuestats()
+
+    stats = Queue.get_stats()
+    assert stats["stats1"]["size"] == 3
+    assert stats["stats1"]["eta"] is None
+    assert stats["test_timed_set"]["jobs_to_dequeue"] == 1
+    assert stats["test_timed_set"]["size"] == 2
+
+    assert set(Queue.get_stats(queue_ids=["stats1", "unknown"])) == set(["stats1"])
+    assert Queue.get_stats(max_age=-10) == {}
+
+    # Emptied queues are removed from the cache once they are not known anymore
+    Queue("test_raw/sub2").empty()
+    connections.redis.zrem(redis_key("known_queues"), "test_raw/sub2")
+    connections.redis.zrem(redis_key("known_queues_lex"), "test_raw/sub2")
+    connections.redis.srem(Queue("test_raw").redis_key_known_subqueues, "test_raw/sub2")
+    agent.queuestats()
+
+    stats = Queue.get_stats()
+    assert "test_raw/sub2" not in stats
+    assert stats["test_raw/"]["size"] == 2
@@ -0,0 +1,57 @@
+from mrq.job import Job, get_job_result
+from mrq.context import set_current_config, get_config, run_task
+from mrq.blobstore import is_blob_ref, get_blob_store
+import datetime
+import shutil
+import pytest
+
+
+@pytest.mark.parametrize(["p_store"], [["gridfs"], ["file:///tmp/mrq_tests_blobs"]])
+def test_blob_store(worker, p_store):
+
+    shutil.rmtree("/tmp/mrq_tests_blobs", ignore_errors=True)
+
+    set_current_config(get_config(sources=("env", ), extra={
+        "blob_store": p_store,
+        "blob_threshold": 1000,
+        "blob_fields": "params,result"
+    }))
+
+    worker.start(flags="--blob_store %s --blob_threshold 1000 --blob_fields params,result" % p_store)
+
+    small = worker.send_task("tests.tasks.general.ReturnParams", {"a": "x"})
+    assert small == {"a": "x"}
+
+    params = {"a": "x" * 10000}
+    result = worker.send_task("tests.tasks.general.ReturnParams", params)
+    assert result == params
+
+    job_data = worker.mongodb_jobs.mrq_jobs.find_one({"params.a": "x"})
+    assert job_data["result"] == {"a": "x"}
+
+    job_data = worker.mongodb_jobs.mrq_jobs.find_one({"params.a": {"$ne": "x"}})
+    assert is_blob_ref(job_data["params"])
+    assert is_blob_ref(job_data["result"])
+
+    assert get_job_result(job_data["_id"])["result"] == params
+    assert Job(job_data["_id"]).fetch().data["params"] == params
+
+    # Blobs are kept while their job references them
+    assert run_task("mrq.basetasks.cleaning.CleanOrphanBlobs", {"timeout": 0}) == {"checked": 2, "deleted": 0}
+
+    # Each run continues after the last blob checked by the previous one
+    for checked in [1, 1, 0]:
+        assert run_task("mrq.basetasks.cleaning.CleanOrphanBlobs", {"timeout": 0, "limit": 1}) == {
+            "checked": checked, "deleted": 0
+        }
+
+    # Other files in the directory are left alone
+    if p_store.startswith("file://"):
+        with open("/tmp/mrq_tests_blobs/README", "w") as f:
+            f.write("x")
+        assert len(list(get_blob_store().list_blobs(datetime.datetime(2100, 1, 1)))) == 2
+
+    worker.mongodb_jobs.mrq_jobs.delete_many({})
+
+    assert run_task("mrq.basetasks.cleaning.CleanOrphanBlobs", {"timeout": 0}) == {"checked": 2, "deleted": 2}
+    assert len(list(get_blob_store().list_blobs(datetime.datetime(2100, 1, 1)))) == 0
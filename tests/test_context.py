@@ -1,3 +1,6 @@
+from future import standard_library
+standard_library.install_aliases()
+import urllib.request
 import json
 import os
 from collections import defaultdict
@@ -115,3 +118,21 @@ def test_context_setup():
     out, err = process.communicate()
 
     assert out.endswith(b"42\ntestname1\n")
+
+
+def test_context_metrics_prometheus(worker):
+
+    worker.start(flags="--metrics")
+
+    worker.send_tasks("tests.tasks.general.Add", [{"a": 41, "b": 1, "sleep": 0.1}] * 3)
+    worker.send_task("tests.tasks.general.RaiseException", {}, accept_statuses=["failed"])
+
+    metrics = urllib.request.urlopen("http://localhost:%s/metrics" % worker.admin_port).read().decode("utf-8")
+
+    assert 'mrq_jobs_total{path="tests.tasks.general.Add",queue="default",status="success"} 3.0' in metrics
+    assert 'mrq_jobs_total{path="tests.tasks.general.RaiseException",queue="default",status="failed"} 1.0' in metrics
+    assert 'mrq_job_run_seconds_count{path="tests.tasks.general.Add",queue="default"} 3' in metrics
+    assert 'mrq_job_queued_seconds_count{path="tests.tasks.general.Add",queue="default"} 3' in metrics
+    assert 'mrq_job_save_seconds_count{path="tests.tasks.general.Add",queue="default"} 3' in metrics
+    assert 'mrq_job_run_seconds_bucket{path="tests.tasks.general.Add",queue="default",le="0.0905097"} 0' in metrics
+    assert 'mrq_events_total{name="jobs.status.started"} 4.0' in metrics
@@ -0,0 +1,63 @@
+from mrq.job import Job, queue_job, queue_jobs
+import time
+
+
+def test_dependencies(worker):
+
+    worker.start(flags="--greenlets 5")
+
+    first = queue_job("tests.tasks.general.Add", {"a": 1, "b": 1, "sleep": 1})
+    second = queue_job("tests.tasks.general.Add", {"a": 2, "b": 2, "sleep": 2})
+
+    # A DAG: third waits for first & second, fourth waits for third
+    third = queue_job("tests.tasks.general.Add", {"a": 3, "b": 3}, depends_on=[first, second])
+    fourth = queue_job("tests.tasks.general.Add", {"a": 4, "b": 4}, depends_on=[third])
+
+    assert Job(third).fetch().data["status"] == "waiting"
+    assert Job(fourth).fetch().data["status"] == "waiting"
+
+    Job(first).wait(poll_interval=0.01, timeout=5)
+    time.sleep(0.2)
+    assert Job(third).fetch().data["status"] == "waiting"
+
+    assert Job(fourth).wait(poll_interval=0.01, timeout=10)["result"] == 8
+
+    data = {job_id: Job(job_id).fetch().data for job_id in (second, third, fourth)}
+    assert data[third]["datestarted"] >= data[second]["dateupdated"]
+    assert data[fourth]["datestarted"] >= data[third]["dateupdated"]
+
+
+def test_dependencies_already_done(worker):
+
+    worker.start()
+
+    job_id = worker.send_task("tests.tasks.general.Add", {"a": 1, "b": 1}, block=False)
+    Job(job_id).wait(poll_interval=0.01, timeout=5)
+
+    # Dependencies that succeeded before are resolved right away
+    job_ids = queue_jobs("tests.tasks.general.Add", [{"a": 1, "b": i} for i in range(3)], depends_on=[job_id])
+    for i, dependent_id in enumerate(job_ids):
+        assert Job(dependent_id).wait(poll_interval=0.01, timeout=5)["result"] == 1 + i
+
+
+def test_dependencies_failed(worker):
+
+    worker.start()
+
+    failed_id = queue_job("tests.tasks.general.RaiseException", {"message": "x"})
+    job_id = queue_job("tests.tasks.general.Add", {"a": 1, "b": 1}, depends_on=[failed_id])
+    next_id = queue_job("tests.tasks.general.Add", {"a": 2, "b": 2}, depends_on=[job_id])
+
+    # Waiting jobs expire if their dependencies never finish
+    assert Job(job_id).fetch().data["dateexpires"]
+
+    Job(failed_id).wait(poll_interval=0.01, timeout=5)
+
+    # Dependents of a failed job are cancelled, and theirs too
+    assert Job(job_id).wait(poll_interval=0.01, timeout=5)["status"] == "cancel"
+    assert Job(next_id).wait(poll_interval=0.01, timeout=5)["status"] == "cancel"
+    assert worker.mongodb_jobs.mrq_jobs.count({"status": "queued"}) == 0
+
+    # Also when the dependency failed before they were queued
+    late_id = queue_job("tests.tasks.general.Add", {"a": 3, "b": 3}, depends_on=[failed_id])
+    assert Job(late_id).fetch().data["status"] == "cancel"
@@ -0,0 +1,45 @@
+from mrq.job import Job, get_job_result
+from mrq.context import set_current_config, get_config
+from mrq.encoding import encode, decode, is_encoded, ENCODINGS
+import datetime
+import pytest
+
+
+@pytest.mark.parametrize(["p_encoding"], [[e] for e in sorted(ENCODINGS)])
+def test_encoding_roundtrip(p_encoding):
+
+    if p_encoding.startswith("msgpack"):
+        pytest.importorskip("msgpack")
+        value = {"a": [1, 2.5, None, True], "b": {"c": "x" * 1000}}
+    else:
+        value = {"a": [1, 2.5, None, True], "b": {"c": "x" * 1000}, "d": datetime.datetime(2020, 1, 1)}
+    if p_encoding.endswith("zstd"):
+        pytest.importorskip("zstandard")
+
+    encoded = encode(value, p_encoding)
+    assert is_encoded(encoded)
+    assert decode(encoded) == value
+    assert decode(value) == value
+    assert encode(value, None) is value
+
+
+def test_encoding_job(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-encoding.py"))
+
+    worker.start(flags="--config tests/fixtures/config-encoding.py")
+
+    params = {"a": "x" * 10000, "b": 1}
+    result = worker.send_task("tests.tasks.general.ReturnParams", params)
+    assert result == params
+
+    # Stored as compressed binaries
+    job_data = worker.mongodb_jobs.mrq_jobs.find_one()
+    assert is_encoded(job_data["params"])
+    assert is_encoded(job_data["result"])
+    assert len(job_data["result"]) < 1000
+
+    # ... and decoded transparently
+    assert get_job_result(job_data["_id"])["result"] == params
+    assert Job(job_data["_id"]).fetch().data["params"] == params
+    assert Job(job_data["_id"]).wait()["result"] == params
@@ -0,0 +1,66 @@
+from mrq.job import Job
+from mrq.queue import Queue
+from mrq.enqueue_buffer import queue_job_buffered, queue_jobs_buffered, flush_enqueue_buffer
+from mrq.context import connections
+from mrq.redishelpers import redis_key
+from bson import BSON
+import time
+
+
+def test_enqueue_buffer_dequeue(worker):
+
+    worker.start(flags="--enqueue_buffer_interval 10")
+
+    job_id = queue_job_buffered("tests.tasks.general.Add", {"a": 41, "b": 1})
+    assert worker.mongodb_jobs.mrq_jobs.count_documents({"_id": job_id}) == 0
+
+    # Started directly from Redis, well before the next flush
+    assert Job(job_id).wait(poll_interval=0.01, timeout=5)["result"] == 42
+    assert connections.redis.zcard(redis_key("enqueue_buffer_started")) == 0
+    assert Queue("default").size() == 0
+
+
+def test_enqueue_buffer_flush(worker):
+
+    worker.start(flags="--enqueue_buffer_interval 0.1", queues="other")
+
+    job_ids = queue_jobs_buffered("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(5)])
+    assert len(set(job_ids)) == 5
+
+    time.sleep(1)
+
+    # Written in MongoDB by the flusher, even though the worker doesn't listen to this queue
+    jobs = list(worker.mongodb_jobs.mrq_jobs.find({"_id": {"$in": job_ids}}))
+    assert len(jobs) == 5
+    assert all(job["status"] == "queued" for job in jobs)
+    assert connections.redis.llen(redis_key("enqueue_buffer", "default")) == 0
+
+
+def test_enqueue_buffer_recovery(worker):
+
+    worker.start_deps()
+
+    job_id = queue_job_buffered("tests.tasks.general.Add", {"a": 1, "b": 1})
+
+    # A worker popped the job then crashed
+    raw = connections.redis.lpop(redis_key("enqueue_buffer", "default"))
+    connections.redis.zadd(redis_key("enqueue_buffer_started"), time.time() - 3600, raw)
+    assert BSON(raw).decode()["_id"] == job_id
+
+    assert flush_enqueue_buffer() == 1
+    assert flush_enqueue_buffer() == 0
+    assert worker.mongodb_jobs.mrq_jobs.find_one({"_id": job_id})["status"] == "queued"
+
+    # A worker started the job directly then crashed before unlocking it
+    job_id = queue_job_buffered("tests.tasks.general.Add", {"a": 2, "b": 2})
+    raw = connections.redis.lpop(redis_key("enqueue_buffer", "default"))
+    connections.redis.zadd(redis_key("enqueue_buffer_started"), time.time() - 3600, raw)
+    job_data = BSON(raw).decode()
+    job_data["status"] = "started"
+    worker.mongodb_jobs.mrq_jobs.insert(job_data)
+
+    assert flush_enqueue_buffer() == 0
+    assert worker.mongodb_jobs.mrq_jobs.find_one({"_id": job_id})["status"] == "started"
+    assert connections.redis.zcard(redis_key("enqueue_buffer_started")) == 0
+
+    worker.stop_deps()
@@ -6,6 +6,8 @@ import urllib.request, urllib.error, urllib.parse
 import json
 import time
 from mrq.job import Job, get_job_result
+from mrq.context import connections
+from mrq.redishelpers import redis_key
 
 
 def test_general_simple_task_one(worker):
@@ -99,6 +101,32 @@ def test_general_simple_no_trace(worker):
     assert result == 42
 
 
+def test_general_report_compact(worker):
+
+    worker.start(flags="--greenlets 5 --report_compact --report_stacks 2 --report_interval 0.1")
+
+    worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 0, "sleep": 3} for i in range(5)], block=False)
+
+    time.sleep(1.5)
+
+    db_worker = worker.mongodb_jobs.mrq_workers.find_one()
+    assert len(db_worker["jobs"]) == 5
+    assert len([g for g in db_worker["jobs"] if "stack" in g]) == 2
+    assert db_worker["process"]["mem"]["rss"] > 0
+
+    # The full report is available on demand
+    full_report = json.loads(urllib.request.urlopen(
+        "http://localhost:%s/report_full" % worker.admin_port).read().decode('utf-8'))
+    assert len([g for g in full_report["jobs"] if "stack" in g]) == 5
+
+    worker.wait_for_idle()
+    time.sleep(0.5)
+
+    db_worker = worker.mongodb_jobs.mrq_workers.find_one()
+    assert db_worker["jobs"] == []
+    assert db_worker["done_jobs"] == 5
+
+
 def test_general_simple_task_multiple(worker):
 
     result = worker.send_tasks("tests.tasks.general.Add", [
@@ -178,6 +206,11 @@ def test_known_queues_lifecycle(worker):
 
     jobs = list(worker.mongodb_jobs.mrq_jobs.find())
     assert len(jobs) == 0
+
+    # Empty queues stay in the registry until it is cleaned
+    assert set(Queue.all_known()) == set(["x"])
+    connections.redis.zadd(redis_key("known_queues"), 0, "x")
+    worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {}, queue="default")
     assert set(Queue.all_known()) == set()
 
     all_known = worker.send_task("tests.tasks.general.QueueAllKnown", {}, queue="default")
@@ -0,0 +1,61 @@
+from mrq.job import Job, queue_jobs
+from mrq.group import create_group, close_group, get_group, queue_group
+import time
+
+
+def wait_for_callback(worker, timeout=10):
+    for _ in range(timeout * 10):
+        callback = worker.mongodb_jobs.mrq_jobs.find_one({"path": "tests.tasks.general.ReturnParams"})
+        if callback:
+            return Job(callback["_id"]).wait(poll_interval=0.1, timeout=timeout)["result"]
+        time.sleep(0.1)
+    raise Exception("Callback wasn't queued")
+
+
+def test_group(worker):
+
+    worker.start(flags="--greenlets 5")
+
+    group_id = queue_group("tests.tasks.general.Add", [{"a": i, "b": 1, "sleep": 0.1 * i} for i in range(10)],
+                           "tests.tasks.general.ReturnParams", callback_params={"x": 1}, callback_results=True)
+
+    result = wait_for_callback(worker)
+    assert result["x"] == 1
+    assert result["group"] == group_id
+    assert result["statuses"] == {"success": 10}
+    assert result["results"] == [i + 1 for i in range(10)]
+
+    group = get_group(group_id)
+    assert group["remaining"] == 0
+    assert group["done"]
+
+
+def test_group_open(worker):
+
+    worker.start()
+
+    group_id = create_group("tests.tasks.general.ReturnParams")
+
+    # The group is still open: no callback even when all its jobs have finished
+    worker.wait_for_tasks_results(queue_jobs("tests.tasks.general.Add", [{"a": 1, "b": 1}] * 2, group=group_id))
+    worker.wait_for_tasks_results(queue_jobs("tests.tasks.general.RaiseException", [{"message": "x"}],
+                                             group=group_id), accept_statuses=["failed"])
+
+    group = get_group(group_id)
+    assert group["remaining"] == 1
+    assert group["statuses"] == {"success": 2, "failed": 1}
+    assert not group["done"]
+    assert worker.mongodb_jobs.mrq_jobs.count({"path": "tests.tasks.general.ReturnParams"}) == 0
+
+    close_group(group_id)
+
+    result = wait_for_callback(worker)
+    assert result["statuses"] == {"success": 2, "failed": 1}
+    assert "results" not in result
+
+    # A job finishing twice is only counted once
+    job = Job(worker.mongodb_jobs.mrq_jobs.find_one({"path": "tests.tasks.general.Add"})["_id"]).fetch()
+    job.requeue()
+    job.wait(poll_interval=0.1, timeout=5)
+    assert get_group(group_id)["statuses"] == {"success": 2, "failed": 1}
+    assert worker.mongodb_jobs.mrq_jobs.count({"path": "tests.tasks.general.ReturnParams"}) == 1
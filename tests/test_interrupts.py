@@ -5,7 +5,7 @@ from mrq.job import Job, get_job_result
 from mrq.queue import Queue
 from bson import ObjectId
 import pytest
-from mrq.context import connections
+from mrq.context import connections, get_current_config
 import json
 import os
 
@@ -370,7 +370,7 @@ def test_worker_interrupt_after_max_time(worker):
 
 def test_interrupt_maxconcurrency(worker):
 
-    # The worker will raise a maxconcurrency on the second job
+    # The second job will be deferred back to the queue until the first one is done
     worker.start(flags="--greenlets=2")
 
     job_ids = worker.send_tasks("tests.tasks.concurrency.LockedAdd", [
@@ -378,11 +378,15 @@ def test_interrupt_maxconcurrency(worker):
         for i in range(2)
     ], block=False)
 
-    worker.wait_for_tasks_results(job_ids, accept_statuses=["success", "failed", "maxconcurrency"])
-    job_statuses = [Job(job_id).fetch().data["status"] for job_id in job_ids]
-    assert set(job_statuses) == set(["success", "maxconcurrency"])
+    results = worker.wait_for_tasks_results(job_ids)
+    assert results == [1, 2]
+
+    jobs = [Job(job_id).fetch().data for job_id in job_ids]
+    assert all(job.get("retry_count", 0) == 0 for job in jobs)
+
+    # The concurrency semaphore must be empty
+    assert connections.redis.zcard("%s:c:tests.tasks.concurrency.LockedAdd" % get_current_config()["redis_prefix"]) == 0
 
-    # the job concurrency key must be equal to 0
     last_job_id = worker.send_task(
         "tests.tasks.concurrency.LockedAdd",
         {"a": 1, "b": 1, "sleep": 2},
@@ -391,3 +395,32 @@ def test_interrupt_maxconcurrency(worker):
 
     last_job = Job(last_job_id).wait(poll_interval=0.01)
     assert last_job.get("status") == "success"
+
+
+def test_maxconcurrency_semaphore(worker):
+
+    worker.start(flags="--greenlets=10")
+
+    job_ids = worker.send_tasks("tests.tasks.concurrency.ConcurrencyCounter", [
+        {"a": i, "sleep": 0.5} for i in range(8)
+    ], block=False)
+
+    worker.wait_for_tasks_results(job_ids)
+
+    # Up to 2 jobs ran at the same time, never more
+    assert connections.redis.zrange("tests:concurrency_max", -1, -1) == [b"2"]
+
+
+def test_maxconcurrency_by_key(worker):
+
+    worker.start(flags="--greenlets=10")
+
+    start_time = time.time()
+
+    # Jobs with the same "a" parameter can't run at the same time
+    results = worker.send_tasks("tests.tasks.concurrency.LimitedAddByKey", [
+        {"a": i % 2, "b": 0, "sleep": 1} for i in range(4)
+    ])
+
+    assert results == [0, 1, 0, 1]
+    assert 2 <= time.time() - start_time < 4
@@ -0,0 +1,63 @@
+from mrq.job import get_job_counters
+from mrq.context import connections
+
+
+def get_counters_from_mongodb():
+    by_status = {
+        (row["_id"]["path"], row["_id"]["status"]): row["jobs"]
+        for row in connections.mongodb_jobs.mrq_jobs.aggregate([
+            {"$group": {"_id": {"path": "$path", "status": "$status"}, "jobs": {"$sum": 1}}}
+        ])
+    }
+    by_exception = {
+        (row["_id"]["path"], row["_id"]["exceptiontype"]): row["jobs"]
+        for row in connections.mongodb_jobs.mrq_jobs.aggregate([
+            {"$match": {"status": "failed"}},
+            {"$group": {"_id": {"path": "$path", "exceptiontype": "$exceptiontype"}, "jobs": {"$sum": 1}}}
+        ])
+    }
+    return by_status, by_exception
+
+
+def test_job_counters(worker):
+
+    worker.start()
+
+    # Never reconciled, the dashboard uses the aggregations
+    assert get_job_counters("status") is None
+
+    worker.send_task("mrq.basetasks.cleaning.ReconcileJobCounters", {})
+    assert get_job_counters("status") == get_counters_from_mongodb()[0]
+
+    worker.send_tasks("tests.tasks.general.Add", [{"a": 41, "b": 1}] * 3)
+    worker.send_tasks("tests.tasks.general.RaiseException", [{"message": "x"}] * 2, accept_statuses=["failed"])
+    worker.send_tasks("tests.tasks.general.Add", [{"a": 41, "b": 1}] * 2, queue="not_listened", block=False)
+
+    by_status, by_exception = get_counters_from_mongodb()
+    assert by_status[("tests.tasks.general.Add", "success")] == 3
+    assert by_status[("tests.tasks.general.Add", "queued")] == 2
+    assert by_exception[("tests.tasks.general.RaiseException", "Exception")] == 2
+
+    # Incremental updates match MongoDB
+    assert get_job_counters("status") == by_status
+    assert get_job_counters("exceptions") == by_exception
+
+    # Requeues & cancellations by JobAction are counted too
+    worker.send_task("mrq.basetasks.utils.JobAction", {
+        "path": "tests.tasks.general.RaiseException", "status": "failed", "action": "requeue",
+        "destination_queue": "not_listened"
+    })
+    worker.send_task("mrq.basetasks.utils.JobAction", {"queue": "not_listened", "action": "cancel"})
+
+    by_status, by_exception = get_counters_from_mongodb()
+    assert by_status[("tests.tasks.general.RaiseException", "cancel")] == 2
+    assert get_job_counters("status") == by_status
+    assert get_job_counters("exceptions") == by_exception
+
+    # Other changes in bulk are only counted after a reconciliation
+    connections.mongodb_jobs.mrq_jobs.delete_many({"status": "success"})
+    assert get_job_counters("status") != get_counters_from_mongodb()[0]
+
+    worker.send_task("mrq.basetasks.cleaning.ReconcileJobCounters", {})
+    assert get_job_counters("status") == get_counters_from_mongodb()[0]
+    assert get_job_counters("exceptions") == get_counters_from_mongodb()[1]
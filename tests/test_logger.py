@@ -78,3 +78,26 @@ def test_collection_is_capped(worker):
     assert worker.mongodb_logs.mrq_logs.options()["capped"] is True
 
     worker.stop_deps()
+
+
+def test_log_limits(worker):
+    worker.start(flags="--config tests/fixtures/config-logger-limits.py --report_interval 1000")
+
+    worker.send_task("tests.tasks.logger.Lines", {"count": 1000, "size": 100})
+
+    # Written in the background as soon as the buffer is large enough, not at the next report
+    time.sleep(0.5)
+    assert "Line 0 " in worker.mongodb_logs.mrq_logs.find_one({"job": {"$exists": True}})["logs"]
+
+    assert worker.get_report()["logs"]["job_lines_cap"] == 900
+
+    # Force-flush the logs
+    worker.stop(deps=False)
+
+    db_logs = "".join([x["logs"] for x in worker.mongodb_logs.mrq_logs.find({"job": {"$exists": True}})])
+
+    assert "Line 99 " in db_logs
+    assert "Line 100 " not in db_logs
+    assert "Reached max_job_lines=100" in db_logs
+
+    worker.stop_deps()
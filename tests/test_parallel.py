@@ -76,3 +76,46 @@ def test_dequeue_strategy(worker, p_greenlets, p_strategy):
     else:
         assert set(order[0:2]) == set([41, 43])
         assert set(order[2:4]) == set([42, 44])
+
+
+def test_dequeue_strategy_weighted(worker):
+
+    worker.start_deps(flush=True)
+
+    worker.send_tasks("tests.tasks.general.MongoInsert", [{"a": i} for i in range(100)],
+                      queue="high", block=False, start=False)
+    worker.send_tasks("tests.tasks.general.MongoInsert", [{"a": i} for i in range(100, 200)],
+                      queue="low", block=False, start=False)
+
+    worker.start(flags="--greenlets 1 --dequeue_strategy weighted --queue_weights high:3,low:1",
+                 queues="low high", deps=False)
+    worker.wait_for_idle()
+
+    inserts = list(connections.mongodb_jobs.tests_inserts.find(sort=[("_id", 1)]))
+    order = [row["params"]["a"] for row in inserts]
+    assert len(order) == 200
+
+    # The first 80 jobs are shared 3:1 even though "low" is listed first
+    high_first = len([a for a in order[0:80] if a < 100])
+    assert 55 <= high_first <= 65
+
+
+def test_dequeue_batch_concurrent_workers(worker, worker2):
+
+    worker.start(flags="--greenlets 50 --dequeue_batch")
+    worker2.start(flags="--greenlets 50 --dequeue_batch", deps=False)
+
+    result = worker.send_tasks(
+        "tests.tasks.general.MongoInsert", [{"a": i, "sleep": 0.01} for i in range(1000)])
+
+    worker2.wait_for_idle()
+
+    assert len(result) == 1000
+
+    # Each job must have been claimed by exactly one worker
+    inserts = [row["params"]["a"] for row in connections.mongodb_jobs.tests_inserts.find()]
+    assert sorted(inserts) == list(range(1000))
+    assert connections.mongodb_jobs.mrq_jobs.count({"status": "success"}) == 1000
+
+    # Claim tokens are removed once the jobs are done
+    assert connections.mongodb_jobs.mrq_jobs.count({"dequeue_token": {"$exists": True}}) == 0
@@ -5,6 +5,9 @@ from builtins import range
 from past.utils import old_div
 import time
 from mrq.queue import Queue
+from mrq.job import Job
+from mrq.context import connections, set_current_config, get_config
+from mrq.redishelpers import redis_has_count
 import pytest
 import os
 import random
@@ -50,6 +53,41 @@ def test_job_max_latency(worker, p_max_latency, p_min_observed_latency, p_max_ob
     assert p_min_observed_latency <= avg_latency < p_max_observed_latency
 
 
+def test_job_wakeup_latency(worker):
+
+    worker.start(flags=" --ensure_indexes --greenlets=1 --max_latency=1 --wakeup --config tests/fixtures/config-raw1.py",
+                 queues="default test_raw", trace=False)
+
+    # Enqueuers must also publish wakeup messages
+    config = get_config(sources=("file", "env"), file_path="tests/fixtures/config-raw1.py")
+    config["wakeup"] = True
+    set_current_config(config)
+
+    def get_latency():
+        t = time.time()
+        return worker.send_task("tests.tasks.general.GetTime", {}) - t
+
+    # Warm up the worker
+    get_latency()
+
+    latencies = []
+    for i in range(6):
+        # Let the idle backoff go up to max_latency
+        time.sleep(3)
+        latencies.append(get_latency())
+
+    print("Observed latencies with --wakeup: %s" % latencies)
+    assert max(latencies) < 0.1
+
+    # Raw queues wake up the workers too
+    time.sleep(3)
+    t = time.time()
+    worker.send_raw_tasks("test_raw", ["aaa"], block=False)
+    while worker.mongodb_logs.tests_inserts.count() == 0:
+        time.sleep(0.005)
+    assert time.time() - t < 0.3
+
+
 @pytest.mark.parametrize(["p_latency", "p_min", "p_max"], [
     [0, 0, 3],
     ["0.05", 4, 30],
@@ -73,14 +111,15 @@ def test_network_latency(worker, p_latency, p_min, p_max):
     assert p_min < total_time < p_max
 
 
-def benchmark_task(worker, taskpath, taskparams, tasks=1000, greenlets=50, processes=0, max_seconds=10, profile=False, quiet=True, raw=False, queues="default", config=None):
+def benchmark_task(worker, taskpath, taskparams, tasks=1000, greenlets=50, processes=0, max_seconds=10, profile=False, quiet=True, raw=False, queues="default", config=None, flags=""):
 
-    worker.start(flags="--ensure_indexes --processes %s --greenlets %s%s%s%s" % (
+    worker.start(flags="--ensure_indexes --processes %s --greenlets %s%s%s%s %s" % (
         processes,
         greenlets,
         " --profile" if profile else "",
         " --quiet" if quiet else "",
-        " --config %s" % config if config else ""
+        " --config %s" % config if config else "",
+        flags
     ), queues=queues, trace=False)
 
     # Warm up the workers with one simple task.
@@ -133,6 +172,165 @@ def test_performance_simpleadds_regular(worker, p_processes):
     assert result == list(range(n_tasks))
 
 
+@pytest.mark.parametrize(["p_dequeue_batch"], [[False], [True]])
+@pytest.mark.parametrize(["p_greenlets"], [[1], [10], [100], [500]])
+def test_performance_dequeue_batch(worker, p_greenlets, p_dequeue_batch):
+
+    n_tasks = 5000
+
+    result, total_time = benchmark_task(worker,
+                                        "tests.tasks.general.Add",
+                                        [{"a": i, "b": 0, "sleep": 0}
+                                            for i in range(n_tasks)],
+                                        tasks=n_tasks,
+                                        greenlets=p_greenlets,
+                                        max_seconds=60,
+                                        flags="--dequeue_batch" if p_dequeue_batch else "")
+
+    print("Dequeue batch=%s, %s greenlets: %0.2f jobs/second" % (
+        p_dequeue_batch, p_greenlets, old_div(n_tasks, total_time)))
+
+    assert result == list(range(n_tasks))
+
+
+@pytest.mark.parametrize(["p_status_batch_size"], [[0], [100]])
+def test_performance_status_batch(worker, p_status_batch_size):
+
+    n_tasks = 5000
+
+    result, total_time = benchmark_task(worker,
+                                        "tests.tasks.general.Add",
+                                        [{"a": i, "b": 0, "sleep": 0}
+                                            for i in range(n_tasks)],
+                                        tasks=n_tasks,
+                                        greenlets=100,
+                                        max_seconds=60,
+                                        flags="--status_batch_size %s" % p_status_batch_size)
+
+    print("Status batch size=%s: %0.2f jobs/second" % (p_status_batch_size, old_div(n_tasks, total_time)))
+
+    assert result == list(range(n_tasks))
+
+
+@pytest.mark.parametrize(["p_native_count"], [[False], [True]])
+def test_performance_raw_list_pop(worker, p_native_count):
+    """ Cost of filling a pool of 1000 greenlets from a raw list, with and without LPOP count """
+
+    worker.start_deps()
+
+    version = connections.redis.mrq_server_version
+    if p_native_count and not redis_has_count("lpop"):
+        pytest.skip("Redis %s doesn't support LPOP count" % (version, ))
+
+    queue = Queue("testperformance_raw")
+    n_pops = 100
+    connections.redis.rpush(queue.redis_key, *[str(i) for i in range(1000 * n_pops)])
+
+    if not p_native_count:
+        connections.redis.mrq_server_version = (0, )
+
+    try:
+        start_time = time.time()
+        popped = 0
+        for _ in range(n_pops):
+            params = queue.pop(1000)
+            assert len(params) == 1000
+            popped += len(params)
+        total_time = time.time() - start_time
+    finally:
+        connections.redis.mrq_server_version = version
+
+    print("Native LPOP count=%s: %0.3fms per 1000-slot dequeue" % (
+        p_native_count, 1000 * old_div(total_time, n_pops)))
+
+    assert popped == 1000 * n_pops
+    assert queue.size() == 0
+
+
+@pytest.mark.parametrize(["p_encoding"], [[None], ["zlib"], ["zstd"], ["msgpack"], ["msgpack_zlib"]])
+def test_performance_encoding(worker, p_encoding):
+
+    if p_encoding and p_encoding.startswith("msgpack"):
+        pytest.importorskip("msgpack")
+    if p_encoding and p_encoding.endswith("zstd"):
+        pytest.importorskip("zstandard")
+
+    worker.start_deps()
+
+    config = get_config(sources=("env", ))
+    config["tasks"] = {"tests.tasks.general.ReturnParams": {"params_encoding": p_encoding}}
+    set_current_config(config)
+
+    # A typical crawler result, with lots of repeated markup
+    params = {
+        "url": "http://example.com/page",
+        "html": "<div class='item'><span>%s</span></div>" * 500,
+        "links": ["http://example.com/page/%s" % i for i in range(200)]
+    }
+
+    start_time = time.time()
+    job_ids = Job.insert([{
+        "path": "tests.tasks.general.ReturnParams",
+        "params": params,
+        "queue": "default",
+        "status": "queued"
+    } for _ in range(500)], return_jobs=False)
+    insert_time = time.time() - start_time
+
+    start_time = time.time()
+    for job_id in job_ids:
+        assert Job(job_id).fetch().data["params"] == params
+    fetch_time = time.time() - start_time
+
+    size = connections.mongodb_jobs.command("collstats", "mrq_jobs")["avgObjSize"]
+
+    print("Encoding %s: %s bytes/job, insert %0.2fms/job, fetch %0.2fms/job" % (
+        p_encoding, size, insert_time * 1000 / 500, fetch_time * 1000 / 500
+    ))
+
+    if p_encoding:
+        assert size < 10000
+
+    worker.stop_deps()
+
+
+def test_performance_metrics_overhead():
+
+    from mrq.metrics import Metrics
+
+    metrics = Metrics()
+    labels = (("path", "tests.tasks.general.Add"), ("queue", "default"))
+
+    # What the worker records for each job
+    start_time = time.time()
+    for i in range(100000):
+        metrics.incr("mrq_jobs_total", 1, labels + (("status", "success"), ))
+        metrics.observe("mrq_job_queued_seconds", 0.01 * (i % 100), labels)
+        metrics.observe("mrq_job_run_seconds", 0.001 * (i % 1000), labels)
+        metrics.observe("mrq_job_save_seconds", 0.002, labels)
+    per_job = (time.time() - start_time) / 100000
+
+    print("Metrics overhead: %0.2fus per job" % (per_job * 1000000))
+
+    # Negligible compared to the few ms of MongoDB & Redis roundtrips of each job
+    assert per_job < 0.00005
+
+
+@pytest.mark.parametrize(["p_flags"], [[""], ["--metrics"]])
+def test_performance_metrics(worker, p_flags):
+
+    n_tasks = 1000
+
+    result, total_time = benchmark_task(worker,
+                                        "tests.tasks.general.Add",
+                                        [{"a": i, "b": 0, "sleep": 0} for i in range(n_tasks)],
+                                        tasks=n_tasks,
+                                        greenlets=50,
+                                        flags=p_flags)
+
+    assert result == list(range(n_tasks))
+
+
 @pytest.mark.parametrize(["p_queue", "p_greenlets"], [x1 + x2 for x1 in [
     ["testperformance_raw"],
     ["testperformance_set"],
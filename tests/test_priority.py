@@ -0,0 +1,20 @@
+from mrq.job import queue_jobs
+from mrq.context import connections, set_current_config, get_config
+
+
+def test_queue_priority(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-priority.py"))
+
+    worker.start_deps()
+
+    queue_jobs("tests.tasks.general.MongoInsert", [{"a": 1}, {"a": 2}], queue="prio")
+    queue_jobs("tests.tasks.general.MongoInsert", [{"a": 3}], queue="prio", priority=10)
+    queue_jobs("tests.tasks.general.MongoInsert", [{"a": 4}], queue="prio", priority=-1)
+    queue_jobs("tests.tasks.general.MongoInsert", [{"a": 5}], queue="prio", priority=5)
+
+    worker.start(flags="--greenlets 1 --config tests/fixtures/config-priority.py", queues="prio", deps=False)
+    worker.wait_for_idle()
+
+    inserts = list(connections.mongodb_jobs.tests_inserts.find(sort=[("_id", 1)]))
+    assert [row["params"]["a"] for row in inserts] == [3, 5, 1, 2, 4]
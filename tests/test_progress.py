@@ -2,13 +2,14 @@ import time
 import pytest
 
 
-@pytest.mark.parametrize(["p_save"], [
-    [True],
-    [False]
+@pytest.mark.parametrize(["p_save", "p_flags"], [
+    [True, ""],
+    [False, ""],
+    [False, "--report_compact"]
 ])
-def test_progress(worker, p_save):
+def test_progress(worker, p_save, p_flags):
 
-    worker.start(flags="--report_interval 1")
+    worker.start(flags="--report_interval 1 %s" % p_flags)
 
     assert worker.send_task(
         "tests.tasks.general.Progress", {"save": p_save}, block=False)
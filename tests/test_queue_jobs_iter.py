@@ -0,0 +1,47 @@
+from mrq.job import Job, queue_jobs_iter
+from mrq.queue import Queue
+import time
+
+
+def test_queue_jobs_iter(worker):
+
+    worker.start(flags="--greenlets 10")
+
+    job_ids = queue_jobs_iter("tests.tasks.general.Add", ({"a": i, "b": 1} for i in range(23)),
+                              batch_size=5, concurrency=3)
+
+    # Jobs are only queued when IDs are consumed
+    assert worker.mongodb_jobs.mrq_jobs.count_documents({}) == 0
+
+    job_ids = list(job_ids)
+    assert len(job_ids) == 23
+    assert len(set(job_ids)) == 23
+
+    # IDs are yielded in the order of the params
+    for i, job_id in enumerate(job_ids):
+        assert Job(job_id).wait(poll_interval=0.01, timeout=10)["result"] == i + 1
+
+    assert Queue("default").size() == 0
+
+
+def test_queue_jobs_iter_streaming(worker):
+
+    worker.start()
+
+    def params_iter():
+        for i in range(5):
+            yield {"a": i, "b": 1}
+
+        # The first batch is already queued, workers don't wait for the end of the iterator
+        for _ in range(50):
+            if worker.mongodb_jobs.mrq_jobs.count_documents({"status": "success"}) > 0:
+                break
+            time.sleep(0.1)
+
+        yield {"a": 5, "b": 1}
+
+    job_ids = list(queue_jobs_iter("tests.tasks.general.Add", params_iter(), batch_size=5, concurrency=1))
+    assert len(job_ids) == 6
+
+    assert Job(job_ids[0]).fetch().data["status"] == "success"
+    assert Job(job_ids[5]).wait(poll_interval=0.01, timeout=5)["result"] == 6
@@ -0,0 +1,62 @@
+from mrq.queue import Queue
+from mrq.job import queue_job
+from mrq.context import connections
+from mrq.redishelpers import redis_key
+
+
+def age_registry():
+    """ Makes all the queues of the registry old enough to be removed """
+    key = redis_key("known_queues")
+    for queue in connections.redis.zrange(key, 0, -1):
+        connections.redis.zadd(key, 0, queue)
+
+
+def test_queue_registry(worker):
+
+    worker.start(queues="default")
+
+    queue_job("tests.tasks.general.Add", {"a": 41, "b": 1}, queue="reg1")
+    queue_job("tests.tasks.general.Add", {"a": 41, "b": 1}, queue="reg2/sub")
+    worker.send_raw_tasks("test_raw", ["a"], block=False)
+
+    assert Queue.get_registry() >= set(["reg1", "reg2/sub", "test_raw"])
+    assert Queue.get_registry(prefixes=["reg"]) == set(["reg1", "reg2/sub"])
+    assert Queue("reg2/").get_known_subqueues() == set(["reg2/sub"])
+    assert [q.id for q in Queue.all_active()] == ["test_raw"]
+
+    # Nothing is old enough to be removed
+    stats = worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {}, queue="default")
+    assert stats["removed"] == 0
+
+    # Queues registered recently are never removed, whatever max_age
+    stats = worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {"max_age": 0}, queue="default")
+    assert stats["checked"] == 0
+
+    # Queues with jobs left are never removed
+    age_registry()
+    stats = worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {}, queue="default")
+    assert Queue.get_registry() >= set(["reg1", "reg2/sub", "test_raw"])
+
+    Queue("reg1").empty()
+    Queue("test_raw").empty()
+
+    stats = worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {}, queue="default")
+    registry = Queue.get_registry()
+    assert "reg1" not in registry
+    assert "test_raw" not in registry
+    assert "reg2/sub" in registry
+
+
+def test_queue_registry_rebuild(worker):
+
+    worker.start(queues="default")
+
+    queue_job("tests.tasks.general.Add", {"a": 41, "b": 1}, queue="reg1")
+
+    # Simulates an upgrade from a version without the registry
+    connections.redis.delete(redis_key("known_queues"), redis_key("known_queues_lex"))
+    assert Queue.get_registry() == set()
+
+    stats = worker.send_task("mrq.basetasks.cleaning.CleanQueueRegistry", {"rebuild": True}, queue="default")
+    assert stats["added"] == 1
+    assert "reg1" in Queue.get_registry()
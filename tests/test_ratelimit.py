@@ -1,5 +1,8 @@
 from builtins import range
 from mrq.helpers import ratelimit
+from mrq.queue import Queue
+from mrq.context import set_current_config, get_config
+import pytest
 import time
 
 
@@ -34,3 +37,58 @@ def test_helpers_ratelimit(worker):
     assert ratelimit("k", 10, per=10) == 9
 
     worker.stop_deps()
+
+
+@pytest.mark.parametrize(["p_queue"], [["limited"], ["limited_raw"]])
+def test_queue_rate_limit(worker, p_queue):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-ratelimit.py"))
+
+    worker.start_deps()
+
+    if p_queue.endswith("_raw"):
+        worker.send_raw_tasks(p_queue, [str(i) for i in range(30)], start=False, block=False)
+    else:
+        worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 0} for i in range(30)],
+                          queue=p_queue, start=False, block=False)
+
+    start_time = time.time()
+    worker.start(flags="--greenlets 30 --max_latency 0.05 --config tests/fixtures/config-ratelimit.py",
+                 queues=p_queue, deps=False)
+
+    # Burst of 5 jobs then 10 jobs/second: jobs must stay in the queue until they can run
+    time.sleep(1)
+    elapsed = time.time() - start_time
+    done = worker.mongodb_jobs.mrq_jobs.count({"status": "success"})
+    assert done <= 5 + elapsed * 10 + 2
+
+    worker.wait_for_idle()
+    elapsed = time.time() - start_time
+
+    assert worker.mongodb_jobs.mrq_jobs.count({"status": "success"}) == 30
+    assert worker.mongodb_jobs.mrq_jobs.count({"retry_count": {"$gt": 0}}) == 0
+    assert elapsed >= 2
+
+
+@pytest.mark.parametrize(["p_rate_limit", "p_expected"], [
+    [(10, 5), (10.0, 5)],
+    [0.5, (0.5, 1)],
+    [0, None],
+    [(0, 5), Exception],
+    [(10, 0), Exception],
+    [-1, Exception],
+    [(10, ), Exception],
+    ["x", Exception]
+])
+def test_queue_rate_limit_config(p_rate_limit, p_expected):
+
+    config = get_config(sources=("env", ))
+    config["queues_config"] = {"limited": {"rate_limit": p_rate_limit}}
+    set_current_config(config)
+
+    if p_expected is Exception:
+        with pytest.raises(Exception) as excinfo:
+            Queue("limited").get_rate_limit()
+        assert "Invalid rate_limit" in str(excinfo.value)
+    else:
+        assert Queue("limited").get_rate_limit() == p_expected
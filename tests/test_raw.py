@@ -1,6 +1,7 @@
 from mrq.job import Job
 import datetime
 from mrq.queue import Queue
+from mrq.context import set_current_config, get_config
 import time
 import pytest
 
@@ -121,6 +122,31 @@ def test_raw_set(worker, has_subqueue, p_queue, p_set):
         assert test_collection.count() == 4
 
 
+@pytest.mark.parametrize(["p_queue"], [
+    ["test_raw/"],
+    ["test_set/"]
+])
+def test_raw_empty_subqueues_removed(worker, p_queue):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-raw1.py"))
+
+    worker.start_deps()
+
+    worker.send_raw_tasks("%ssub1" % p_queue, ["aaa", "bbb"], block=False, start=False)
+    worker.send_raw_tasks("%ssub2" % p_queue, ["ccc"], block=False, start=False)
+
+    assert len(Queue(p_queue).get_known_subqueues()) == 2
+
+    worker.start(flags="--greenlets 10 --config tests/fixtures/config-raw1.py --subqueues_refresh_interval=0.1",
+                 queues=p_queue, deps=False)
+    worker.wait_for_idle()
+
+    assert worker.mongodb_jobs.mrq_jobs.count({"status": "success"}) == 3
+
+    # Subqueues are forgotten in the same call that emptied them
+    assert Queue(p_queue).get_known_subqueues() == set()
+
+
 def test_raw_started(worker):
 
     worker.start(
@@ -252,6 +278,33 @@ def test_raw_retry(worker):
     assert failjob["queue"] == "testx"
 
 
+@pytest.mark.parametrize(["p_strategy"], [["sequential"], ["parallel"]])
+def test_raw_multi_queues(worker, p_strategy):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-raw1.py"))
+
+    worker.start_deps()
+
+    worker.send_raw_tasks("test_raw/sub1", ["a1", "a2", "a3"], start=False, block=False)
+    worker.send_raw_tasks("test_raw/sub2", ["b1", "b2"], start=False, block=False)
+    worker.send_raw_tasks("test_set", ["c1", "c2"], start=False, block=False)
+    worker.send_raw_tasks("test_sorted_set", {"d1": 1, "d2": 2}, start=False, block=False)
+    worker.send_raw_tasks("test_timed_set", {"e1": time.time() - 10, "e2": time.time() + 3600},
+                          start=False, block=False)
+
+    # All these raw queues are dequeued with a single Redis call per pass
+    worker.start(flags="--greenlets 3 --config tests/fixtures/config-raw1.py --dequeue_strategy %s" % p_strategy,
+                 queues="test_raw/ test_set test_sorted_set test_timed_set", deps=False)
+    worker.wait_for_idle()
+
+    assert worker.mongodb_jobs.mrq_jobs.count({"status": "success"}) == 10
+    assert worker.mongodb_logs.tests_inserts.count() == 10
+
+    # Only the job in the future is left
+    assert Queue("test_timed_set").size() == 1
+    assert Queue("test_raw/").get_known_subqueues() == set()
+
+
 @pytest.mark.parametrize(["p_queue", "p_greenlets"], [x1 + x2 for x1 in [
     ["test_raw default test"],
     # ["default test_raw test"],
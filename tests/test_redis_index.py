@@ -0,0 +1,71 @@
+from builtins import range
+from mrq.job import Job
+from mrq.queue import Queue
+from mrq.context import connections, set_current_config, get_config
+
+
+def test_redis_index_dequeue(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-redis-index.py"))
+
+    worker.start(flags="--greenlets 10 --config tests/fixtures/config-redis-index.py", queues="indexed")
+
+    assert Queue("indexed").use_redis_index()
+
+    job_ids = worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(20)],
+                                queue="indexed", block=False)
+
+    assert worker.wait_for_tasks_results(job_ids) == [i + 1 for i in range(20)]
+
+    # The index is empty once all jobs were dequeued
+    assert connections.redis.llen(Queue("indexed").redis_key_index) == 0
+    assert connections.redis.zcard(Queue("indexed").redis_key_started) == 0
+
+    # Requeued jobs are indexed again
+    Job(job_ids[0]).requeue()
+    worker.wait_for_idle()
+    assert Job(job_ids[0]).fetch().data["status"] == "success"
+
+
+def test_redis_index_cancelled_jobs(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-redis-index.py"))
+
+    worker.start_deps()
+
+    job_ids = worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(5)],
+                                queue="indexed", block=False, start=False)
+
+    assert connections.redis.llen(Queue("indexed").redis_key_index) == 5
+
+    Job(job_ids[0]).cancel()
+
+    worker.start(flags="--config tests/fixtures/config-redis-index.py", queues="indexed", deps=False)
+    worker.wait_for_idle()
+
+    # Stale IDs of cancelled jobs are dropped from the index, not executed
+    assert Job(job_ids[0]).fetch().data["status"] == "cancel"
+    for job_id in job_ids[1:]:
+        assert Job(job_id).fetch().data["status"] == "success"
+
+
+def test_redis_index_multiple_queues(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-redis-index.py"))
+
+    worker.start_deps()
+
+    job_ids = worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(10)],
+                                queue="indexed", block=False, start=False)
+    job_ids += worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(10, 20)],
+                                 queue="indexed2", block=False, start=False)
+
+    # Both indexes are dequeued with a single Redis call & a single MongoDB update
+    worker.start(flags="--greenlets 30 --config tests/fixtures/config-redis-index.py",
+                 queues="indexed indexed2", deps=False)
+
+    assert worker.wait_for_tasks_results(job_ids) == [i + 1 for i in range(20)]
+
+    for queue in ("indexed", "indexed2"):
+        assert connections.redis.llen(Queue(queue).redis_key_index) == 0
+    assert connections.redis.zcard(Queue("indexed").redis_key_started) == 0
@@ -69,6 +69,25 @@ def test_routes_result(worker, api):
     assert data["result"]["message"] == "xyz"
 
 
+def test_routes_result_blob(worker, api):
+
+    worker.start(flags="--blob_store gridfs --blob_threshold 1000")
+    api.start(cmdline=api.cmdline + " --blob_store gridfs")
+
+    worker.send_task("tests.tasks.general.ReturnParams", {"message": "x" * 10000}, block=True)
+
+    job = worker.mongodb_jobs.mrq_jobs.find_one()
+    assert job
+
+    # Offloaded results are only downloaded on demand
+    data, _ = api.GET("/api/job/%s/result" % job["_id"])
+    assert data["result"]["size"] > 10000
+
+    _, res = api.GET("/" + data["download"])
+    assert len(res.content) == data["result"]["size"]
+    assert b"x" * 10000 in res.content
+
+
 def test_routes_jobaction(worker, api):
 
     worker.send_task("tests.tasks.general.ReturnParams", {
@@ -106,7 +125,12 @@ def test_routes_datatables(worker, api):
     assert len(data["aaData"]) == 2
     assert data["aaData"][0]["path"] == task_path
     assert data["aaData"][0]["status"] == "failed"
-    assert "xyz" in data["aaData"][0]["traceback"]
+    assert data["iTotalDisplayRecords"] == 2
+
+    # Heavy fields are fetched separately by the job actions
+    assert "traceback" not in data["aaData"][0]
+    data, _ = api.GET("/api/job/%s/traceback" % data["aaData"][0]["_id"])
+    assert "xyz" in data["traceback"]
 
     unit = "queues"
     data, _ = api.GET("/api/datatables/%s?sEcho=1" % unit)
@@ -115,6 +139,30 @@ def test_routes_datatables(worker, api):
     # TODO: test unit = "scheduled_jobs"
 
 
+def test_routes_datatables_jobs_pagination(worker, api):
+
+    worker.start(queues="default")
+
+    worker.send_tasks("tests.tasks.general.ReturnParams", [{"i": i} for i in range(25)], queue="tmp", block=False)
+
+    data, _ = api.GET("/api/datatables/jobs?sEcho=1&iDisplayStart=0&iDisplayLength=10&queue=tmp")
+    assert [row["params"]["i"] for row in data["aaData"]] == list(range(10))
+    assert data["iTotalDisplayRecords"] == 25
+    assert not data["bCountCapped"]
+
+    # The next page starts after the last job of this one
+    last_id = data["aaData"][-1]["_id"]
+    data, _ = api.GET("/api/datatables/jobs?sEcho=1&iDisplayStart=10&iDisplayLength=10&queue=tmp&after_id=%s" % last_id)
+    assert [row["params"]["i"] for row in data["aaData"]] == list(range(10, 20))
+
+    # Same page with skip()
+    data, _ = api.GET("/api/datatables/jobs?sEcho=1&iDisplayStart=10&iDisplayLength=10&queue=tmp")
+    assert [row["params"]["i"] for row in data["aaData"]] == list(range(10, 20))
+
+    data, _ = api.GET("/api/datatables/jobs?sEcho=1&iDisplayStart=0&iDisplayLength=10&exact_count=1")
+    assert data["iTotalDisplayRecords"] == 25
+
+
 def test_routes_logs(worker, api):
 
     task_path = "tests.tasks.general.RaiseException"
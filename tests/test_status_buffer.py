@@ -0,0 +1,82 @@
+from builtins import range
+import time
+from mrq.job import Job
+from mrq.queue import Queue
+from mrq.context import connections
+
+
+def test_status_buffer_success_and_failed(worker):
+
+    worker.start(flags="--greenlets 10 --status_batch_size 50 --status_batch_interval 0.5")
+
+    job_ids = worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(120)], block=False)
+    failed_id = worker.send_task("tests.tasks.general.RaiseException", {"message": "buffered"},
+                                 block=False, accept_statuses=["failed"])
+
+    # wait_for_idle() flushes the buffer so all statuses must be written
+    worker.wait_for_idle()
+
+    assert connections.mongodb_jobs.mrq_jobs.count({"_id": {"$in": job_ids}, "status": "success"}) == 120
+    assert [Job(job_id).fetch().data["result"] for job_id in job_ids] == [i + 1 for i in range(120)]
+
+    failed = Job(failed_id).fetch().data
+    assert failed["status"] == "failed"
+    assert failed["exceptiontype"] == "Exception"
+    assert len(failed["traceback_history"]) == 1
+
+    # Queue sizes were updated in the same flushes
+    assert Queue("default").size() == 0
+
+
+def test_status_buffer_flushed_on_stop(worker):
+
+    # With a very long interval, only the flush at shutdown can write the last updates
+    worker.start(flags="--greenlets 2 --status_batch_size 1000 --status_batch_interval 1000 --report_interval 1000")
+
+    job_ids = worker.send_tasks("tests.tasks.general.Add", [{"a": i, "b": 1} for i in range(10)], block=False)
+
+    time.sleep(2)
+
+    # Jobs are done but their statuses are still buffered
+    assert connections.mongodb_jobs.mrq_jobs.count({"_id": {"$in": job_ids}, "status": "success"}) == 0
+
+    worker.stop(deps=False)
+
+    assert connections.mongodb_jobs.mrq_jobs.count({"_id": {"$in": job_ids}, "status": "success"}) == 10
+
+
+def test_status_buffer_flush_failure(worker, monkeypatch):
+
+    from mrq.job import JobStatusBuffer
+    import mrq.job
+    import pytest
+
+    worker.start_deps()
+
+    monkeypatch.setattr(mrq.job, "FLUSH_RETRY_DELAY", 0)
+    job_id = connections.mongodb_jobs.mrq_jobs.insert({"status": "started"})
+
+    class FailingCollection(object):
+        def bulk_write(self, *args, **kwargs):
+            raise Exception("MongoDB is down")
+
+    status_buffer = JobStatusBuffer(100, 1)
+    status_buffer.collection = FailingCollection()
+    status_buffer.pipe.incr("status_buffer_test")
+    status_buffer.add(job_id, {"$set": {"status": "success"}}, succeeded=True)
+
+    with pytest.raises(Exception):
+        status_buffer.flush()
+
+    # Nothing was lost, nor sent to Redis before MongoDB
+    assert len(status_buffer.operations) == 1
+    assert status_buffer.succeeded == [job_id]
+    assert connections.redis.get("status_buffer_test") is None
+
+    status_buffer.collection = connections.mongodb_jobs.mrq_jobs
+    status_buffer.flush()
+
+    assert connections.mongodb_jobs.mrq_jobs.find_one({"_id": job_id})["status"] == "success"
+    assert int(connections.redis.get("status_buffer_test")) == 1
+
+    worker.stop_deps()
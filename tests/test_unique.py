@@ -0,0 +1,40 @@
+from mrq.job import Job, queue_job, queue_jobs
+from mrq.context import set_current_config, get_config
+from mrq.unique import get_unique_hash
+
+
+def test_unique_hash():
+
+    assert get_unique_hash("a.B", {"x": 1, "y": [1, 2]}) == get_unique_hash("a.B", {"y": [1, 2], "x": 1})
+    assert get_unique_hash("a.B", {"x": 1}) != get_unique_hash("a.B", {"x": 2})
+    assert get_unique_hash("a.B", {"x": 1}) != get_unique_hash("a.C", {"x": 1})
+
+
+def test_unique_jobs(worker):
+
+    set_current_config(get_config(sources=("file", "env"), file_path="tests/fixtures/config-unique.py"))
+
+    worker.start(flags="--config tests/fixtures/config-unique.py")
+
+    # Duplicates in the same batch and in later calls get the ID of the job in flight
+    job_ids = queue_jobs("tests.tasks.general.Add", [
+        {"a": 1, "b": 1, "sleep": 1},
+        {"b": 1, "a": 1, "sleep": 1},
+        {"a": 2, "b": 2}
+    ], batch_size=2)
+    assert job_ids[0] == job_ids[1]
+    assert job_ids[2] != job_ids[0]
+    assert queue_job("tests.tasks.general.Add", {"a": 1, "b": 1, "sleep": 1}) == job_ids[0]
+
+    assert worker.mongodb_jobs.mrq_jobs.count_documents({}) == 2
+
+    assert Job(job_ids[0]).wait(poll_interval=0.01, timeout=5)["result"] == 2
+
+    # Once finished, the same job can be queued again
+    job_id = queue_job("tests.tasks.general.Add", {"a": 1, "b": 1, "sleep": 1})
+    assert job_id != job_ids[0]
+    assert Job(job_id).wait(poll_interval=0.01, timeout=5)["result"] == 2
+
+    # Jobs can also be unique only for some calls
+    job_ids = queue_jobs("tests.tasks.general.Add", [{"a": 3}, {"a": 3}], unique=False)
+    assert job_ids[0] != job_ids[1]
@@ -0,0 +1,61 @@
+from mrq.job import Job, queue_job, queue_jobs, wait_many
+from mrq.context import connections
+from mrq.redishelpers import redis_key
+import pytest
+import time
+
+
+@pytest.mark.parametrize(["notify_ttl"], [[60], [0]])
+def test_wait(worker, notify_ttl):
+
+    worker.start(flags="--completion_notify_ttl %s" % notify_ttl)
+
+    from mrq.context import get_current_config
+    get_current_config()["completion_notify_ttl"] = notify_ttl
+
+    try:
+        job_id = queue_job("tests.tasks.general.Add", {"a": 41, "b": 1, "sleep": 1.5})
+
+        start_time = time.time()
+        assert Job(job_id).wait(timeout=10) == {"result": 42, "status": "success"}
+        total_time = time.time() - start_time
+
+        assert connections.redis.exists(redis_key("job_done", job_id)) == bool(notify_ttl)
+
+        if notify_ttl:
+            # No need to wait for the next MongoDB check
+            assert total_time < 2
+            assert connections.redis.ttl(redis_key("job_done", job_id)) <= 60
+
+        # Finished jobs are returned immediately
+        assert Job(job_id).wait(timeout=1)["result"] == 42
+
+        with pytest.raises(Exception):
+            Job(queue_job("tests.tasks.general.Add", {"a": 41, "b": 1}, queue="not_listened")).wait(timeout=1)
+
+    finally:
+        get_current_config()["completion_notify_ttl"] = 60
+
+
+def test_wait_many(worker):
+
+    worker.start(flags="--greenlets 3")
+
+    job_ids = queue_jobs("tests.tasks.general.Add", [
+        {"a": 3, "b": 0, "sleep": 3},
+        {"a": 1, "b": 0, "sleep": 1},
+        {"a": 2, "b": 0, "sleep": 2}
+    ])
+
+    start_time = time.time()
+    results = []
+    for job_id, job_data in wait_many(job_ids, timeout=10):
+        results.append((job_data["result"], round(time.time() - start_time)))
+        assert job_id == job_ids[job_data["result"] - 1]
+
+    # Results come as soon as each job finishes
+    assert [r[0] for r in results] == [1, 2, 3]
+    assert results[-1][1] <= 4
+
+    with pytest.raises(Exception):
+        list(wait_many([queue_job("tests.tasks.general.Add", {"a": 1, "b": 0}, queue="not_listened")], timeout=1))